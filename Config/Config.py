@@ -5,3 +5,85 @@ class Config:
     INPUT_PATH = 'Files/Futbol.csv'
     SQLITE_DB_PATH = 'Files/etl_data.db'
     SQLITE_TABLE = 'futbol_data_clean'
+    # Todos los modos mantienen las tablas resumen pre-agregadas (las lee el servicio):
+    # 'flat' / 'summary': reemplazan la tabla base y los resúmenes en una sola transacción;
+    # 'backfill': carga masiva en paralelo por shards (ver Loader.backfill_sqlite);
+    # 'chunked': una transacción por bloque, reanudable con `main.py --resume`
+    SQLITE_LOAD_MODE = 'flat'
+    SQLITE_LOAD_CHUNKSIZE = 100_000
+    # Backfill en paralelo: shards por década en bases de staging
+    BACKFILL_STAGING_DIR = 'Files/staging'
+    BACKFILL_WORKERS = None  # None = os.cpu_count()
+    BACKFILL_MAX_SHARDS = 8
+    # Backend de DataFrame para limpieza y agregaciones: 'pandas' o 'polars'
+    DATAFRAME_BACKEND = 'pandas'
+    # Limpieza: 'full' (todo el CSV en cada ejecución) o 'incremental' (solo las filas
+    # nuevas del CSV, que solo debe crecer por el final; ver futbolIncrementalClean)
+    CLEANING_MODE = 'full'
+    # Estadísticas de imputación e histórico limpio de la limpieza incremental
+    FILL_STATS_PATH = 'Files/fill_stats.json'
+    CLEAN_HISTORY_PATH = 'Files/clean_history.pkl'
+
+    # Checkpoints del pipeline (salidas de cada etapa + manifiesto) para `main.py --resume`
+    CHECKPOINT_DIR = 'Files/checkpoints'
+
+    # Agregados de las gráficas: 'exact' (DataFrame completo) o 'sketch' (aproximados, memoria fija)
+    AGGREGATION_MODE = 'exact'
+    SKETCH_PATH = 'Files/sketches.npz'
+    SKETCH_CHUNKSIZE = 100_000
+    SKETCH_WORKERS = None  # None = un solo proceso
+    SKETCH_WIDTH = 2048  # count-min: sobreestimación ≤ (e / width) · N
+    SKETCH_DEPTH = 5  # count-min: probabilidad de fallo e^-depth
+    SKETCH_TOP_K = 256  # candidatos frecuentes por count-min
+    SKETCH_HLL_PRECISION = 14  # HyperLogLog: error relativo ≈ 1.04 / sqrt(2^p)
+    SKETCH_COMPRESSION = 200  # t-digest
+
+    # Tablas de posiciones (puntos por victoria: entero o {año_inicio: puntos}, p. ej. {1872: 2, 1995: 3})
+    STANDINGS_TABLE = 'standings'
+    STANDINGS_POINTS_PER_WIN = 3
+    STANDINGS_POINTS_PER_DRAW = 1
+
+    # Modelo de predicción (Poisson / Dixon-Coles)
+    MODEL_PARAMS_PATH = 'Files/model_params.npz'
+    MODEL_RIDGE = 1.0
+    MODEL_HALF_LIFE_DAYS = 3650  # vida media del peso de cada partido (None = sin decaimiento)
+
+    # Servicio HTTP de estadísticas (solo lectura sobre SQLITE_DB_PATH)
+    SERVICE_HOST = '127.0.0.1'
+    SERVICE_PORT = 8050
+    SERVICE_POOL_SIZE = 4
+    SERVICE_CACHE_SIZE = 256
+    SERVICE_CACHE_TTL = 300  # segundos
+
+    # Gráficas: directorio de salida y perfiles de renderizado
+    GRAPHICS_OUTPUT_DIR = 'Graphics'
+    RENDER_PROFILE = 'production'
+    RENDER_PROFILES = {
+        # Calidad de publicación (comportamiento original)
+        'production': {
+            'dpi': 300,
+            'format': 'png',
+            'bbox_tight': True,
+            'show': True,
+            'data_only': False,
+            'data_format': 'json',
+        },
+        # Renderizado rápido y ligero para ejecuciones headless
+        'draft': {
+            'dpi': 72,
+            'format': 'png',
+            'bbox_tight': False,
+            'show': False,
+            'data_only': False,
+            'data_format': 'json',
+        },
+        # Solo exporta las series agregadas (JSON/CSV) para el frontend web
+        'data': {
+            'dpi': 72,
+            'format': 'png',
+            'bbox_tight': False,
+            'show': False,
+            'data_only': True,
+            'data_format': 'json',
+        },
+    }
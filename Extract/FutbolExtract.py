@@ -10,5 +10,16 @@ class futbolExtract:
         self.data = pd.read_csv(self.csv)
         self.data_info = self.data.info()
 
+    def iter_chunks(self, chunksize, skip_rows=0):
+        """
+        Lee el CSV por bloques de chunksize filas (para entradas que no caben en memoria)
+
+        Args:
+            chunksize (int): Filas por bloque
+            skip_rows (int): Filas de datos iniciales que se omiten (ya procesadas)
+        """
+        skiprows = range(1, skip_rows + 1) if skip_rows else None
+        yield from pd.read_csv(self.csv, chunksize=chunksize, skiprows=skiprows)
+
     def response(self):
         return self.data.head(15)
\ No newline at end of file
@@ -2,42 +2,366 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
+import json
+import os
+import sys
+import threading
+import time
 from datetime import datetime
+from Config.Config import Config
+from Transform.FutbolBackend import get_backend
+from Transform.FutbolHistogram import GoalHistograms
 import warnings
 warnings.filterwarnings('ignore')
 
+
+def _rss_bytes():
+    """
+    Memoria residente (RSS) actual del proceso en bytes. A diferencia de tracemalloc
+    incluye la memoria reservada fuera de Python (p. ej. el buffer de píxeles de Agg).
+    Usa psutil si está instalado; si no, /proc/self/statm o, como último recurso,
+    el pico de resource.getrusage
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _measure_peak_rss(run, interval=0.005):
+    """
+    Ejecuta run() muestreando el RSS en un hilo aparte
+
+    Returns:
+        tuple: (segundos, RSS antes de empezar, pico de RSS durante la ejecución) en bytes
+    """
+    baseline = _rss_bytes()
+    peak = [baseline]
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(interval):
+            peak[0] = max(peak[0], _rss_bytes())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    start = time.perf_counter()
+    try:
+        run()
+    finally:
+        elapsed = time.perf_counter() - start
+        done.set()
+        sampler.join()
+    return elapsed, baseline, max(peak[0], _rss_bytes())
+
+
 class FutbolGraphics:
-    def __init__(self, dataframe):
+    # Nombre de archivo (sin extensión) de cada gráfica
+    CHART_NAMES = {
+        'goals_distribution': 'distribucion_goles',
+        'temporal_analysis': 'analisis_temporal',
+        'top_teams_analysis': 'top_equipos',
+        'tournaments_analysis': 'analisis_torneos',
+        'countries_analysis': 'analisis_paises',
+        'summary_dashboard': 'dashboard_resumen',
+    }
+
+    def __init__(self, dataframe=None, render_profile=None, reuse_figures=False, sketches=None, **profile_overrides):
         """
         Inicializa la clase de gráficas con el DataFrame de datos de fútbol limpios
         
         Args:
-            dataframe (pd.DataFrame): DataFrame con los datos limpios de partidos de fútbol
+            dataframe (pd.DataFrame): DataFrame con los datos limpios de partidos de fútbol.
+                Puede omitirse si se indican sketches (memoria fija)
+            render_profile (str): Perfil de renderizado definido en Config.RENDER_PROFILES
+                ('production', 'draft' o 'data'). Por defecto Config.RENDER_PROFILE
+            reuse_figures (bool): Si es True, reutiliza las figuras entre gráficas en lugar
+                de crear una nueva cada vez (se liberan con close_figures())
+            sketches (FutbolSketches): Si se indica, todas las gráficas (distribución de goles,
+                análisis temporal, top de equipos, torneos, países y dashboard) se calculan
+                con los sketches, con sus cotas de error, sin recorrer el DataFrame
+            **profile_overrides: Valores que sobrescriben el perfil (dpi, format,
+                bbox_tight, show, data_only, data_format)
         """
-        self.data = dataframe.copy()
+        if dataframe is None and sketches is None:
+            raise ValueError("FutbolGraphics necesita un DataFrame o sketches")
+        self.data = dataframe.copy() if dataframe is not None else None
+        self.sketches = sketches
+        self._goal_histograms = None
+        self.reuse_figures = reuse_figures
+        self._figures = {}
+        self.set_render_profile(render_profile or Config.RENDER_PROFILE, **profile_overrides)
         
         # Configurar estilo de matplotlib
         plt.style.use('default')
         sns.set_palette("husl")
         
         # Crear directorio para guardar gráficas si no existe
-        import os
-        self.output_dir = "Graphics"
+        self.output_dir = Config.GRAPHICS_OUTPUT_DIR
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
             print(f"Directorio '{self.output_dir}' creado para guardar las gráficas")
     
+    def set_render_profile(self, profile_name, **overrides):
+        """
+        Selecciona el perfil de renderizado y aplica los valores sobrescritos
+        
+        Args:
+            profile_name (str): Nombre del perfil en Config.RENDER_PROFILES
+            **overrides: Valores que sobrescriben el perfil seleccionado
+        """
+        if profile_name not in Config.RENDER_PROFILES:
+            raise ValueError(f"Perfil de renderizado desconocido: '{profile_name}'. "
+                             f"Disponibles: {list(Config.RENDER_PROFILES)}")
+        
+        profile = dict(Config.RENDER_PROFILES[profile_name])
+        unknown = set(overrides) - set(profile)
+        if unknown:
+            raise ValueError(f"Opciones de perfil desconocidas: {sorted(unknown)}")
+        profile.update(overrides)
+        
+        if profile['format'] not in ('png', 'svg', 'webp'):
+            raise ValueError(f"Formato no soportado: '{profile['format']}' (png, svg o webp)")
+        if profile['data_format'] not in ('json', 'csv'):
+            raise ValueError(f"Formato de datos no soportado: '{profile['data_format']}' (json o csv)")
+        
+        self.profile_name = profile_name
+        self.profile = profile
+    
+    def _new_figure(self, key, nrows, ncols, figsize):
+        """
+        Crea la figura de una gráfica o reutiliza la anterior con la misma clave
+        
+        Returns:
+            tuple: (figura, matriz de ejes)
+        """
+        fig = self._figures.get(key) if self.reuse_figures else None
+        if fig is not None and plt.fignum_exists(fig.number):
+            fig.clf()
+            fig.set_size_inches(*figsize)
+            axes = fig.subplots(nrows, ncols)
+        else:
+            fig, axes = plt.subplots(nrows, ncols, figsize=figsize)
+            if self.reuse_figures:
+                self._figures[key] = fig
+        return fig, axes
+    
+    def _save_figure(self, fig, chart_name, bottom=0):
+        """
+        Guarda la figura según el perfil activo, la muestra si el perfil lo indica
+        y la cierra salvo que se esté reutilizando
+        
+        Args:
+            bottom (float): Fracción inferior de la figura reservada (nota de error)
+        
+        Returns:
+            str: Ruta del archivo generado
+        """
+        path = f"{self.output_dir}/{chart_name}.{self.profile['format']}"
+        fig.tight_layout(rect=(0, bottom, 1, 1))
+        fig.savefig(path, dpi=self.profile['dpi'], format=self.profile['format'],
+                    bbox_inches='tight' if self.profile['bbox_tight'] else None)
+        if self.profile['show']:
+            plt.show()
+        if not self.reuse_figures:
+            plt.close(fig)
+        return path
+    
+    def close_figures(self):
+        """
+        Cierra las figuras reutilizadas y libera su memoria
+        """
+        for fig in self._figures.values():
+            plt.close(fig)
+        self._figures.clear()
+    
+    @staticmethod
+    def to_serializable(value):
+        """
+        Convierte Series, DataFrames y escalares de numpy/pandas a tipos JSON
+        """
+        if isinstance(value, pd.DataFrame):
+            return {str(idx): {col: FutbolGraphics.to_serializable(v) for col, v in row.items()}
+                    for idx, row in value.to_dict(orient='index').items()}
+        if isinstance(value, pd.Series):
+            return {str(k): FutbolGraphics.to_serializable(v) for k, v in value.items()}
+        if isinstance(value, dict):
+            return {str(k): FutbolGraphics.to_serializable(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [FutbolGraphics.to_serializable(v) for v in value]
+        if isinstance(value, (np.integer, np.bool_)):
+            return value.item()
+        if isinstance(value, np.floating):
+            return None if np.isnan(value) else value.item()
+        if isinstance(value, (pd.Timestamp, datetime)):
+            return value.isoformat()
+        return value
+    
+    def export_chart_data(self, chart_name, data):
+        """
+        Escribe las series agregadas de una gráfica en JSON o CSV (modo "data-only")
+        
+        Args:
+            chart_name (str): Nombre base del archivo
+            data (dict): Series y valores agregados de la gráfica
+            
+        Returns:
+            str: Ruta del archivo generado
+        """
+        serializable = self.to_serializable(data)
+        path = f"{self.output_dir}/{chart_name}.{self.profile['data_format']}"
+        
+        if self.profile['data_format'] == 'json':
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(serializable, f, ensure_ascii=False, indent=2)
+        else:
+            # Formato largo: una fila por (serie, clave, campo, valor)
+            rows = []
+            for series, values in serializable.items():
+                if isinstance(values, dict):
+                    for key, value in values.items():
+                        if isinstance(value, dict):
+                            for field, v in value.items():
+                                rows.append((series, key, field, v))
+                        else:
+                            rows.append((series, key, '', value))
+                elif isinstance(values, list):
+                    for key, value in enumerate(values):
+                        rows.append((series, key, '', value))
+                else:
+                    rows.append((series, '', '', values))
+            pd.DataFrame(rows, columns=['series', 'key', 'field', 'value']).to_csv(path, index=False)
+        
+        return path
+    
+    @staticmethod
+    def compute_goals_by_period(data, period_column):
+        """
+        Promedios de goles por periodo (año, década, ...)
+        
+        Args:
+            data (pd.DataFrame): Partidos con la columna de periodo ya calculada
+            period_column (str): Columna por la que agrupar
+            
+        Returns:
+            pd.DataFrame: Partidos, promedio de goles locales, visitantes y total por periodo
+        """
+        return get_backend().goals_by_period(data, period_column)
+    
+    @staticmethod
+    def compute_goals_by_group(data, column):
+        """
+        Partidos y goles por valor de una columna categórica (torneo, país, ...)
+        
+        Args:
+            data (pd.DataFrame): Partidos
+            column (str): Columna por la que agrupar
+            
+        Returns:
+            pd.DataFrame: Partidos, goles totales y promedio de goles por partido
+        """
+        return get_backend().goals_by_group(data, column)
+    
+    @staticmethod
+    def compute_team_stats(data, teams):
+        """
+        Estadísticas de cada equipo: partidos, goles, victorias y diferencia de goles
+        
+        Args:
+            data (pd.DataFrame): Partidos
+            teams (iterable): Equipos a calcular
+            
+        Returns:
+            pd.DataFrame: Una fila por equipo
+        """
+        return get_backend().team_stats(data, teams)
+    
+    def get_goal_histograms(self):
+        """
+        Histogramas de goles y reparto de resultados (np.bincount), calculados una
+        sola vez y compartidos por la distribución de goles y el dashboard
+        
+        Returns:
+            GoalHistograms: Conteos por número de goles y por resultado
+        """
+        if self._goal_histograms is None:
+            self._goal_histograms = GoalHistograms.from_scores(self.data['home_score'], self.data['away_score'])
+        return self._goal_histograms
+    
+    def export_goal_histograms(self):
+        """
+        Guarda los conteos de goles y resultados en JSON junto a las gráficas
+        
+        Returns:
+            str: Ruta del archivo generado
+        """
+        path = f"{self.output_dir}/histogramas_goles.json"
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.get_goal_histograms().to_dict(), f, ensure_ascii=False, indent=2)
+        return path
+    
+    def get_goals_distribution_data(self):
+        """
+        Calcula las series agregadas de la gráfica de distribución de goles
+        
+        Returns:
+            dict: Frecuencias de goles locales, visitantes y totales, y promedios
+        """
+        if self.sketches is not None:
+            return self.sketches.goals_distribution_data()
+        histograms = self.get_goal_histograms()
+        return {
+            'home_goals': histograms.series('home'),
+            'away_goals': histograms.series('away'),
+            'total_goals': histograms.series('total'),
+            'averages': histograms.averages(),
+        }
+    
+    ERROR_NOTE_MARGIN = 0.06  # fracción inferior de la figura reservada para la nota de error
+
+    def _add_error_note(self, fig, stats):
+        """
+        Anota en la figura que los datos son aproximados (sketches) y su cota de error,
+        dentro del lienzo (se ve también sin bbox_tight)
+        
+        Returns:
+            float: Margen inferior reservado para la nota (0 si no hay nota), para _save_figure
+        """
+        if 'error_bounds' not in stats:
+            return 0
+        bounds = ', '.join(f'{name}: {value:.3g}' for name, value in stats['error_bounds'].items())
+        fig.subplots_adjust(bottom=self.ERROR_NOTE_MARGIN)
+        fig.text(0.5, 0.01, f'Valores aproximados (sketches). Cotas de error: {bounds}',
+                 ha='center', va='bottom', fontsize=7, style='italic', wrap=True)
+        return self.ERROR_NOTE_MARGIN
+    
     def goals_distribution(self):
         """
         Crea gráficas de distribución de goles
         """
         print("Generando gráficas de distribución de goles...")
         
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+        chart_name = self.CHART_NAMES['goals_distribution']
+        stats = self.get_goals_distribution_data()
+        if self.profile['data_only']:
+            path = self.export_chart_data(chart_name, stats)
+            print(f"✓ Datos guardados en {path}")
+            return
+        
+        fig, axes = self._new_figure('2x2', 2, 2, (15, 12))
         fig.suptitle('Análisis de Distribución de Goles', fontsize=16, fontweight='bold')
         
         # Gráfica 1: Distribución de goles locales
-        axes[0, 0].hist(self.data['home_score'], bins=range(0, max(self.data['home_score'])+2), 
+        home_goals = stats['home_goals']
+        axes[0, 0].bar(home_goals.index, home_goals.values, width=1.0, align='edge',
                        alpha=0.7, color='blue', edgecolor='black')
         axes[0, 0].set_title('Distribución de Goles de Equipos Locales')
         axes[0, 0].set_xlabel('Goles')
@@ -45,7 +369,8 @@ class FutbolGraphics:
         axes[0, 0].grid(True, alpha=0.3)
         
         # Gráfica 2: Distribución de goles visitantes
-        axes[0, 1].hist(self.data['away_score'], bins=range(0, max(self.data['away_score'])+2), 
+        away_goals = stats['away_goals']
+        axes[0, 1].bar(away_goals.index, away_goals.values, width=1.0, align='edge',
                        alpha=0.7, color='red', edgecolor='black')
         axes[0, 1].set_title('Distribución de Goles de Equipos Visitantes')
         axes[0, 1].set_xlabel('Goles')
@@ -53,8 +378,8 @@ class FutbolGraphics:
         axes[0, 1].grid(True, alpha=0.3)
         
         # Gráfica 3: Total de goles por partido
-        total_goals = self.data['home_score'] + self.data['away_score']
-        axes[1, 0].hist(total_goals, bins=range(0, max(total_goals)+2), 
+        total_goals = stats['total_goals']
+        axes[1, 0].bar(total_goals.index, total_goals.values, width=1.0, align='edge',
                        alpha=0.7, color='green', edgecolor='black')
         axes[1, 0].set_title('Distribución de Total de Goles por Partido')
         axes[1, 0].set_xlabel('Total de Goles')
@@ -62,8 +387,8 @@ class FutbolGraphics:
         axes[1, 0].grid(True, alpha=0.3)
         
         # Gráfica 4: Comparación de promedios
-        promedio_local = self.data['home_score'].mean()
-        promedio_visitante = self.data['away_score'].mean()
+        promedio_local = stats['averages']['home']
+        promedio_visitante = stats['averages']['away']
         
         axes[1, 1].bar(['Equipos Locales', 'Equipos Visitantes'], 
                       [promedio_local, promedio_visitante], 
@@ -76,11 +401,33 @@ class FutbolGraphics:
         for i, v in enumerate([promedio_local, promedio_visitante]):
             axes[1, 1].text(i, v + 0.05, f'{v:.2f}', ha='center', va='bottom', fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/distribucion_goles.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        note_margin = self._add_error_note(fig, stats)
+        path = self._save_figure(fig, chart_name, bottom=note_margin)
+        
+        print(f"✓ Gráfica guardada en {path}")
+    
+    def get_temporal_analysis_data(self):
+        """
+        Calcula las series agregadas del análisis temporal
+        
+        Returns:
+            dict: Partidos por década, promedios de goles por década y partidos
+                por año de los últimos 50 años
+        """
+        if self.sketches is not None:
+            return self.sketches.temporal_data()
+        # Preparar datos temporales
+        self.data['year'] = pd.to_datetime(self.data['date']).dt.year
+        self.data['decade'] = (self.data['year'] // 10) * 10
+        
+        goals_by_decade = self.compute_goals_by_period(self.data, 'decade')
         
-        print(f"✓ Gráfica guardada en {self.output_dir}/distribucion_goles.png")
+        recent_years = self.data[self.data['year'] >= (datetime.now().year - 50)]
+        return {
+            'matches_by_decade': self.data['decade'].value_counts().sort_index(),
+            'goals_by_decade': goals_by_decade,
+            'recent_matches_by_year': recent_years['year'].value_counts().sort_index(),
+        }
     
     def temporal_analysis(self):
         """
@@ -88,15 +435,18 @@ class FutbolGraphics:
         """
         print("Generando gráficas de análisis temporal...")
         
-        # Preparar datos temporales
-        self.data['year'] = pd.to_datetime(self.data['date']).dt.year
-        self.data['decade'] = (self.data['year'] // 10) * 10
+        chart_name = self.CHART_NAMES['temporal_analysis']
+        stats = self.get_temporal_analysis_data()
+        if self.profile['data_only']:
+            path = self.export_chart_data(chart_name, stats)
+            print(f"✓ Datos guardados en {path}")
+            return
         
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        fig, axes = self._new_figure('2x2', 2, 2, (16, 12))
         fig.suptitle('Análisis Temporal del Fútbol', fontsize=16, fontweight='bold')
         
         # Gráfica 1: Partidos por década
-        decade_counts = self.data['decade'].value_counts().sort_index()
+        decade_counts = stats['matches_by_decade']
         axes[0, 0].plot(decade_counts.index, decade_counts.values, marker='o', linewidth=2, markersize=6)
         axes[0, 0].set_title('Número de Partidos por Década')
         axes[0, 0].set_xlabel('Década')
@@ -104,11 +454,7 @@ class FutbolGraphics:
         axes[0, 0].grid(True, alpha=0.3)
         
         # Gráfica 2: Evolución de goles promedio por década
-        goals_by_decade = self.data.groupby('decade').agg({
-            'home_score': 'mean',
-            'away_score': 'mean'
-        })
-        goals_by_decade['total_avg'] = goals_by_decade['home_score'] + goals_by_decade['away_score']
+        goals_by_decade = stats['goals_by_decade']
         
         axes[0, 1].plot(goals_by_decade.index, goals_by_decade['total_avg'], 
                        marker='s', color='purple', linewidth=2, markersize=6)
@@ -129,9 +475,8 @@ class FutbolGraphics:
         axes[1, 0].grid(True, alpha=0.3)
         
         # Gráfica 4: Distribución de partidos por años recientes (últimos 50 años)
-        recent_years = self.data[self.data['year'] >= (datetime.now().year - 50)]
-        if not recent_years.empty:
-            year_counts = recent_years['year'].value_counts().sort_index()
+        year_counts = stats['recent_matches_by_year']
+        if not year_counts.empty:
             axes[1, 1].plot(year_counts.index, year_counts.values, alpha=0.7, color='orange')
             axes[1, 1].fill_between(year_counts.index, year_counts.values, alpha=0.3, color='orange')
             axes[1, 1].set_title('Partidos por Año (Últimos 50 años)')
@@ -139,66 +484,66 @@ class FutbolGraphics:
             axes[1, 1].set_ylabel('Número de Partidos')
             axes[1, 1].grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/analisis_temporal.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        path = self._save_figure(fig, chart_name)
         
-        print(f"✓ Gráfica guardada en {self.output_dir}/analisis_temporal.png")
+        print(f"✓ Gráfica guardada en {path}")
     
-    def top_teams_analysis(self):
+    def get_top_teams_data(self):
         """
-        Analiza y grafica los equipos más exitosos
-        """
-        print("Generando análisis de equipos más exitosos...")
-        
-        # Calcular estadísticas por equipo
-        teams_stats = {}
+        Calcula las estadísticas por equipo usadas en el análisis de equipos
         
+        Returns:
+            dict: DataFrame de estadísticas por equipo (mínimo 10 partidos) y
+                los rankings top 15 de cada gráfica
+        """
+        if self.sketches is not None:
+            return self.sketches.top_teams_data()
         # Obtener todos los equipos únicos
         all_teams = set(self.data['home_team'].unique()) | set(self.data['away_team'].unique())
         all_teams.discard('Unknown Team')  # Remover equipos desconocidos si existen
         
-        for team in all_teams:
-            home_games = self.data[self.data['home_team'] == team]
-            away_games = self.data[self.data['away_team'] == team]
-            
-            # Estadísticas básicas
-            total_games = len(home_games) + len(away_games)
-            goals_scored = home_games['home_score'].sum() + away_games['away_score'].sum()
-            goals_conceded = home_games['away_score'].sum() + away_games['home_score'].sum()
-            
-            # Victorias
-            home_wins = len(home_games[home_games['home_score'] > home_games['away_score']])
-            away_wins = len(away_games[away_games['away_score'] > away_games['home_score']])
-            total_wins = home_wins + away_wins
-            
-            teams_stats[team] = {
-                'games': total_games,
-                'goals_scored': goals_scored,
-                'goals_conceded': goals_conceded,
-                'wins': total_wins,
-                'win_rate': total_wins / total_games if total_games > 0 else 0,
-                'goal_difference': goals_scored - goals_conceded
-            }
-        
-        # Convertir a DataFrame para facilitar el análisis
-        teams_df = pd.DataFrame.from_dict(teams_stats, orient='index')
+        # Calcular estadísticas por equipo
+        teams_df = self.compute_team_stats(self.data, all_teams)
         teams_df = teams_df[teams_df['games'] >= 10]  # Solo equipos con al menos 10 partidos
         
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        # Tasa de victorias solo para equipos con al menos 20 partidos
+        teams_min_games = teams_df[teams_df['games'] >= 20]
+        return {
+            'teams': teams_df,
+            'top_games': teams_df.nlargest(15, 'games')['games'],
+            'top_goal_difference': teams_df.nlargest(15, 'goal_difference')['goal_difference'],
+            'top_win_rate': teams_min_games.nlargest(15, 'win_rate')['win_rate'],
+            'top_goals_scored': teams_df.nlargest(15, 'goals_scored')['goals_scored'],
+        }
+    
+    def top_teams_analysis(self):
+        """
+        Analiza y grafica los equipos más exitosos
+        """
+        print("Generando análisis de equipos más exitosos...")
+        
+        chart_name = self.CHART_NAMES['top_teams_analysis']
+        stats = self.get_top_teams_data()
+        if self.profile['data_only']:
+            stats.pop('teams')
+            path = self.export_chart_data(chart_name, stats)
+            print(f"✓ Datos guardados en {path}")
+            return
+        
+        fig, axes = self._new_figure('2x2', 2, 2, (16, 12))
         fig.suptitle('Análisis de Equipos Más Exitosos', fontsize=16, fontweight='bold')
         
         # Top 15 equipos por número de partidos
-        top_games = teams_df.nlargest(15, 'games')
-        axes[0, 0].barh(range(len(top_games)), top_games['games'], color='skyblue')
+        top_games = stats['top_games']
+        axes[0, 0].barh(range(len(top_games)), top_games.values, color='skyblue')
         axes[0, 0].set_yticks(range(len(top_games)))
         axes[0, 0].set_yticklabels(top_games.index, fontsize=8)
         axes[0, 0].set_title('Top 15 Equipos por Número de Partidos')
         axes[0, 0].set_xlabel('Número de Partidos')
         
         # Top 15 equipos por diferencia de goles
-        top_goal_diff = teams_df.nlargest(15, 'goal_difference')
-        bars = axes[0, 1].barh(range(len(top_goal_diff)), top_goal_diff['goal_difference'], 
+        top_goal_diff = stats['top_goal_difference']
+        bars = axes[0, 1].barh(range(len(top_goal_diff)), top_goal_diff.values, 
                               color='lightgreen')
         axes[0, 1].set_yticks(range(len(top_goal_diff)))
         axes[0, 1].set_yticklabels(top_goal_diff.index, fontsize=8)
@@ -206,10 +551,9 @@ class FutbolGraphics:
         axes[0, 1].set_xlabel('Diferencia de Goles')
         
         # Top 15 equipos por tasa de victorias (mínimo 20 partidos)
-        teams_min_games = teams_df[teams_df['games'] >= 20]
-        if not teams_min_games.empty:
-            top_win_rate = teams_min_games.nlargest(15, 'win_rate')
-            axes[1, 0].barh(range(len(top_win_rate)), top_win_rate['win_rate'] * 100, 
+        top_win_rate = stats['top_win_rate']
+        if not top_win_rate.empty:
+            axes[1, 0].barh(range(len(top_win_rate)), top_win_rate.values * 100, 
                            color='gold')
             axes[1, 0].set_yticks(range(len(top_win_rate)))
             axes[1, 0].set_yticklabels(top_win_rate.index, fontsize=8)
@@ -217,18 +561,51 @@ class FutbolGraphics:
             axes[1, 0].set_xlabel('Tasa de Victorias (%)')
         
         # Top 15 equipos por goles anotados
-        top_goals = teams_df.nlargest(15, 'goals_scored')
-        axes[1, 1].barh(range(len(top_goals)), top_goals['goals_scored'], color='salmon')
+        top_goals = stats['top_goals_scored']
+        axes[1, 1].barh(range(len(top_goals)), top_goals.values, color='salmon')
         axes[1, 1].set_yticks(range(len(top_goals)))
         axes[1, 1].set_yticklabels(top_goals.index, fontsize=8)
         axes[1, 1].set_title('Top 15 Equipos por Goles Anotados')
         axes[1, 1].set_xlabel('Goles Anotados')
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/top_equipos.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        note_margin = self._add_error_note(fig, stats)
+        path = self._save_figure(fig, chart_name, bottom=note_margin)
         
-        print(f"✓ Gráfica guardada en {self.output_dir}/top_equipos.png")
+        print(f"✓ Gráfica guardada en {path}")
+    
+    def get_tournaments_data(self):
+        """
+        Calcula las series agregadas del análisis de torneos
+        
+        Returns:
+            dict: Partidos y promedio de goles por torneo, reparto top 10 y
+                partidos por año de los 5 torneos principales
+        """
+        if self.sketches is not None:
+            return self.sketches.tournaments_data()
+        # Análisis de torneos
+        tournament_stats = self.data['tournament'].value_counts()
+        tournament_goals = self.compute_goals_by_group(self.data, 'tournament')
+        
+        # Reparto de partidos: top 10 + otros
+        pie_share = tournament_stats.head(10).copy()
+        pie_share['Otros'] = tournament_stats.iloc[10:].sum()
+        
+        # Evolución temporal de los principales torneos
+        main_tournaments = tournament_stats.head(5).index
+        tournament_temporal = self.data[self.data['tournament'].isin(main_tournaments)].copy()
+        tournament_temporal['year'] = pd.to_datetime(tournament_temporal['date']).dt.year
+        yearly_by_tournament = {}
+        for tournament in main_tournaments:
+            tournament_data = tournament_temporal[tournament_temporal['tournament'] == tournament]
+            yearly_by_tournament[tournament] = tournament_data['year'].value_counts().sort_index()
+        
+        return {
+            'top_matches': tournament_stats.head(15),
+            'match_share': pie_share,
+            'top_avg_goals': tournament_goals['avg_goals_per_match'].sort_values(ascending=False).head(15),
+            'yearly_matches': yearly_by_tournament,
+        }
     
     def tournaments_analysis(self):
         """
@@ -236,20 +613,18 @@ class FutbolGraphics:
         """
         print("Generando análisis de torneos...")
         
-        # Análisis de torneos
-        tournament_stats = self.data['tournament'].value_counts()
-        tournament_goals = self.data.groupby('tournament').agg({
-            'home_score': 'sum',
-            'away_score': 'sum'
-        })
-        tournament_goals['total_goals'] = tournament_goals['home_score'] + tournament_goals['away_score']
-        tournament_goals['avg_goals_per_match'] = tournament_goals['total_goals'] / tournament_stats
-        
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        chart_name = self.CHART_NAMES['tournaments_analysis']
+        stats = self.get_tournaments_data()
+        if self.profile['data_only']:
+            path = self.export_chart_data(chart_name, stats)
+            print(f"✓ Datos guardados en {path}")
+            return
+        
+        fig, axes = self._new_figure('2x2', 2, 2, (16, 12))
         fig.suptitle('Análisis de Torneos y Competiciones', fontsize=16, fontweight='bold')
         
         # Top 15 torneos por número de partidos
-        top_tournaments = tournament_stats.head(15)
+        top_tournaments = stats['top_matches']
         axes[0, 0].barh(range(len(top_tournaments)), top_tournaments.values, color='lightblue')
         axes[0, 0].set_yticks(range(len(top_tournaments)))
         axes[0, 0].set_yticklabels(top_tournaments.index, fontsize=8)
@@ -257,17 +632,12 @@ class FutbolGraphics:
         axes[0, 0].set_xlabel('Número de Partidos')
         
         # Gráfica circular de torneos principales (top 10)
-        top_10_tournaments = tournament_stats.head(10)
-        others_sum = tournament_stats.iloc[10:].sum()
-        
-        pie_data = list(top_10_tournaments.values) + [others_sum]
-        pie_labels = list(top_10_tournaments.index) + ['Otros']
-        
-        axes[0, 1].pie(pie_data, labels=pie_labels, autopct='%1.1f%%', startangle=90)
+        pie_share = stats['match_share']
+        axes[0, 1].pie(pie_share.values, labels=pie_share.index, autopct='%1.1f%%', startangle=90)
         axes[0, 1].set_title('Distribución de Partidos por Torneo (Top 10)')
         
         # Promedio de goles por torneo (top 15)
-        top_goals_tournaments = tournament_goals['avg_goals_per_match'].sort_values(ascending=False).head(15)
+        top_goals_tournaments = stats['top_avg_goals']
         axes[1, 0].barh(range(len(top_goals_tournaments)), top_goals_tournaments.values, color='orange')
         axes[1, 0].set_yticks(range(len(top_goals_tournaments)))
         axes[1, 0].set_yticklabels(top_goals_tournaments.index, fontsize=8)
@@ -275,13 +645,7 @@ class FutbolGraphics:
         axes[1, 0].set_xlabel('Promedio de Goles por Partido')
         
         # Evolución temporal de los principales torneos
-        main_tournaments = tournament_stats.head(5).index
-        tournament_temporal = self.data[self.data['tournament'].isin(main_tournaments)]
-        tournament_temporal['year'] = pd.to_datetime(tournament_temporal['date']).dt.year
-        
-        for tournament in main_tournaments:
-            tournament_data = tournament_temporal[tournament_temporal['tournament'] == tournament]
-            yearly_counts = tournament_data['year'].value_counts().sort_index()
+        for tournament, yearly_counts in stats['yearly_matches'].items():
             if len(yearly_counts) > 1:  # Solo si hay datos de múltiples años
                 axes[1, 1].plot(yearly_counts.index, yearly_counts.values, 
                                marker='o', label=tournament, alpha=0.7, linewidth=2)
@@ -292,11 +656,39 @@ class FutbolGraphics:
         axes[1, 1].legend(fontsize=8)
         axes[1, 1].grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/analisis_torneos.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        note_margin = self._add_error_note(fig, stats)
+        path = self._save_figure(fig, chart_name, bottom=note_margin)
         
-        print(f"✓ Gráfica guardada en {self.output_dir}/analisis_torneos.png")
+        print(f"✓ Gráfica guardada en {path}")
+    
+    def get_countries_data(self):
+        """
+        Calcula las series agregadas del análisis por países
+        
+        Returns:
+            dict: Partidos por país, reparto top 12, promedio de goles (≥50 partidos)
+                y porcentaje de partidos en campo neutral (≥20 partidos)
+        """
+        if self.sketches is not None:
+            return self.sketches.countries_data()
+        # Estadísticas por país
+        country_stats = self.data['country'].value_counts()
+        country_goals = self.compute_goals_by_group(self.data, 'country')
+        
+        # Reparto de partidos: top 12 + otros
+        pie_share = country_stats.head(12).copy()
+        pie_share['Otros'] = country_stats.iloc[12:].sum()
+        
+        # Análisis de partidos neutrales
+        neutral_analysis = self.data.groupby('country')['neutral'].agg(['sum', 'count'])
+        neutral_analysis['neutral_percentage'] = (neutral_analysis['sum'] / neutral_analysis['count']) * 100
+        
+        return {
+            'top_matches': country_stats.head(20),
+            'match_share': pie_share,
+            'top_avg_goals': country_goals[country_stats >= 50]['avg_goals_per_match'].sort_values(ascending=False).head(15),
+            'top_neutral_percentage': neutral_analysis[neutral_analysis['count'] >= 20]['neutral_percentage'].sort_values(ascending=False).head(15),
+        }
     
     def countries_analysis(self):
         """
@@ -304,20 +696,18 @@ class FutbolGraphics:
         """
         print("Generando análisis de países...")
         
-        # Estadísticas por país
-        country_stats = self.data['country'].value_counts()
-        country_goals = self.data.groupby('country').agg({
-            'home_score': 'sum',
-            'away_score': 'sum'
-        })
-        country_goals['total_goals'] = country_goals['home_score'] + country_goals['away_score']
-        country_goals['avg_goals_per_match'] = country_goals['total_goals'] / country_stats
-        
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        chart_name = self.CHART_NAMES['countries_analysis']
+        stats = self.get_countries_data()
+        if self.profile['data_only']:
+            path = self.export_chart_data(chart_name, stats)
+            print(f"✓ Datos guardados en {path}")
+            return
+        
+        fig, axes = self._new_figure('2x2', 2, 2, (16, 12))
         fig.suptitle('Análisis por Países', fontsize=16, fontweight='bold')
         
         # Top 20 países por número de partidos
-        top_countries = country_stats.head(20)
+        top_countries = stats['top_matches']
         axes[0, 0].barh(range(len(top_countries)), top_countries.values, color='mediumseagreen')
         axes[0, 0].set_yticks(range(len(top_countries)))
         axes[0, 0].set_yticklabels(top_countries.index, fontsize=8)
@@ -325,19 +715,14 @@ class FutbolGraphics:
         axes[0, 0].set_xlabel('Número de Partidos')
         
         # Gráfica circular de países principales (top 12)
-        top_12_countries = country_stats.head(12)
-        others_sum = country_stats.iloc[12:].sum()
-        
-        pie_data = list(top_12_countries.values) + [others_sum]
-        pie_labels = list(top_12_countries.index) + ['Otros']
-        
-        colors = plt.cm.Set3(np.linspace(0, 1, len(pie_data)))
-        axes[0, 1].pie(pie_data, labels=pie_labels, autopct='%1.1f%%', 
+        pie_share = stats['match_share']
+        colors = plt.cm.Set3(np.linspace(0, 1, len(pie_share)))
+        axes[0, 1].pie(pie_share.values, labels=pie_share.index, autopct='%1.1f%%', 
                       startangle=90, colors=colors)
         axes[0, 1].set_title('Distribución de Partidos por País (Top 12)')
         
         # Promedio de goles por país (países con al menos 50 partidos)
-        countries_min_games = country_goals[country_stats >= 50]['avg_goals_per_match'].sort_values(ascending=False).head(15)
+        countries_min_games = stats['top_avg_goals']
         if not countries_min_games.empty:
             axes[1, 0].barh(range(len(countries_min_games)), countries_min_games.values, color='coral')
             axes[1, 0].set_yticks(range(len(countries_min_games)))
@@ -346,10 +731,7 @@ class FutbolGraphics:
             axes[1, 0].set_xlabel('Promedio de Goles por Partido')
         
         # Análisis de partidos neutrales
-        neutral_analysis = self.data.groupby('country')['neutral'].agg(['sum', 'count'])
-        neutral_analysis['neutral_percentage'] = (neutral_analysis['sum'] / neutral_analysis['count']) * 100
-        neutral_top = neutral_analysis[neutral_analysis['count'] >= 20]['neutral_percentage'].sort_values(ascending=False).head(15)
-        
+        neutral_top = stats['top_neutral_percentage']
         if not neutral_top.empty:
             axes[1, 1].barh(range(len(neutral_top)), neutral_top.values, color='plum')
             axes[1, 1].set_yticks(range(len(neutral_top)))
@@ -357,11 +739,49 @@ class FutbolGraphics:
             axes[1, 1].set_title('Top 15 Países por % Partidos en Campo Neutral (≥20 partidos)')
             axes[1, 1].set_xlabel('Porcentaje de Partidos en Campo Neutral')
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/analisis_paises.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        note_margin = self._add_error_note(fig, stats)
+        path = self._save_figure(fig, chart_name, bottom=note_margin)
+        
+        print(f"✓ Gráfica guardada en {path}")
+    
+    def get_summary_dashboard_data(self):
+        """
+        Calcula las estadísticas y series agregadas del dashboard resumen
+        
+        Returns:
+            dict: Estadísticas generales y series de cada panel del dashboard
+        """
+        if self.sketches is not None:
+            return self.sketches.dashboard_data()
+        # Estadísticas generales
+        histograms = self.get_goal_histograms()
+        total_matches = len(self.data)
+        total_goals = histograms.total_goals()
+        
+        goals_hist = histograms.series('total', below=16)
         
-        print(f"✓ Gráfica guardada en {self.output_dir}/analisis_paises.png")
+        self.data['decade'] = (pd.to_datetime(self.data['date']).dt.year // 10) * 10
+        
+        # Análisis de resultados (victorias locales, empates, victorias visitantes)
+        results = histograms.result_counts()
+        
+        return {
+            'general': {
+                'total_matches': total_matches,
+                'total_goals': total_goals,
+                'avg_goals_per_match': total_goals / total_matches,
+                'first_year': self.data['date'].min().strftime('%Y'),
+                'last_year': self.data['date'].max().strftime('%Y'),
+            },
+            'total_goals_hist': goals_hist,
+            'averages': histograms.averages(),
+            'top_teams': pd.concat([self.data['home_team'], self.data['away_team']]).value_counts().head(10),
+            'top_tournaments': self.data['tournament'].value_counts().head(10),
+            'top_countries': self.data['country'].value_counts().head(10),
+            'matches_by_decade': self.data['decade'].value_counts().sort_index(),
+            'results': {name: results[name] for name in ['home_wins', 'draws', 'away_wins']},
+            'neutral': self.data['neutral'].value_counts(),
+        }
     
     def summary_dashboard(self):
         """
@@ -369,14 +789,22 @@ class FutbolGraphics:
         """
         print("Generando dashboard resumen...")
         
-        fig, axes = plt.subplots(3, 3, figsize=(18, 15))
+        chart_name = self.CHART_NAMES['summary_dashboard']
+        stats = self.get_summary_dashboard_data()
+        if self.profile['data_only']:
+            path = self.export_chart_data(chart_name, stats)
+            print(f"✓ Datos guardados en {path}")
+            return
+        
+        fig, axes = self._new_figure('3x3', 3, 3, (18, 15))
         fig.suptitle('Dashboard Resumen - Análisis Completo del Fútbol', fontsize=20, fontweight='bold')
         
         # Estadísticas generales
-        total_matches = len(self.data)
-        total_goals = self.data['home_score'].sum() + self.data['away_score'].sum()
-        avg_goals_per_match = total_goals / total_matches
-        date_range = f"{self.data['date'].min().strftime('%Y')} - {self.data['date'].max().strftime('%Y')}"
+        general = stats['general']
+        total_matches = general['total_matches']
+        total_goals = general['total_goals']
+        avg_goals_per_match = general['avg_goals_per_match']
+        date_range = f"{general['first_year']} - {general['last_year']}"
         
         # 1. Información general (texto)
         axes[0, 0].text(0.5, 0.8, f'Total de Partidos: {total_matches:,}', 
@@ -395,15 +823,16 @@ class FutbolGraphics:
         axes[0, 0].axis('off')
         
         # 2. Distribución de goles totales
-        total_goals_per_match = self.data['home_score'] + self.data['away_score']
-        axes[0, 1].hist(total_goals_per_match, bins=range(0, 16), alpha=0.7, color='skyblue', edgecolor='black')
+        goals_hist = stats['total_goals_hist']
+        axes[0, 1].bar(goals_hist.index, goals_hist.values, width=1.0, align='edge',
+                       alpha=0.7, color='skyblue', edgecolor='black')
         axes[0, 1].set_title('Distribución de Goles por Partido')
         axes[0, 1].set_xlabel('Goles Totales')
         axes[0, 1].set_ylabel('Frecuencia')
         
         # 3. Ventaja de local vs visitante
-        home_avg = self.data['home_score'].mean()
-        away_avg = self.data['away_score'].mean()
+        home_avg = stats['averages']['home']
+        away_avg = stats['averages']['away']
         axes[0, 2].bar(['Local', 'Visitante'], [home_avg, away_avg], color=['blue', 'red'], alpha=0.7)
         axes[0, 2].set_title('Promedio de Goles: Local vs Visitante')
         axes[0, 2].set_ylabel('Promedio de Goles')
@@ -411,7 +840,7 @@ class FutbolGraphics:
             axes[0, 2].text(i, v + 0.05, f'{v:.2f}', ha='center', va='bottom', fontweight='bold')
         
         # 4. Top 10 equipos por partidos
-        team_counts = pd.concat([self.data['home_team'], self.data['away_team']]).value_counts().head(10)
+        team_counts = stats['top_teams']
         axes[1, 0].barh(range(len(team_counts)), team_counts.values, color='lightgreen')
         axes[1, 0].set_yticks(range(len(team_counts)))
         axes[1, 0].set_yticklabels([team[:15] + '...' if len(team) > 15 else team for team in team_counts.index], fontsize=8)
@@ -419,13 +848,13 @@ class FutbolGraphics:
         axes[1, 0].set_xlabel('Número de Partidos')
         
         # 5. Top 10 torneos
-        tournament_counts = self.data['tournament'].value_counts().head(10)
+        tournament_counts = stats['top_tournaments']
         axes[1, 1].pie(tournament_counts.values, labels=[t[:10] + '...' if len(t) > 10 else t for t in tournament_counts.index], 
                       autopct='%1.1f%%', startangle=90)
         axes[1, 1].set_title('Top 10 Torneos')
         
         # 6. Top 10 países
-        country_counts = self.data['country'].value_counts().head(10)
+        country_counts = stats['top_countries']
         axes[1, 2].barh(range(len(country_counts)), country_counts.values, color='orange')
         axes[1, 2].set_yticks(range(len(country_counts)))
         axes[1, 2].set_yticklabels(country_counts.index, fontsize=8)
@@ -433,8 +862,7 @@ class FutbolGraphics:
         axes[1, 2].set_xlabel('Número de Partidos')
         
         # 7. Evolución temporal (por década)
-        self.data['decade'] = (pd.to_datetime(self.data['date']).dt.year // 10) * 10
-        decade_counts = self.data['decade'].value_counts().sort_index()
+        decade_counts = stats['matches_by_decade']
         axes[2, 0].plot(decade_counts.index, decade_counts.values, marker='o', linewidth=3, markersize=8, color='purple')
         axes[2, 0].fill_between(decade_counts.index, decade_counts.values, alpha=0.3, color='purple')
         axes[2, 0].set_title('Evolución del Fútbol por Década')
@@ -443,12 +871,9 @@ class FutbolGraphics:
         axes[2, 0].grid(True, alpha=0.3)
         
         # 8. Análisis de resultados (victorias locales, empates, victorias visitantes)
-        home_wins = len(self.data[self.data['home_score'] > self.data['away_score']])
-        draws = len(self.data[self.data['home_score'] == self.data['away_score']])
-        away_wins = len(self.data[self.data['home_score'] < self.data['away_score']])
-        
+        results = stats['results']
         result_labels = ['Victorias Locales', 'Empates', 'Victorias Visitantes']
-        result_values = [home_wins, draws, away_wins]
+        result_values = [results['home_wins'], results['draws'], results['away_wins']]
         colors = ['blue', 'yellow', 'red']
         
         axes[2, 1].pie(result_values, labels=result_labels, autopct='%1.1f%%', 
@@ -456,7 +881,7 @@ class FutbolGraphics:
         axes[2, 1].set_title('Distribución de Resultados')
         
         # 9. Partidos por tipo (neutral vs no neutral)
-        neutral_counts = self.data['neutral'].value_counts()
+        neutral_counts = stats['neutral']
         axes[2, 2].bar(neutral_counts.index.map({True: 'Campo Neutral', False: 'Campo Propio'}), 
                       neutral_counts.values, color=['gray', 'green'], alpha=0.7)
         axes[2, 2].set_title('Distribución por Tipo de Campo')
@@ -465,11 +890,50 @@ class FutbolGraphics:
             axes[2, 2].text(i, v + max(neutral_counts.values) * 0.01, f'{v:,}', 
                            ha='center', va='bottom', fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/dashboard_resumen.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        note_margin = self._add_error_note(fig, stats)
+        path = self._save_figure(fig, chart_name, bottom=note_margin)
         
-        print(f"✓ Dashboard guardado en {self.output_dir}/dashboard_resumen.png")
+        print(f"✓ Dashboard guardado en {path}")
+    
+    def benchmark_render_profiles(self, profiles=None, charts=None):
+        """
+        Mide el tiempo y el pico de memoria residente (RSS, incluye el buffer de Agg)
+        de cada gráfica con cada perfil de renderizado
+        
+        Args:
+            profiles (list): Perfiles a medir. Por defecto todos los de Config.RENDER_PROFILES
+            charts (list): Métodos de gráfica a medir. Por defecto las 3 gráficas principales
+            
+        Returns:
+            pd.DataFrame: Una fila por (perfil, gráfica) con segundos, pico de RSS del
+                proceso y su aumento respecto al inicio de la gráfica (MB), y tamaño del
+                archivo generado (KB)
+        """
+        profiles = profiles or list(Config.RENDER_PROFILES)
+        charts = charts or ['goals_distribution', 'temporal_analysis', 'top_teams_analysis']
+        previous_profile, previous_settings = self.profile_name, dict(self.profile)
+        
+        results = []
+        try:
+            for profile_name in profiles:
+                self.set_render_profile(profile_name, show=False)
+                for chart in charts:
+                    elapsed, baseline, peak = _measure_peak_rss(getattr(self, chart))
+                    
+                    extension = self.profile['data_format'] if self.profile['data_only'] else self.profile['format']
+                    path = f"{self.output_dir}/{self.CHART_NAMES[chart]}.{extension}"
+                    results.append({
+                        'profile': profile_name,
+                        'chart': chart,
+                        'seconds': round(elapsed, 4),
+                        'peak_rss_mb': round(peak / 1024 ** 2, 2),
+                        'rss_increase_mb': round((peak - baseline) / 1024 ** 2, 2),
+                        'file_kb': round(os.path.getsize(path) / 1024, 1) if os.path.exists(path) else None,
+                    })
+        finally:
+            self.profile_name, self.profile = previous_profile, previous_settings
+        
+        return pd.DataFrame(results)
     
     def generate_all_graphics(self):
         """
@@ -480,12 +944,17 @@ class FutbolGraphics:
         print("=" * 60)
         
         # Verificar que tenemos datos
-        if self.data.empty:
+        if self.sketches is not None:
+            general = self.sketches.dashboard_data()['general']
+            total_matches, date_range = general['total_matches'], (general['first_year'], general['last_year'])
+        else:
+            total_matches, date_range = len(self.data), (self.data['date'].min(), self.data['date'].max())
+        if total_matches == 0:
             print("❌ Error: No hay datos para generar gráficas")
             return
         
-        print(f"📊 Datos disponibles: {len(self.data):,} partidos")
-        print(f"📅 Rango de fechas: {self.data['date'].min()} a {self.data['date'].max()}")
+        print(f"📊 Datos disponibles: {total_matches:,} partidos" + (" (sketches)" if self.sketches is not None else ""))
+        print(f"📅 Rango de fechas: {date_range[0]} a {date_range[1]}")
         
         # Generar solo las 3 gráficas principales
         try:
@@ -501,16 +970,22 @@ class FutbolGraphics:
             self.top_teams_analysis()
             print()
             
+            if self.sketches is None:
+                print(f"✓ Conteos de goles y resultados guardados en {self.export_goal_histograms()}")
+                print()
+            
             print("=" * 60)
             print("✅ LAS 3 GRÁFICAS PRINCIPALES HAN SIDO GENERADAS EXITOSAMENTE")
+            extension = self.profile['data_format'] if self.profile['data_only'] else self.profile['format']
             print("📁 Gráficas generadas:")
-            print("   1. distribucion_goles.png - Análisis de patrones de goles")
-            print("   2. analisis_temporal.png - Evolución del fútbol en el tiempo")
-            print("   3. top_equipos.png - Equipos más exitosos")
+            print(f"   1. distribucion_goles.{extension} - Análisis de patrones de goles")
+            print(f"   2. analisis_temporal.{extension} - Evolución del fútbol en el tiempo")
+            print(f"   3. top_equipos.{extension} - Equipos más exitosos")
             print(f"📂 Ubicación: {self.output_dir}/")
             print("=" * 60)
             
         except Exception as e:
             print(f"❌ Error al generar las gráficas: {e}")
             import traceback
-            traceback.print_exc()
\ No newline at end of file
+            traceback.print_exc()
+            raise
\ No newline at end of file
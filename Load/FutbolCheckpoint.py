@@ -0,0 +1,155 @@
+"""
+Checkpoints del pipeline ETL.
+
+Cada etapa terminada guarda su salida (DataFrame en pickle: binario, rápido y sin
+perder tipos) en Config.CHECKPOINT_DIR y se registra en un manifiesto JSON. Con
+`python main.py --resume` las etapas completadas se omiten y la ejecución continúa
+en la primera etapa pendiente o fallida; la salida guardada de una etapa solo se
+lee del disco cuando una etapa pendiente la pide (output).
+
+El manifiesto guarda la huella del CSV de entrada (tamaño y fecha de modificación):
+si el CSV cambia, los checkpoints se descartan y el pipeline empieza de cero.
+"""
+import json
+import os
+import traceback
+from datetime import datetime
+import pandas as pd
+from Config.Config import Config
+
+
+class PipelineCheckpoint:
+    """
+    Manifiesto y salidas persistidas de las etapas del pipeline.
+    """
+    MANIFEST_NAME = 'manifest.json'
+
+    def __init__(self, checkpoint_dir=None, input_path=None):
+        """
+        Args:
+            checkpoint_dir (str): Directorio de checkpoints. Por defecto Config.CHECKPOINT_DIR
+            input_path (str): CSV de entrada cuya huella invalida los checkpoints. Por defecto Config.INPUT_PATH
+        """
+        self.checkpoint_dir = checkpoint_dir or Config.CHECKPOINT_DIR
+        self.input_path = input_path or Config.INPUT_PATH
+        self.manifest_path = os.path.join(self.checkpoint_dir, self.MANIFEST_NAME)
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        self.manifest = self._read_manifest()
+        self._outputs = {}
+
+    def _input_fingerprint(self):
+        if not os.path.exists(self.input_path):
+            return None
+        stat = os.stat(self.input_path)
+        return {'path': self.input_path, 'size': stat.st_size, 'mtime': stat.st_mtime}
+
+    def _empty_manifest(self):
+        return {'input': self._input_fingerprint(), 'stages': {}}
+
+    def _read_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return self._empty_manifest()
+        with open(self.manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('input') != self._input_fingerprint():
+            print("El archivo de entrada cambió desde el último checkpoint; se empieza de cero")
+            return self._empty_manifest()
+        return manifest
+
+    @staticmethod
+    def _atomic_write(path, write):
+        """
+        Escribe en un archivo temporal y lo renombra, para no dejar archivos a medias
+        """
+        tmp_path = f'{path}.tmp'
+        write(tmp_path)
+        os.replace(tmp_path, path)
+
+    def _write_manifest(self):
+        def write(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        self._atomic_write(self.manifest_path, write)
+
+    def _update_stage(self, stage, **fields):
+        self.manifest['stages'].setdefault(stage, {}).update(fields, updated_at=datetime.now().isoformat())
+        self._write_manifest()
+
+    def reset(self):
+        """
+        Descarta todos los checkpoints (ejecución completa desde el CSV)
+        """
+        for entry in self.manifest['stages'].values():
+            path = entry.get('path')
+            if path and os.path.exists(path):
+                os.remove(path)
+        self.manifest = self._empty_manifest()
+        self._outputs = {}
+        self._write_manifest()
+
+    def is_done(self, stage):
+        entry = self.manifest['stages'].get(stage, {})
+        return entry.get('status') == 'done' and (not entry.get('path') or os.path.exists(entry['path']))
+
+    def stage_info(self, stage):
+        return dict(self.manifest['stages'].get(stage, {}))
+
+    def save(self, stage, output=None, **fields):
+        """
+        Marca la etapa como completada y persiste su salida si es un DataFrame
+        """
+        path = None
+        if isinstance(output, pd.DataFrame):
+            path = os.path.join(self.checkpoint_dir, f'{stage}.pkl')
+            self._atomic_write(path, lambda tmp: output.to_pickle(tmp, compression=None))
+            fields['rows'] = len(output)
+        self._update_stage(stage, status='done', path=path, error=None, traceback=None, **fields)
+
+    def load(self, stage):
+        path = self.manifest['stages'][stage].get('path')
+        return pd.read_pickle(path, compression=None) if path else None
+
+    def output(self, stage):
+        """
+        Salida de una etapa: la de esta ejecución o, si la etapa se omitió al reanudar,
+        la de su checkpoint (se lee del disco la primera vez que se pide)
+        """
+        if stage not in self._outputs:
+            self._outputs[stage] = self.load(stage)
+        return self._outputs[stage]
+
+    def record_progress(self, stage, **fields):
+        """
+        Guarda progreso parcial de una etapa en curso (p. ej. filas confirmadas de una carga por bloques)
+        """
+        self._update_stage(stage, status='running', **fields)
+
+    def run_stage(self, stage, run, resume=False):
+        """
+        Ejecuta una etapa, o la omite si ya se completó (sin leer su checkpoint: las
+        etapas siguientes piden la salida con output() solo si se ejecutan)
+
+        Args:
+            stage (str): Nombre de la etapa
+            run (callable): Función sin argumentos que ejecuta la etapa y devuelve su salida
+            resume (bool): Omitir la etapa si ya se completó
+
+        Returns:
+            La salida de la etapa, o None si se omitió
+
+        Raises:
+            Exception: La excepción de la etapa, tras registrarla como fallida en el manifiesto
+        """
+        if resume and self.is_done(stage):
+            print(f"♻️  Etapa '{stage}' completada en una ejecución anterior; se omite")
+            return None
+        self._update_stage(stage, status='running', error=None)
+        try:
+            output = run()
+        except Exception as e:
+            self._update_stage(stage, status='failed', error=f'{type(e).__name__}: {e}',
+                               traceback=traceback.format_exc())
+            raise
+        self.save(stage, output)
+        self._outputs[stage] = output
+        return output
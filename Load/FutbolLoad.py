@@ -1,10 +1,89 @@
 from Config.Config import Config
+from Transform.FutbolBackend import team_perspective
+import argparse
+import hashlib
+import os
+import secrets
 import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+
+
+def _write_staging_shard(shard, staging_path, table_name):
+    """
+    Escribe un shard en su propia base de datos de staging (se ejecuta en un proceso aparte)
+
+    Returns:
+        tuple: (ruta del staging, filas escritas)
+    """
+    if os.path.exists(staging_path):
+        os.remove(staging_path)
+    conn = sqlite3.connect(staging_path)
+    # El staging es desechable: sin journal ni fsync
+    conn.execute('PRAGMA journal_mode = OFF')
+    conn.execute('PRAGMA synchronous = OFF')
+    shard.to_sql(table_name, conn, if_exists='replace', index=False)
+    conn.close()
+    return staging_path, len(shard)
+
 
 class Loader:
     """
     Clase para cargar los datos limpios a un destino.
     """
+    # Tablas resumen pre-agregadas: solo contienen sumas y conteos, de modo que
+    # cada lote se acumula con un UPSERT sin volver a leer la tabla base
+    SUMMARY_TABLES = {
+        'team_season_stats': '''
+            CREATE TABLE IF NOT EXISTS team_season_stats (
+                team TEXT NOT NULL,
+                year INTEGER NOT NULL,
+                games INTEGER NOT NULL,
+                wins INTEGER NOT NULL,
+                draws INTEGER NOT NULL,
+                losses INTEGER NOT NULL,
+                goals_for INTEGER NOT NULL,
+                goals_against INTEGER NOT NULL,
+                PRIMARY KEY (team, year)
+            )''',
+        'tournament_year_stats': '''
+            CREATE TABLE IF NOT EXISTS tournament_year_stats (
+                tournament TEXT NOT NULL,
+                year INTEGER NOT NULL,
+                matches INTEGER NOT NULL,
+                home_goals INTEGER NOT NULL,
+                away_goals INTEGER NOT NULL,
+                neutral_matches INTEGER NOT NULL,
+                PRIMARY KEY (tournament, year)
+            )''',
+        'country_stats': '''
+            CREATE TABLE IF NOT EXISTS country_stats (
+                country TEXT NOT NULL PRIMARY KEY,
+                matches INTEGER NOT NULL,
+                home_goals INTEGER NOT NULL,
+                away_goals INTEGER NOT NULL,
+                neutral_matches INTEGER NOT NULL
+            )''',
+        'result_distribution': '''
+            CREATE TABLE IF NOT EXISTS result_distribution (
+                result TEXT NOT NULL PRIMARY KEY,
+                matches INTEGER NOT NULL
+            )''',
+    }
+    SUMMARY_INDEXES = [
+        'CREATE INDEX IF NOT EXISTS idx_team_season_stats_year ON team_season_stats (year)',
+        'CREATE INDEX IF NOT EXISTS idx_tournament_year_stats_year ON tournament_year_stats (year)',
+        'CREATE INDEX IF NOT EXISTS idx_country_stats_matches ON country_stats (matches)',
+    ]
+
+    # Progreso de las cargas por bloques: filas confirmadas por tabla y huella de los
+    # datos cargados, escrito en la misma transacción que cada bloque
+    PROGRESS_TABLE = 'etl_load_progress'
+
+    # Columnas de la tabla base indexadas al terminar un backfill
+    BASE_INDEX_COLUMNS = ['date', 'home_team', 'away_team', 'tournament', 'country']
+
     def __init__(self, df):
         self.df = df
 
@@ -17,17 +96,405 @@ class Loader:
             print(f"Datos guardados en {output_path}")
         except Exception as e:
             print(f"Error al guardar datos: {e}")
+            raise
+
+    @staticmethod
+    def _mark_load_finished(conn):
+        """
+        Incrementa PRAGMA user_version al terminar una carga. Los lectores (p. ej. el
+        servicio de estadísticas) lo comparan para invalidar sus cachés.
+
+        La primera carga marca además la base con un identificador aleatorio
+        (PRAGMA application_id): una base recreada vuelve a empezar en la versión 1,
+        pero con otro identificador.
+        """
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        conn.execute(f'PRAGMA user_version = {version + 1}')
+        if conn.execute('PRAGMA application_id').fetchone()[0] == 0:
+            conn.execute(f'PRAGMA application_id = {secrets.randbelow(2 ** 31 - 1) + 1}')
 
     def to_sqlite(self, db_path=None, table_name=None):
         """
-        Guarda el DataFrame limpio en una base de datos SQLite.
+        Guarda el DataFrame limpio en una base de datos SQLite: reemplaza la tabla base
+        y reconstruye las tablas resumen en una sola transacción (ver to_sqlite_with_summaries).
+        """
+        self.to_sqlite_with_summaries(db_path, table_name, append=False)
+
+    def _summary_batches(self, df=None):
+        """
+        Agrega el lote actual (o un tramo del lote) al nivel de cada tabla resumen
+
+        Returns:
+            dict: Tabla resumen -> DataFrame con las filas a acumular
+        """
+        df = self.df if df is None else df
+        year = pd.to_datetime(df['date'], errors='coerce').dt.year.fillna(0).astype(int)
+        neutral = df['neutral'].fillna(False).astype(bool).astype(int)
+        home_goals = df['home_score'].astype(int)
+        away_goals = df['away_score'].astype(int)
+
+        # Vista larga: una fila por equipo y partido
+        perspective = team_perspective(
+            df.assign(home_score=home_goals, away_score=away_goals), {'year': year})
+        perspective['games'] = 1
+
+        matches = pd.DataFrame({
+            'tournament': df['tournament'], 'country': df['country'], 'year': year,
+            'matches': 1, 'home_goals': home_goals, 'away_goals': away_goals,
+            'neutral_matches': neutral,
+        })
+        sign = (home_goals - away_goals).clip(-1, 1)
+        results = sign.map({1: 'home_win', 0: 'draw', -1: 'away_win'}).value_counts()
+
+        return {
+            'team_season_stats': perspective.groupby(['team', 'year'], as_index=False)[
+                ['games', 'wins', 'draws', 'losses', 'goals_for', 'goals_against']].sum(),
+            'tournament_year_stats': matches.groupby(['tournament', 'year'], as_index=False)[
+                ['matches', 'home_goals', 'away_goals', 'neutral_matches']].sum(),
+            'country_stats': matches.groupby('country', as_index=False)[
+                ['matches', 'home_goals', 'away_goals', 'neutral_matches']].sum(),
+            'result_distribution': results.rename_axis('result').reset_index(name='matches'),
+        }
+
+    def _reset_summaries(self, conn):
+        """
+        Vacía las tablas resumen (las borra y las vuelve a crear con sus índices).
+        Toda carga que reemplaza la tabla base la llama para no dejar resúmenes obsoletos.
+        """
+        for table in self.SUMMARY_TABLES:
+            conn.execute(f'DROP TABLE IF EXISTS main.{table}')
+        for ddl in self.SUMMARY_TABLES.values():
+            conn.execute(ddl)
+        for ddl in self.SUMMARY_INDEXES:
+            conn.execute(ddl)
+
+    def _upsert_summaries(self, conn, df=None):
+        """
+        Acumula el lote (o un tramo del lote) en las tablas resumen (INSERT ... ON CONFLICT DO UPDATE)
+        """
+        keys = {
+            'team_season_stats': ['team', 'year'],
+            'tournament_year_stats': ['tournament', 'year'],
+            'country_stats': ['country'],
+            'result_distribution': ['result'],
+        }
+        for table, batch in self._summary_batches(df).items():
+            columns = list(batch.columns)
+            values = [c for c in columns if c not in keys[table]]
+            sql = (f"INSERT INTO {table} ({', '.join(columns)}) "
+                   f"VALUES ({', '.join('?' for _ in columns)}) "
+                   f"ON CONFLICT ({', '.join(keys[table])}) DO UPDATE SET "
+                   + ', '.join(f'{c} = {c} + excluded.{c}' for c in values))
+            conn.executemany(sql, batch.astype(object).itertuples(index=False, name=None))
+
+    def _base_rows(self, df=None):
+        """
+        Filas del lote (o de un tramo del lote) con los tipos que SQLite acepta (mismo formato que to_sql)
+        """
+        df = (self.df if df is None else df).copy()
+        for col in df.columns:
+            if pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = df[col].dt.strftime('%Y-%m-%d %H:%M:%S')
+            elif pd.api.types.is_bool_dtype(df[col]):
+                df[col] = df[col].astype(int)
+        df = df.astype(object).where(df.notna(), None)
+        return df.itertuples(index=False, name=None)
+
+    def to_sqlite_with_summaries(self, db_path=None, table_name=None, append=False):
+        """
+        Guarda el DataFrame en SQLite y mantiene las tablas resumen pre-agregadas
+        (team_season_stats, tournament_year_stats, country_stats, result_distribution).
+
+        La tabla base y los resúmenes se actualizan en la misma transacción, de modo
+        que las consultas de los dashboards leen tablas pequeñas sin recorrer la base.
+
+        Args:
+            db_path (str): Ruta de la base de datos. Por defecto Config.SQLITE_DB_PATH
+            table_name (str): Tabla base. Por defecto Config.SQLITE_TABLE
+            append (bool): Si es True añade el lote a la tabla y acumula los resúmenes;
+                si es False reemplaza la tabla base y reconstruye los resúmenes
         """
         db_path = db_path or Config.SQLITE_DB_PATH
         table_name = table_name or Config.SQLITE_TABLE
+        conn = None
         try:
-            conn = sqlite3.connect(db_path)
-            self.df.to_sql(table_name, conn, if_exists='replace', index=False)
+            conn = sqlite3.connect(db_path, isolation_level=None)
+            table_exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,)
+            ).fetchone() is not None
+
+            conn.execute('BEGIN')
+            if not append or not table_exists:
+                conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+                # Crear la tabla base con el mismo esquema que generaría to_sql
+                schema = pd.io.sql.get_schema(self.df, table_name)
+                conn.execute(schema)
+                self._reset_summaries(conn)
+            else:
+                for ddl in self.SUMMARY_TABLES.values():
+                    conn.execute(ddl)
+                for ddl in self.SUMMARY_INDEXES:
+                    conn.execute(ddl)
+
+            placeholders = ', '.join('?' for _ in self.df.columns)
+            conn.executemany(f'INSERT INTO "{table_name}" VALUES ({placeholders})', self._base_rows())
+            self._upsert_summaries(conn)
+            self._mark_load_finished(conn)
+            conn.execute('COMMIT')
+            print(f"Datos y tablas resumen guardados en la base de datos SQLite: {db_path}, tabla: {table_name}")
+        except Exception as e:
+            if conn is not None and conn.in_transaction:
+                conn.execute('ROLLBACK')
+            print(f"Error al guardar en SQLite: {e}")
+            raise
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def fingerprint(self):
+        """
+        Huella del DataFrame (valores de todas las filas y columnas): identifica los
+        datos de una carga por bloques para no reanudarla con otros datos
+        """
+        digest = hashlib.sha256(','.join(map(str, self.df.columns)).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(self.df, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    @classmethod
+    def committed_offset(cls, db_path=None, table_name=None):
+        """
+        Filas ya confirmadas por una carga por bloques (to_sqlite_chunked) sin terminar
+
+        Returns:
+            tuple: (filas confirmadas, filas totales, huella de los datos) o (0, None, None)
+                si no hay progreso
+        """
+        db_path = db_path or Config.SQLITE_DB_PATH
+        table_name = table_name or Config.SQLITE_TABLE
+        if not os.path.exists(db_path):
+            return 0, None
+        conn = sqlite3.connect(db_path)
+        try:
+            row = conn.execute(
+                f"SELECT committed_rows, total_rows, fingerprint FROM {cls.PROGRESS_TABLE} WHERE table_name = ?",
+                (table_name,)
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # Sin tabla de progreso, o de una versión sin huella (no se puede reanudar con seguridad)
+            row = None
+        finally:
             conn.close()
-            print(f"Datos guardados en la base de datos SQLite: {db_path}, tabla: {table_name}")
+        return row if row is not None else (0, None, None)
+
+    def to_sqlite_chunked(self, db_path=None, table_name=None, chunksize=None, resume=False, on_chunk=None):
+        """
+        Guarda el DataFrame en SQLite en bloques de chunksize filas, una transacción por
+        bloque. El número de filas confirmadas se escribe en PROGRESS_TABLE dentro de la
+        misma transacción, así que al reanudar solo se repite el bloque que no llegó a
+        confirmarse. Las tablas resumen se vacían al empezar y cada bloque se acumula
+        en ellas en su misma transacción.
+
+        Solo se reanuda si la carga guardada tiene el mismo número de filas y la misma
+        huella (fingerprint) que el DataFrame actual; si no, empieza desde la fila 0.
+
+        Args:
+            db_path (str): Ruta de la base de datos. Por defecto Config.SQLITE_DB_PATH
+            table_name (str): Tabla base. Por defecto Config.SQLITE_TABLE
+            chunksize (int): Filas por bloque. Por defecto Config.SQLITE_LOAD_CHUNKSIZE
+            resume (bool): Continuar desde el último bloque confirmado en lugar de reemplazar la tabla
+            on_chunk (callable): Se llama con las filas confirmadas tras cada bloque
+        """
+        db_path = db_path or Config.SQLITE_DB_PATH
+        table_name = table_name or Config.SQLITE_TABLE
+        chunksize = chunksize or Config.SQLITE_LOAD_CHUNKSIZE
+        total_rows = len(self.df)
+        conn = None
+        try:
+            fingerprint = self.fingerprint()
+            offset, previous_total, previous_fingerprint = (
+                self.committed_offset(db_path, table_name) if resume else (0, None, None))
+            if offset and previous_total != total_rows:
+                print(f"El progreso guardado corresponde a {previous_total} filas (ahora {total_rows}); se reinicia la carga")
+                offset = 0
+            elif offset and previous_fingerprint != fingerprint:
+                print("El progreso guardado corresponde a otros datos (la huella no coincide); se reinicia la carga")
+                offset = 0
+
+            conn = sqlite3.connect(db_path, isolation_level=None)
+            conn.execute(f'CREATE TABLE IF NOT EXISTS {self.PROGRESS_TABLE} ('
+                         'table_name TEXT NOT NULL PRIMARY KEY, '
+                         'committed_rows INTEGER NOT NULL, total_rows INTEGER NOT NULL, fingerprint TEXT)')
+            progress_columns = [row[1] for row in conn.execute(f'PRAGMA table_info({self.PROGRESS_TABLE})')]
+            if 'fingerprint' not in progress_columns:
+                conn.execute(f'ALTER TABLE {self.PROGRESS_TABLE} ADD COLUMN fingerprint TEXT')
+            progress_sql = (f'INSERT OR REPLACE INTO {self.PROGRESS_TABLE} '
+                            '(table_name, committed_rows, total_rows, fingerprint) VALUES (?, ?, ?, ?)')
+            if offset == 0:
+                conn.execute('BEGIN')
+                conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+                conn.execute(pd.io.sql.get_schema(self.df, table_name))
+                self._reset_summaries(conn)
+                conn.execute(progress_sql, (table_name, 0, total_rows, fingerprint))
+                conn.execute('COMMIT')
+            else:
+                print(f"Reanudando la carga de {table_name} desde la fila {offset} de {total_rows}")
+
+            placeholders = ', '.join('?' for _ in self.df.columns)
+            for start in range(offset, total_rows, chunksize):
+                end = min(start + chunksize, total_rows)
+                conn.execute('BEGIN')
+                chunk = self.df.iloc[start:end]
+                conn.executemany(f'INSERT INTO "{table_name}" VALUES ({placeholders})', self._base_rows(chunk))
+                self._upsert_summaries(conn, chunk)
+                conn.execute(progress_sql, (table_name, end, total_rows, fingerprint))
+                if end == total_rows:
+                    self._mark_load_finished(conn)
+                conn.execute('COMMIT')
+                if on_chunk is not None:
+                    on_chunk(end)
+            print(f"Datos guardados por bloques en la base de datos SQLite: {db_path}, tabla: {table_name}")
+        except Exception as e:
+            if conn is not None and conn.in_transaction:
+                conn.execute('ROLLBACK')
+            print(f"Error al guardar en SQLite: {e}")
+            raise
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _decade_shards(self, max_shards):
+        """
+        Divide el DataFrame por décadas, agrupando décadas contiguas para no superar
+        max_shards (SQLite limita el número de bases adjuntas con ATTACH)
+
+        Returns:
+            list: DataFrames, uno por shard, en orden cronológico
+        """
+        decade = (pd.to_datetime(self.df['date'], errors='coerce').dt.year // 10) * 10
+        sizes = decade.value_counts(dropna=False).sort_index(na_position='last')
+        target = len(self.df) / max_shards
+
+        groups, current, current_rows = [], [], 0
+        for key, rows in sizes.items():
+            if current and current_rows + rows > target and len(groups) < max_shards - 1:
+                groups.append(current)
+                current, current_rows = [], 0
+            current.append(key)
+            current_rows += rows
+        if current:
+            groups.append(current)
+
+        shards = []
+        for keys in groups:
+            mask = decade.isin([k for k in keys if pd.notna(k)])
+            if any(pd.isna(k) for k in keys):
+                mask |= decade.isna()
+            shards.append(self.df[mask])
+        return shards
+
+    def backfill_sqlite(self, db_path=None, table_name=None, workers=None, max_shards=None, staging_dir=None):
+        """
+        Carga masiva en paralelo: divide los datos por décadas, escribe cada shard en su
+        propia base de staging desde procesos independientes y los fusiona en la base
+        principal con ATTACH + INSERT ... SELECT en una sola transacción. Los índices
+        se crean una única vez al final y las tablas resumen se reconstruyen en la
+        misma transacción.
+
+        Las filas quedan en orden cronológico por shard (el orden del CSV original).
+
+        Args:
+            db_path (str): Base de datos destino. Por defecto Config.SQLITE_DB_PATH
+            table_name (str): Tabla destino (se reemplaza). Por defecto Config.SQLITE_TABLE
+            workers (int): Procesos de escritura. Por defecto Config.BACKFILL_WORKERS o os.cpu_count()
+            max_shards (int): Máximo de shards (≤ 10 por el límite de ATTACH de SQLite)
+            staging_dir (str): Directorio de staging. Por defecto Config.BACKFILL_STAGING_DIR
+        """
+        db_path = db_path or Config.SQLITE_DB_PATH
+        table_name = table_name or Config.SQLITE_TABLE
+        workers = workers or Config.BACKFILL_WORKERS or os.cpu_count()
+        max_shards = min(max_shards or Config.BACKFILL_MAX_SHARDS, 10)
+        staging_dir = staging_dir or Config.BACKFILL_STAGING_DIR
+        os.makedirs(staging_dir, exist_ok=True)
+
+        shards = self._decade_shards(max_shards)
+        staging_paths = [os.path.join(staging_dir, f'{table_name}_shard{i}.db') for i in range(len(shards))]
+        conn = None
+        try:
+            # 1. Escribir los shards en paralelo
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                written = list(executor.map(_write_staging_shard, shards, staging_paths,
+                                            [table_name] * len(shards)))
+            print(f"Escritos {len(written)} shards de staging ({sum(r for _, r in written)} filas)")
+
+            # 2. Fusionar en la base principal (ATTACH no se permite dentro de una transacción)
+            conn = sqlite3.connect(db_path, isolation_level=None)
+            for i, path in enumerate(staging_paths):
+                conn.execute(f'ATTACH DATABASE ? AS shard{i}', (path,))
+
+            # Nombres cualificados con main: sin prefijo SQLite también busca en los shards
+            conn.execute('BEGIN')
+            conn.execute(f'DROP TABLE IF EXISTS main."{table_name}"')
+            conn.execute(pd.io.sql.get_schema(self.df, table_name).replace(
+                f'CREATE TABLE "{table_name}"', f'CREATE TABLE main."{table_name}"', 1))
+            for i in range(len(staging_paths)):
+                conn.execute(f'INSERT INTO main."{table_name}" SELECT * FROM shard{i}."{table_name}"')
+
+            # 3. Índices una sola vez, con todos los datos ya insertados
+            for col in self.BASE_INDEX_COLUMNS:
+                if col in self.df.columns:
+                    conn.execute(f'CREATE INDEX main."idx_{table_name}_{col}" ON "{table_name}" ("{col}")')
+            self._reset_summaries(conn)
+            self._upsert_summaries(conn)
+            self._mark_load_finished(conn)
+            conn.execute('COMMIT')
+            print(f"Backfill completado en la base de datos SQLite: {db_path}, tabla: {table_name}")
         except Exception as e:
-            print(f"Error al guardar en SQLite: {e}")
\ No newline at end of file
+            if conn is not None and conn.in_transaction:
+                conn.execute('ROLLBACK')
+            print(f"Error en el backfill a SQLite: {e}")
+            raise
+        finally:
+            if conn is not None:
+                conn.close()
+            for path in staging_paths:
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+def benchmark_backfill(rows, db_dir=None, workers=None):
+    """
+    Compara el rendimiento (filas/segundo) de to_sqlite y backfill_sqlite sobre datos sintéticos
+
+    Returns:
+        pd.DataFrame: Segundos y filas/segundo de cada modo
+    """
+    from Transform.FutbolBackend import make_synthetic_matches
+
+    db_dir = db_dir or Config.BACKFILL_STAGING_DIR
+    os.makedirs(db_dir, exist_ok=True)
+    loader = Loader(make_synthetic_matches(rows))
+    modes = {
+        'to_sqlite': lambda path: loader.to_sqlite(path),
+        'backfill_sqlite': lambda path: loader.backfill_sqlite(path, workers=workers),
+    }
+
+    results = []
+    for mode, load in modes.items():
+        path = os.path.join(db_dir, f'benchmark_{mode}.db')
+        if os.path.exists(path):
+            os.remove(path)
+        start = time.perf_counter()
+        load(path)
+        elapsed = time.perf_counter() - start
+        results.append({'mode': mode, 'rows': rows, 'seconds': round(elapsed, 2),
+                        'rows_per_second': round(rows / elapsed)})
+        os.remove(path)
+    return pd.DataFrame(results)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark de carga: escritor único vs backfill en paralelo')
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+    print(benchmark_backfill(args.rows, workers=args.workers))
@@ -0,0 +1,299 @@
+"""
+Modelo de probabilidades de resultado (Poisson con corrección Dixon-Coles).
+
+Goles esperados de cada partido:
+    log λ_local     = μ + ataque[local]     - defensa[visitante] + ventaja_local · (1 - neutral)
+    log λ_visitante = μ + ataque[visitante] - defensa[local]
+
+Los parámetros se ajustan con Newton-Raphson / IRLS vectorizado sobre ids enteros de
+equipo (sin bucles por partido), con penalización L2 en ataque/defensa y pesos que
+decrecen con la antigüedad del partido. Después se estima el ρ de Dixon-Coles, que
+corrige la probabilidad de los marcadores bajos (0-0, 1-0, 0-1, 1-1).
+
+Uso desde la línea de comandos (ajusta o reutiliza Config.MODEL_PARAMS_PATH):
+    python -m Predict.FutbolPredict Brazil Argentina --neutral
+"""
+import argparse
+import json
+import os
+import sqlite3
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from Config.Config import Config
+
+
+class FutbolPoissonModel:
+    def __init__(self, ridge=None, half_life_days=None, max_goals=10):
+        """
+        Args:
+            ridge (float): Penalización L2 de ataque/defensa. Por defecto Config.MODEL_RIDGE
+            half_life_days (float): Vida media (días) del peso de cada partido; None = sin decaimiento.
+                Por defecto Config.MODEL_HALF_LIFE_DAYS
+            max_goals (int): Goles máximos por equipo en la matriz de marcadores
+        """
+        self.ridge = Config.MODEL_RIDGE if ridge is None else ridge
+        self.half_life_days = Config.MODEL_HALF_LIFE_DAYS if half_life_days is None else half_life_days
+        self.max_goals = max_goals
+        self.teams = None
+        self.params = None
+        self.data_version = None
+        self.db_id = None
+
+    def hyperparameters(self):
+        """
+        Hiperparámetros que determinan el ajuste (se guardan con los parámetros para
+        no reutilizar un ajuste hecho con otros valores)
+        """
+        return {'ridge': float(self.ridge),
+                'half_life_days': None if not self.half_life_days else float(self.half_life_days),
+                'max_goals': int(self.max_goals)}
+
+    # ------------------------------------------------------------------ ajuste
+
+    def _match_weights(self, dates):
+        if not self.half_life_days:
+            return np.ones(len(dates))
+        dates = pd.to_datetime(dates, errors='coerce')
+        age_days = (dates.max() - dates).dt.days.fillna(0).to_numpy(dtype=float)
+        return np.power(0.5, age_days / self.half_life_days)
+
+    def _design(self, home_ids, away_ids, neutral):
+        """
+        Columnas y valores no nulos de la matriz de diseño (4 por observación).
+        Observaciones: primero los goles locales de cada partido, luego los visitantes.
+        Parámetros: [μ, ventaja_local, ataque(T), defensa(T)]
+        """
+        n_teams = len(self.teams)
+        n = len(home_ids)
+        ones = np.ones(n)
+        cols = np.concatenate([
+            np.column_stack([np.zeros(n, int), np.ones(n, int), 2 + home_ids, 2 + n_teams + away_ids]),
+            np.column_stack([np.zeros(n, int), np.ones(n, int), 2 + away_ids, 2 + n_teams + home_ids]),
+        ])
+        vals = np.concatenate([
+            np.column_stack([ones, 1.0 - neutral, ones, -ones]),
+            np.column_stack([ones, np.zeros(n), ones, -ones]),
+        ])
+        return cols, vals
+
+    def fit(self, data, max_iter=50, tol=1e-8):
+        """
+        Ajusta el modelo con los partidos limpios (home_team, away_team, home_score,
+        away_score, neutral y date)
+
+        Returns:
+            FutbolPoissonModel: El propio modelo ajustado
+        """
+        home_codes, self.teams = pd.factorize(pd.concat([data['home_team'], data['away_team']]), sort=True)
+        home_ids, away_ids = home_codes[:len(data)], home_codes[len(data):]
+        neutral = data['neutral'].fillna(False).astype(bool).to_numpy(dtype=float)
+        goals = np.concatenate([data['home_score'].to_numpy(dtype=float), data['away_score'].to_numpy(dtype=float)])
+        weights = np.tile(self._match_weights(data['date']), 2)
+
+        cols, vals = self._design(home_ids, away_ids, neutral)
+        n_params = 2 + 2 * len(self.teams)
+        penalty = np.full(n_params, self.ridge)
+        penalty[:2] = 0.0
+
+        beta = np.zeros(n_params)
+        beta[0] = np.log(np.average(goals, weights=weights))
+        # Pares (a, b) de columnas no nulas de cada observación para ensamblar X'WX
+        pair_index = (cols[:, :, None] * n_params + cols[:, None, :]).ravel()
+        pair_vals = (vals[:, :, None] * vals[:, None, :])
+
+        for _ in range(max_iter):
+            rate = np.exp((beta[cols] * vals).sum(axis=1))
+            residual = weights * (goals - rate)
+            gradient = np.bincount(cols.ravel(), (vals * residual[:, None]).ravel(), minlength=n_params)
+            gradient -= penalty * beta
+            hessian = np.bincount(pair_index, (pair_vals * (weights * rate)[:, None, None]).ravel(),
+                                  minlength=n_params * n_params).reshape(n_params, n_params)
+            hessian[np.diag_indices(n_params)] += penalty
+            step = np.linalg.solve(hessian, gradient)
+            beta += step
+            if np.max(np.abs(step)) < tol:
+                break
+
+        n_teams = len(self.teams)
+        self.params = {
+            'mu': beta[0],
+            'home_advantage': beta[1],
+            'attack': beta[2:2 + n_teams],
+            'defence': beta[2 + n_teams:],
+            'rho': 0.0,
+        }
+
+        # ρ de Dixon-Coles: búsqueda en rejilla sobre la verosimilitud de los marcadores bajos
+        lam, mu = self._rates(home_ids, away_ids, neutral)
+        self.params['rho'] = self._fit_rho(goals[:len(data)], goals[len(data):], lam, mu, weights[:len(data)])
+        return self
+
+    @staticmethod
+    def _tau(home_goals, away_goals, lam, mu, rho):
+        """
+        Factor de corrección Dixon-Coles (rho puede ser un vector columna para la rejilla)
+        """
+        tau = np.ones(np.broadcast(home_goals, rho).shape)
+        tau = np.where((home_goals == 0) & (away_goals == 0), 1 - lam * mu * rho, tau)
+        tau = np.where((home_goals == 0) & (away_goals == 1), 1 + lam * rho, tau)
+        tau = np.where((home_goals == 1) & (away_goals == 0), 1 + mu * rho, tau)
+        tau = np.where((home_goals == 1) & (away_goals == 1), 1 - rho, tau)
+        return tau
+
+    def _fit_rho(self, home_goals, away_goals, lam, mu, weights):
+        low = (home_goals <= 1) & (away_goals <= 1)
+        grid = np.linspace(-0.2, 0.2, 81)[:, None]
+        tau = self._tau(home_goals[low], away_goals[low], lam[low], mu[low], grid)
+        valid = (tau > 0).all(axis=1)
+        loglik = np.where(valid, (weights[low] * np.log(np.clip(tau, 1e-12, None))).sum(axis=1), -np.inf)
+        return float(grid[np.argmax(loglik), 0])
+
+    # ------------------------------------------------------------ predicción
+
+    def _rates(self, home_ids, away_ids, neutral):
+        p = self.params
+        lam = np.exp(p['mu'] + p['attack'][home_ids] - p['defence'][away_ids] + p['home_advantage'] * (1 - neutral))
+        mu = np.exp(p['mu'] + p['attack'][away_ids] - p['defence'][home_ids])
+        return lam, mu
+
+    def _team_ids(self, teams):
+        ids = self.teams.get_indexer(teams)
+        unknown = sorted(set(np.asarray(teams)[ids < 0]))
+        if unknown:
+            raise ValueError(f"Equipos sin historial en el modelo: {unknown}")
+        return ids
+
+    def predict(self, fixtures):
+        """
+        Probabilidades de victoria local, empate y victoria visitante para un lote de partidos
+
+        Args:
+            fixtures (pd.DataFrame): Columnas home_team, away_team y (opcional) neutral
+
+        Returns:
+            pd.DataFrame: Goles esperados y probabilidades de cada resultado por partido
+        """
+        if self.params is None:
+            raise ValueError("El modelo no está ajustado: llama a fit() o load() primero")
+
+        home_ids = self._team_ids(fixtures['home_team'])
+        away_ids = self._team_ids(fixtures['away_team'])
+        neutral = (fixtures['neutral'].fillna(False).astype(bool).to_numpy(dtype=float)
+                   if 'neutral' in fixtures.columns else np.zeros(len(fixtures)))
+        lam, mu = self._rates(home_ids, away_ids, neutral)
+
+        # Matriz de marcadores (partido × goles local × goles visitante)
+        goals = np.arange(self.max_goals + 1)
+        log_factorial = np.concatenate([[0.0], np.cumsum(np.log(goals[1:]))])
+        home_pmf = np.exp(goals * np.log(lam)[:, None] - lam[:, None] - log_factorial)
+        away_pmf = np.exp(goals * np.log(mu)[:, None] - mu[:, None] - log_factorial)
+        scores = home_pmf[:, :, None] * away_pmf[:, None, :]
+        scores[:, :2, :2] *= self._tau(goals[:2, None], goals[None, :2],
+                                       lam[:, None, None], mu[:, None, None], self.params['rho'])
+        scores /= scores.sum(axis=(1, 2), keepdims=True)
+
+        return pd.DataFrame({
+            'home_team': fixtures['home_team'].to_numpy(),
+            'away_team': fixtures['away_team'].to_numpy(),
+            'neutral': neutral.astype(bool),
+            'expected_home_goals': lam,
+            'expected_away_goals': mu,
+            'home_win': np.tril(np.ones((len(goals), len(goals))), -1).ravel() @ scores.reshape(len(lam), -1).T,
+            'draw': np.trace(scores, axis1=1, axis2=2),
+            'away_win': np.triu(np.ones((len(goals), len(goals))), 1).ravel() @ scores.reshape(len(lam), -1).T,
+        }, index=fixtures.index)
+
+    def team_ratings(self):
+        """
+        Returns:
+            pd.DataFrame: Ataque y defensa de cada equipo, ordenados por fuerza total
+        """
+        ratings = pd.DataFrame({'attack': self.params['attack'], 'defence': self.params['defence']},
+                               index=self.teams)
+        ratings['strength'] = ratings['attack'] + ratings['defence']
+        return ratings.sort_values('strength', ascending=False)
+
+    # --------------------------------------------------------- persistencia
+
+    def save(self, path=None, data_version=None, db_id=None):
+        """
+        Guarda los parámetros ajustados (npz) junto a la base de datos, con los
+        hiperparámetros y la base (identificador y versión) con que se ajustaron
+        """
+        path = path or Config.MODEL_PARAMS_PATH
+        np.savez(path, teams=np.asarray(self.teams, dtype=str), attack=self.params['attack'],
+                 defence=self.params['defence'],
+                 scalars=np.array([self.params['mu'], self.params['home_advantage'], self.params['rho']]),
+                 hyperparameters=np.array(json.dumps(self.hyperparameters())),
+                 data_version=np.array(-1 if data_version is None else data_version),
+                 db_id=np.array(-1 if db_id is None else db_id),
+                 fitted_at=np.array(datetime.now().isoformat()))
+        print(f"Parámetros del modelo guardados en {path}")
+
+    @classmethod
+    def load(cls, path=None):
+        path = path or Config.MODEL_PARAMS_PATH
+        model = cls()
+        with np.load(path) as params:
+            if 'hyperparameters' in params.files:
+                hyperparameters = json.loads(str(params['hyperparameters']))
+                model.ridge = hyperparameters['ridge']
+                model.half_life_days = hyperparameters['half_life_days']
+                model.max_goals = hyperparameters['max_goals']
+            model.teams = pd.Index(params['teams'])
+            mu, home_advantage, rho = params['scalars']
+            model.params = {'mu': mu, 'home_advantage': home_advantage, 'attack': params['attack'],
+                            'defence': params['defence'], 'rho': float(rho)}
+            model.data_version = int(params['data_version'])
+            model.db_id = int(params['db_id']) if 'db_id' in params.files else None
+        return model
+
+    @classmethod
+    def load_or_fit(cls, db_path=None, table_name=None, params_path=None, **hyperparameters):
+        """
+        Reutiliza los parámetros guardados si se ajustaron con los mismos hiperparámetros
+        y la base de datos no ha cambiado desde el ajuste: mismo identificador
+        (PRAGMA application_id, que Loader asigna en la primera carga) y misma versión
+        (PRAGMA user_version, que Loader incrementa en cada carga). Si no, reajusta con
+        la tabla cargada y guarda los nuevos parámetros
+
+        Args:
+            **hyperparameters: ridge, half_life_days y max_goals (por defecto los de Config)
+        """
+        db_path = db_path or Config.SQLITE_DB_PATH
+        table_name = table_name or Config.SQLITE_TABLE
+        params_path = params_path or Config.MODEL_PARAMS_PATH
+        model = cls(**hyperparameters)
+
+        conn = sqlite3.connect(db_path)
+        try:
+            db_id = conn.execute('PRAGMA application_id').fetchone()[0]
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if os.path.exists(params_path):
+                saved = cls.load(params_path)
+                if (saved.db_id == db_id and saved.data_version == version
+                        and saved.hyperparameters() == model.hyperparameters()):
+                    return saved
+            data = pd.read_sql_query(
+                f'SELECT date, home_team, away_team, home_score, away_score, neutral FROM "{table_name}"',
+                conn, parse_dates=['date'])
+        finally:
+            conn.close()
+
+        model.fit(data)
+        model.save(params_path, data_version=version, db_id=db_id)
+        model.data_version, model.db_id = version, db_id
+        return model
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Probabilidades de victoria/empate/derrota de un partido')
+    parser.add_argument('home_team')
+    parser.add_argument('away_team')
+    parser.add_argument('--neutral', action='store_true', help='Partido en campo neutral (sin ventaja local)')
+    args = parser.parse_args()
+
+    model = FutbolPoissonModel.load_or_fit()
+    fixture = pd.DataFrame({'home_team': [args.home_team], 'away_team': [args.away_team], 'neutral': [args.neutral]})
+    print(model.predict(fixture).round(3).to_string(index=False))
@@ -0,0 +1,100 @@
+"""
+Prueba de carga local del servicio de estadísticas.
+
+Uso:
+    python -m Service.FutbolLoadTest --requests 2000 --concurrency 8
+    python -m Service.FutbolLoadTest --url http://127.0.0.1:8050 --requests 5000
+
+Sin --url arranca el servicio en un hilo sobre un puerto libre.
+"""
+import argparse
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from Service.FutbolService import FutbolStatsService
+
+DEFAULT_PATHS = [
+    '/goals-by-year',
+    '/teams/Brazil',
+    '/teams/England',
+    '/head-to-head?team_a=Brazil&team_b=Argentina',
+    '/tournaments/FIFA%20World%20Cup',
+    '/tournaments/Friendly',
+]
+
+
+def run_load_test(base_url, paths, total_requests, concurrency):
+    """
+    Lanza las peticiones en paralelo y mide la latencia de cada una
+
+    Returns:
+        dict: Peticiones por segundo, latencias (ms), respuestas 404 (con sus rutas)
+            y número de errores
+    """
+    def fetch(i):
+        path = paths[i % len(paths)]
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(base_url + path) as response:
+                response.read()
+            status = 'ok'
+        except urllib.error.HTTPError as e:
+            status = 'not_found' if e.code == 404 else 'error'
+        except Exception:
+            status = 'error'
+        return time.perf_counter() - start, path, status
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(fetch, range(total_requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array([latency for latency, _, _ in results]) * 1000
+    return {
+        'requests': total_requests,
+        'concurrency': concurrency,
+        'seconds': round(elapsed, 3),
+        'requests_per_second': round(total_requests / elapsed, 1),
+        'p50_ms': round(float(np.percentile(latencies, 50)), 2),
+        'p95_ms': round(float(np.percentile(latencies, 95)), 2),
+        'p99_ms': round(float(np.percentile(latencies, 99)), 2),
+        'max_ms': round(float(latencies.max()), 2),
+        'not_found': sum(1 for _, _, status in results if status == 'not_found'),
+        'not_found_paths': sorted({path for _, path, status in results if status == 'not_found'}),
+        'errors': sum(1 for _, _, status in results if status == 'error'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Prueba de carga del servicio de estadísticas')
+    parser.add_argument('--url', help='URL base de un servicio ya arrancado')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        server = FutbolStatsService().make_server(port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://{server.server_address[0]}:{server.server_address[1]}"
+
+    print(f"Prueba de carga contra {base_url}")
+    print("=" * 50)
+    results = run_load_test(base_url.rstrip('/'), DEFAULT_PATHS, args.requests, args.concurrency)
+    for key, value in results.items():
+        print(f"{key}: {value}")
+    if results['not_found']:
+        print(f"⚠️  {results['not_found']} respuestas 404: las rutas {results['not_found_paths']} "
+              "no tienen datos en la base cargada y no miden consultas reales")
+
+    if server is not None:
+        server.shutdown()
+        server.stats_service.pool.close_all()
+
+
+if __name__ == '__main__':
+    main()
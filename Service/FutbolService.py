@@ -0,0 +1,315 @@
+import json
+import os
+import queue
+import threading
+import time
+import sqlite3
+from collections import OrderedDict
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote, quote
+import pandas as pd
+from Config.Config import Config
+from Extract.FutolGraphics import FutbolGraphics
+
+
+class SQLiteConnectionPool:
+    """
+    Pool de conexiones de solo lectura a la base de datos SQLite.
+    """
+    def __init__(self, db_path, size):
+        self.db_path = db_path
+        self._pool = queue.Queue(maxsize=size)
+        uri = f"file:{quote(os.path.abspath(db_path))}?mode=ro"
+        for _ in range(size):
+            self._pool.put(sqlite3.connect(uri, uri=True, check_same_thread=False))
+
+    @contextmanager
+    def connection(self):
+        """
+        Presta una conexión del pool y la devuelve al terminar
+        """
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def close_all(self):
+        """
+        Cierra todas las conexiones del pool
+        """
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+
+class TTLCache:
+    """
+    Caché LRU con expiración por tiempo (TTL), segura entre hilos.
+    """
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Returns:
+            tuple: (encontrado, valor)
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                expires_at, value = item
+                if expires_at > time.monotonic():
+                    self._items.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._items[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key, value):
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+class FutbolStatsService:
+    """
+    Estadísticas de solo lectura sobre las tablas cargadas por Loader, con caché TTL+LRU.
+
+    Los totales por equipo, torneo y año se leen de las tablas resumen de Loader
+    (team_season_stats, tournament_year_stats), que solo tienen una fila por
+    equipo/torneo y año; la tabla base se consulta únicamente con agregados SQL
+    (fechas de un equipo y enfrentamientos directos), nunca con SELECT *.
+
+    La caché se invalida cuando Loader termina una carga: Loader incrementa
+    PRAGMA user_version y el servicio lo compara antes de responder.
+    Las respuestas tienen el mismo formato que las agregaciones de FutbolGraphics.
+    """
+    def __init__(self, db_path=None, table_name=None, pool_size=None, cache_size=None, cache_ttl=None):
+        self.db_path = db_path or Config.SQLITE_DB_PATH
+        self.table_name = table_name or Config.SQLITE_TABLE
+        self.pool = SQLiteConnectionPool(self.db_path, pool_size or Config.SERVICE_POOL_SIZE)
+        self.cache = TTLCache(cache_size or Config.SERVICE_CACHE_SIZE,
+                              cache_ttl if cache_ttl is not None else Config.SERVICE_CACHE_TTL)
+        self._data_version = None
+        self._version_lock = threading.Lock()
+
+    def _query(self, sql, params=()):
+        """
+        Ejecuta una consulta de agregación y devuelve el resultado como DataFrame
+        """
+        with self.pool.connection() as conn:
+            return pd.read_sql_query(sql, conn, params=params)
+
+    @staticmethod
+    def _period_averages(data, period_column):
+        """
+        Promedios por periodo a partir de sumas de goles y partidos (mismo formato
+        que FutbolGraphics.compute_goals_by_period)
+        """
+        stats = data.set_index(period_column)
+        goals_by_period = pd.DataFrame({
+            'matches': stats['matches'],
+            'home_score': stats['home_goals'] / stats['matches'],
+            'away_score': stats['away_goals'] / stats['matches'],
+        })
+        goals_by_period['total_avg'] = goals_by_period['home_score'] + goals_by_period['away_score']
+        return goals_by_period
+
+    def _check_data_version(self):
+        """
+        Vacía la caché si Loader ha terminado una carga desde la última consulta
+        """
+        with self.pool.connection() as conn:
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+        with self._version_lock:
+            if version != self._data_version:
+                self.cache.clear()
+                self._data_version = version
+
+    def _cached(self, key, compute):
+        self._check_data_version()
+        found, value = self.cache.get(key)
+        if not found:
+            value = FutbolGraphics.to_serializable(compute())
+            self.cache.set(key, value)
+        return value
+
+    def team_summary(self, team):
+        """
+        Partidos, goles, victorias y diferencia de goles de un equipo
+        """
+        def compute():
+            totals = self._query(
+                'SELECT SUM(games) AS games, SUM(goals_for) AS goals_scored, '
+                'SUM(goals_against) AS goals_conceded, SUM(wins) AS wins '
+                'FROM team_season_stats WHERE team = ?', (team,)).iloc[0]
+            if pd.isna(totals['games']):
+                return None
+            dates = self._query(
+                f'SELECT MIN(date) AS first_match, MAX(date) AS last_match FROM "{self.table_name}" '
+                'WHERE home_team = ? OR away_team = ?', (team, team)).iloc[0]
+            stats = {column: int(totals[column]) for column in ['games', 'goals_scored', 'goals_conceded', 'wins']}
+            stats['win_rate'] = stats['wins'] / stats['games']
+            stats['goal_difference'] = stats['goals_scored'] - stats['goals_conceded']
+            stats['team'] = team
+            stats['first_match'] = pd.Timestamp(dates['first_match'])
+            stats['last_match'] = pd.Timestamp(dates['last_match'])
+            return stats
+        return self._cached(('team', team), compute)
+
+    def head_to_head(self, team_a, team_b):
+        """
+        Historial de enfrentamientos directos entre dos equipos
+        """
+        def compute():
+            def goals(team):
+                return f'SUM(CASE WHEN home_team = {team} THEN home_score ELSE away_score END)'
+
+            def wins(team):
+                return (f'SUM(CASE WHEN home_team = {team} THEN home_score > away_score '
+                        f'ELSE away_score > home_score END)')
+
+            totals = self._query(
+                f'SELECT COUNT(*) AS matches, {wins(":a")} AS wins_a, {wins(":b")} AS wins_b, '
+                f'{goals(":a")} AS goals_a, {goals(":b")} AS goals_b, MAX(date) AS last_match '
+                f'FROM "{self.table_name}" '
+                'WHERE (home_team = :a AND away_team = :b) OR (home_team = :b AND away_team = :a)',
+                {'a': team_a, 'b': team_b}).iloc[0]
+            if totals['matches'] == 0:
+                return None
+            return {
+                'matches': int(totals['matches']),
+                'wins': {team_a: int(totals['wins_a']), team_b: int(totals['wins_b'])},
+                'draws': int(totals['matches'] - totals['wins_a'] - totals['wins_b']),
+                'goals': {team_a: int(totals['goals_a']), team_b: int(totals['goals_b'])},
+                'last_match': pd.Timestamp(totals['last_match']),
+            }
+        return self._cached(('h2h', team_a, team_b), compute)
+
+    def tournament_stats(self, tournament):
+        """
+        Partidos y goles de un torneo, en total y por año
+        """
+        def compute():
+            # year = 0 agrupa los partidos sin fecha válida (no cuentan en el desglose por año)
+            by_year = self._query(
+                'SELECT year, matches, home_goals, away_goals FROM tournament_year_stats '
+                'WHERE tournament = ? ORDER BY year', (tournament,))
+            if by_year.empty:
+                return None
+            matches = int(by_year['matches'].sum())
+            home_goals, away_goals = int(by_year['home_goals'].sum()), int(by_year['away_goals'].sum())
+            return {
+                'tournament': tournament,
+                'summary': {
+                    'home_score': home_goals,
+                    'away_score': away_goals,
+                    'matches': matches,
+                    'total_goals': home_goals + away_goals,
+                    'avg_goals_per_match': (home_goals + away_goals) / matches,
+                },
+                'by_year': self._period_averages(by_year[by_year['year'] > 0], 'year'),
+            }
+        return self._cached(('tournament', tournament), compute)
+
+    def goals_by_year(self):
+        """
+        Partidos y promedio de goles por año
+        """
+        def compute():
+            by_year = self._query(
+                'SELECT year, SUM(matches) AS matches, SUM(home_goals) AS home_goals, '
+                'SUM(away_goals) AS away_goals FROM tournament_year_stats '
+                'WHERE year > 0 GROUP BY year ORDER BY year')
+            return self._period_averages(by_year, 'year')
+        return self._cached(('goals_by_year',), compute)
+
+    def route(self, url):
+        """
+        Resuelve una URL a su estadística
+
+        Returns:
+            tuple: (código HTTP, cuerpo)
+        """
+        parsed = urlparse(url)
+        parts = [unquote(p) for p in parsed.path.strip('/').split('/') if p]
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+
+        if parts == ['health']:
+            return 200, {'status': 'ok', 'cache_hits': self.cache.hits, 'cache_misses': self.cache.misses}
+        if parts == ['goals-by-year']:
+            return 200, self.goals_by_year()
+        if len(parts) == 2 and parts[0] == 'teams':
+            body = self.team_summary(parts[1])
+        elif len(parts) == 2 and parts[0] == 'tournaments':
+            body = self.tournament_stats(parts[1])
+        elif parts == ['head-to-head']:
+            if 'team_a' not in query or 'team_b' not in query:
+                return 400, {'error': "Parámetros requeridos: 'team_a' y 'team_b'"}
+            body = self.head_to_head(query['team_a'], query['team_b'])
+        else:
+            return 404, {'error': f'Ruta desconocida: {parsed.path}'}
+
+        if body is None:
+            return 404, {'error': 'Sin partidos para la consulta'}
+        return 200, body
+
+    def make_server(self, host=None, port=None):
+        """
+        Crea el servidor HTTP (multihilo) que atiende este servicio
+        """
+        server = ThreadingHTTPServer((host or Config.SERVICE_HOST,
+                                      port if port is not None else Config.SERVICE_PORT),
+                                     _StatsRequestHandler)
+        server.daemon_threads = True
+        server.stats_service = self
+        return server
+
+    def serve(self, host=None, port=None):
+        """
+        Atiende peticiones hasta que se interrumpa el proceso
+        """
+        server = self.make_server(host, port)
+        print(f"Servicio de estadísticas en http://{server.server_address[0]}:{server.server_address[1]}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.pool.close_all()
+
+
+class _StatsRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        try:
+            status, body = self.server.stats_service.route(self.path)
+        except Exception as e:
+            status, body = 500, {'error': str(e)}
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # Silenciar el log por petición
+        pass
+
+
+if __name__ == '__main__':
+    FutbolStatsService().serve()
@@ -0,0 +1,365 @@
+"""
+Backends de DataFrame para los pasos más costosos de la limpieza y de las agregaciones.
+
+El backend se elige con Config.DATAFRAME_BACKEND:
+    'pandas': implementación de referencia (un solo hilo)
+    'polars': motor columnar multihilo (requiere `pip install polars`)
+
+Ambos reciben y devuelven objetos de pandas, por lo que el resto del ETL no cambia.
+
+Uso desde la línea de comandos:
+    python -m Transform.FutbolBackend --parity            # comprueba que los backends coinciden
+    python -m Transform.FutbolBackend --rows 10000000     # benchmark sobre datos sintéticos
+"""
+import argparse
+import contextlib
+import io
+import time
+import numpy as np
+import pandas as pd
+from Config.Config import Config
+
+TEAM_STATS_COLUMNS = ['games', 'goals_scored', 'goals_conceded', 'wins', 'win_rate', 'goal_difference']
+
+
+def mode_from_counts(counts):
+    """
+    Moda a partir de conteos por valor; en caso de empate el menor valor, igual que
+    Series.mode()[0] (si los valores empatados no se pueden comparar, el primero)
+
+    Args:
+        counts (pd.Series | dict): Valor -> número de apariciones
+
+    Returns:
+        object: Valor más frecuente o None si no hay conteos
+    """
+    if isinstance(counts, dict):
+        counts = pd.Series(counts, dtype='int64')
+    if counts.empty:
+        return None
+    candidates = counts.index[counts == counts.max()]
+    try:
+        return min(candidates)
+    except TypeError:
+        return candidates[0]
+
+
+def team_perspective(data, match_columns=None):
+    """
+    Vista larga de los partidos: una fila por equipo y partido (primero las de los
+    locales y después las de los visitantes), con el resultado visto por cada equipo
+
+    Args:
+        data (pd.DataFrame): Partidos con home_team, away_team, home_score y away_score
+        match_columns (dict): Columnas del partido que se repiten en las dos filas
+            (nombre -> valores alineados con `data`, p. ej. el año o el torneo)
+
+    Returns:
+        pd.DataFrame: team, las columnas de `match_columns`, goals_for, goals_against,
+            wins, draws y losses (0/1)
+    """
+    home_goals = data['home_score'].to_numpy()
+    away_goals = data['away_score'].to_numpy()
+    sign = np.sign(home_goals - away_goals)
+    perspective = {'team': np.concatenate([data['home_team'].to_numpy(), data['away_team'].to_numpy()])}
+    for name, values in (match_columns or {}).items():
+        values = np.asarray(values)
+        perspective[name] = np.concatenate([values, values])
+    perspective.update({
+        'goals_for': np.concatenate([home_goals, away_goals]),
+        'goals_against': np.concatenate([away_goals, home_goals]),
+        'wins': np.concatenate([sign > 0, sign < 0]).astype('int64'),
+        'draws': np.concatenate([sign == 0, sign == 0]).astype('int64'),
+        'losses': np.concatenate([sign < 0, sign > 0]).astype('int64'),
+    })
+    return pd.DataFrame(perspective)
+
+
+class PandasBackend:
+    """
+    Implementación de referencia con pandas.
+    """
+    name = 'pandas'
+
+    def mode(self, values):
+        """
+        Moda de una Serie sin nulos; en caso de empate el menor valor (como Series.mode()[0])
+
+        Returns:
+            object: Valor más frecuente o None si la Serie está vacía
+        """
+        return mode_from_counts(values.value_counts())
+
+    def normalize_text(self, series, replacements):
+        """
+        Convierte a texto, elimina espacios en los extremos y aplica la tabla de nombres canónicos
+        """
+        series = series.astype(str).str.strip()
+        for wrong, right in replacements.items():
+            series = series.str.replace(wrong, right, regex=False)
+        return series
+
+    def team_stats(self, data, teams):
+        """
+        Estadísticas por equipo a partir de la vista larga (una fila por equipo y partido)
+        """
+        perspective = team_perspective(data)
+        perspective = perspective[perspective['team'].isin(list(teams))]
+
+        stats = perspective.groupby('team').agg(
+            games=('team', 'size'),
+            goals_scored=('goals_for', 'sum'),
+            goals_conceded=('goals_against', 'sum'),
+            wins=('wins', 'sum'),
+        )
+        stats['win_rate'] = stats['wins'] / stats['games']
+        stats['goal_difference'] = stats['goals_scored'] - stats['goals_conceded']
+        stats.index.name = None
+        return stats[TEAM_STATS_COLUMNS]
+
+    def goals_by_group(self, data, column):
+        """
+        Partidos, goles totales y promedio de goles por valor de una columna
+        """
+        group_stats = data.groupby(column).agg({
+            'home_score': 'sum',
+            'away_score': 'sum'
+        })
+        group_stats['matches'] = data[column].value_counts()
+        group_stats['total_goals'] = group_stats['home_score'] + group_stats['away_score']
+        group_stats['avg_goals_per_match'] = group_stats['total_goals'] / group_stats['matches']
+        return group_stats
+
+    def goals_by_period(self, data, period_column):
+        """
+        Partidos y promedios de goles por periodo
+        """
+        goals_by_period = data.groupby(period_column).agg(
+            matches=('home_score', 'size'),
+            home_score=('home_score', 'mean'),
+            away_score=('away_score', 'mean')
+        )
+        goals_by_period['total_avg'] = goals_by_period['home_score'] + goals_by_period['away_score']
+        return goals_by_period
+
+
+class PolarsBackend(PandasBackend):
+    """
+    Implementación con Polars: las agregaciones se ejecutan en paralelo sobre
+    columnas Arrow y el resultado se devuelve como objetos de pandas.
+    """
+    name = 'polars'
+
+    def __init__(self):
+        try:
+            import polars
+        except ImportError as e:
+            raise ImportError("El backend 'polars' requiere instalar polars (pip install polars)") from e
+        self.pl = polars
+
+    def _frame(self, data, columns):
+        return self.pl.from_pandas(data[columns].reset_index(drop=True))
+
+    def mode(self, values):
+        pl = self.pl
+        series = pl.from_pandas(values.reset_index(drop=True)).drop_nulls()
+        if series.is_empty():
+            return None
+        counts = series.value_counts(name='count')
+        top = counts['count'].max()
+        return counts.filter(pl.col('count') == top)[series.name].min()
+
+    def normalize_text(self, series, replacements):
+        pl = self.pl
+        # astype(str) se mantiene en pandas para conservar su representación de NaN ('nan')
+        series = series.astype(str)
+        text = pl.from_pandas(series.reset_index(drop=True)).str.strip_chars()
+        for wrong, right in replacements.items():
+            text = text.str.replace_all(wrong, right, literal=True)
+        result = text.to_pandas().astype(series.dtype)
+        result.index = series.index
+        result.name = series.name
+        return result
+
+    def team_stats(self, data, teams):
+        pl = self.pl
+        matches = self._frame(data, ['home_team', 'away_team', 'home_score', 'away_score'])
+        perspective = pl.concat([
+            matches.select(team=pl.col('home_team'), goals_scored=pl.col('home_score'),
+                           goals_conceded=pl.col('away_score')),
+            matches.select(team=pl.col('away_team'), goals_scored=pl.col('away_score'),
+                           goals_conceded=pl.col('home_score')),
+        ])
+        stats = (
+            perspective
+            .filter(pl.col('team').is_in(list(teams)))
+            .group_by('team')
+            .agg(
+                games=pl.len().cast(pl.Int64),
+                goals_scored=pl.col('goals_scored').sum().cast(pl.Int64),
+                goals_conceded=pl.col('goals_conceded').sum().cast(pl.Int64),
+                wins=(pl.col('goals_scored') > pl.col('goals_conceded')).sum().cast(pl.Int64),
+            )
+            .with_columns(
+                win_rate=pl.col('wins') / pl.col('games'),
+                goal_difference=pl.col('goals_scored') - pl.col('goals_conceded'),
+            )
+            .sort('team')
+            .to_pandas()
+            .set_index('team')
+        )
+        stats.index.name = None
+        return stats[TEAM_STATS_COLUMNS]
+
+    def goals_by_group(self, data, column):
+        pl = self.pl
+        group_stats = (
+            self._frame(data, [column, 'home_score', 'away_score'])
+            .drop_nulls(column)
+            .group_by(column)
+            .agg(
+                home_score=pl.col('home_score').sum(),
+                away_score=pl.col('away_score').sum(),
+                matches=pl.len().cast(pl.Int64),
+            )
+            .with_columns(total_goals=pl.col('home_score') + pl.col('away_score'))
+            .with_columns(avg_goals_per_match=pl.col('total_goals') / pl.col('matches'))
+            .sort(column)
+            .to_pandas()
+            .set_index(column)
+        )
+        group_stats.index = group_stats.index.astype(data[column].dtype)
+        return group_stats
+
+    def goals_by_period(self, data, period_column):
+        pl = self.pl
+        goals_by_period = (
+            self._frame(data, [period_column, 'home_score', 'away_score'])
+            .drop_nulls(period_column)
+            .group_by(period_column)
+            .agg(
+                matches=pl.len().cast(pl.Int64),
+                home_score=pl.col('home_score').mean(),
+                away_score=pl.col('away_score').mean(),
+            )
+            .with_columns(total_avg=pl.col('home_score') + pl.col('away_score'))
+            .sort(period_column)
+            .to_pandas()
+            .set_index(period_column)
+        )
+        goals_by_period.index = goals_by_period.index.astype(data[period_column].dtype)
+        return goals_by_period
+
+
+BACKENDS = {
+    'pandas': PandasBackend,
+    'polars': PolarsBackend,
+}
+_instances = {}
+
+
+def get_backend(name=None):
+    """
+    Devuelve el backend configurado (Config.DATAFRAME_BACKEND por defecto)
+    """
+    name = name or Config.DATAFRAME_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Backend desconocido: '{name}'. Disponibles: {list(BACKENDS)}")
+    if name not in _instances:
+        _instances[name] = BACKENDS[name]()
+    return _instances[name]
+
+
+def make_synthetic_matches(rows, seed=0):
+    """
+    Genera un dataset sintético con el mismo esquema que los datos limpios
+    """
+    rng = np.random.default_rng(seed)
+    teams = np.array([f'Team {i}' for i in range(300)], dtype=object)
+    tournaments = np.array([f'Tournament {i}' for i in range(100)], dtype=object)
+    countries = np.array([f'Country {i}' for i in range(200)], dtype=object)
+    days = rng.integers(0, 150 * 365, rows)
+    return pd.DataFrame({
+        'date': pd.Timestamp('1872-01-01') + pd.to_timedelta(days, unit='D'),
+        'home_team': teams[rng.integers(0, len(teams), rows)],
+        'away_team': teams[rng.integers(0, len(teams), rows)],
+        'home_score': rng.poisson(1.6, rows),
+        'away_score': rng.poisson(1.1, rows),
+        'tournament': tournaments[rng.integers(0, len(tournaments), rows)],
+        'city': countries[rng.integers(0, len(countries), rows)],
+        'country': countries[rng.integers(0, len(countries), rows)],
+        'neutral': rng.random(rows) < 0.25,
+    })
+
+
+def _operations(data):
+    """
+    Operaciones comparadas entre backends: (nombre, función(backend))
+    """
+    teams = set(data['home_team'].unique()) | set(data['away_team'].unique())
+    with_year = data.assign(year=pd.to_datetime(data['date']).dt.year)
+    dirty_text = ' ' + data['tournament'].astype(str) + 'Ã© '
+    return [
+        ('mode', lambda b: b.mode(data['home_team'])),
+        ('normalize_text', lambda b: b.normalize_text(dirty_text, {'Ã©': 'é'})),
+        ('team_stats', lambda b: b.team_stats(data, teams)),
+        ('goals_by_group', lambda b: b.goals_by_group(data, 'tournament')),
+        ('goals_by_period', lambda b: b.goals_by_period(with_year, 'year')),
+    ]
+
+
+def check_parity(data, backend_names=None):
+    """
+    Verifica que cada backend produce exactamente el mismo resultado que pandas,
+    incluido el orden de las filas (las pruebas automáticas están en tests/test_backend_parity.py)
+
+    Raises:
+        AssertionError: Si algún resultado difiere
+    """
+    reference = get_backend('pandas')
+    for name in backend_names or [n for n in BACKENDS if n != 'pandas']:
+        backend = get_backend(name)
+        for operation, run in _operations(data):
+            expected, result = run(reference), run(backend)
+            if isinstance(expected, pd.DataFrame):
+                pd.testing.assert_frame_equal(result, expected)
+            elif isinstance(expected, pd.Series):
+                pd.testing.assert_series_equal(result, expected)
+            else:
+                assert result == expected, f"{operation}: {result!r} != {expected!r}"
+            print(f"✓ {name}.{operation} coincide con pandas")
+
+
+def benchmark_backends(data, backend_names=None):
+    """
+    Mide el tiempo de cada operación en cada backend
+
+    Returns:
+        pd.DataFrame: Segundos por (backend, operación)
+    """
+    results = []
+    for name in backend_names or list(BACKENDS):
+        backend = get_backend(name)
+        for operation, run in _operations(data):
+            start = time.perf_counter()
+            run(backend)
+            results.append({'backend': name, 'operation': operation,
+                            'seconds': round(time.perf_counter() - start, 3)})
+    return pd.DataFrame(results).pivot(index='operation', columns='backend', values='seconds')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Paridad y benchmark de los backends de DataFrame')
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--parity', action='store_true', help='Solo comprobar paridad (sobre Config.INPUT_PATH limpio)')
+    args = parser.parse_args()
+
+    if args.parity:
+        from Transform.FutbolClean import futbolClean
+        with contextlib.redirect_stdout(io.StringIO()):
+            cleaned = futbolClean(pd.read_csv(Config.INPUT_PATH)).full_cleaning_process()
+        check_parity(cleaned)
+        check_parity(make_synthetic_matches(100_000))
+    else:
+        print(f"Benchmark con {args.rows:,} filas sintéticas")
+        print(benchmark_backends(make_synthetic_matches(args.rows)))
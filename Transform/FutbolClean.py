@@ -1,39 +1,85 @@
 import pandas as pd
 import numpy as np
+from Transform.FutbolBackend import get_backend
+from Transform.FutbolProfile import DataProfile
 
 class futbolClean:
-    def __init__(self, dataframe):
+    # Representaciones de texto que se consideran valores nulos
+    NULL_TOKENS = ['null', 'NULL', 'Null', 'nan', 'NaN', 'NAN', 'n/a', 'N/A', '', 'None', 'NONE']
+    # Columnas de texto que se imputan con la moda
+    MODE_COLUMNS = ['away_team', 'home_team', 'tournament', 'country', 'city']
+    # Columnas de texto que se limpian y estandarizan
+    TEXT_COLUMNS = ['home_team', 'away_team', 'tournament', 'city', 'country']
+    # Tabla de nombres canónicos: caracteres mal codificados -> carácter correcto
+    TEXT_REPLACEMENTS = {'Ã©': 'é', 'Ã¤': 'ä', 'Ã¶': 'ö'}
+    # Valores por defecto cuando una columna no tiene moda válida
+    DEFAULT_FILL_VALUES = {
+        'home_team': 'Unknown Team',
+        'away_team': 'Unknown Team',
+        'tournament': 'Friendly',
+        'city': 'Unknown',
+        'country': 'Unknown',
+        'neutral': 'FALSE'
+    }
+
+    def __init__(self, dataframe, backend=None):
         """
         Inicializa la clase de limpieza con el DataFrame de resultados de partidos de fútbol
 
         Args:
             dataframe (pd.DataFrame): DataFrame con los datos de partidos de fútbol (fecha, equipos, marcadores, etc.)
+            backend (str): Backend de DataFrame ('pandas' o 'polars'). Por defecto Config.DATAFRAME_BACKEND
         """
+        self.backend = get_backend(backend)
         self.data = dataframe.copy()
         self.original_data = dataframe.copy()
+        
+        # Perfil del estado actual de self.data y perfil de los datos originales
+        self.profile = None
+        self.original_profile = None
+        self._profiled_columns = set()
+        self._data_modified = False
+    
+    def _invalidate_profile(self, columns=None):
+        """
+        Marca como obsoleto el perfil de las columnas modificadas (todas si columns es None)
+        """
+        self._data_modified = True
+        if columns is None:
+            self._profiled_columns.clear()
+        else:
+            self._profiled_columns.difference_update(columns)
+    
+    def _profile_is_current(self):
+        return self.profile is not None and self._profiled_columns == set(self.data.columns)
     
     def check_missing_values(self):
         """
         Verifica y reporta valores nulos y NA en el dataset
         
+        Calcula en una sola pasada el perfil de cada columna (nulos, tokens nulos,
+        valores distintos, mínimo/máximo y valores más frecuentes), que luego
+        reutilizan los pasos de limpieza.
+        
         Returns:
             dict: Diccionario con información sobre valores faltantes
         """
-        missing_info = {
-            'total_rows': len(self.data),
-            'null_values': self.data.isnull().sum().to_dict(),
-            'na_values': self.data.isna().sum().to_dict(),
-            'rows_with_missing': len(self.data[self.data.isnull().any(axis=1)]),
-            'missing_data_percentage': (self.data.isnull().sum() / len(self.data) * 100).to_dict()
-        }
+        self.profile = DataProfile.from_dataframe(self.data, self.NULL_TOKENS)
+        self._profiled_columns = set(self.data.columns)
+        if not self._data_modified:
+            self.original_profile = self.profile
         
-        return missing_info
+        return self.profile.to_report()
     
-    def display_missing_data_report(self):
+    def display_missing_data_report(self, missing_info=None):
         """
         Muestra un reporte detallado de los datos faltantes
+        
+        Args:
+            missing_info (dict): Reporte de check_missing_values. Si no se indica, se calcula
         """
-        missing_info = self.check_missing_values()
+        if missing_info is None:
+            missing_info = self.check_missing_values()
         
         print("=" * 50)
         print("REPORTE DE DATOS FALTANTES - PARTIDOS DE FÚTBOL")
@@ -53,7 +99,7 @@ class futbolClean:
         
         print("\nPrimeras filas con valores faltantes:")
         print("-" * 30)
-        missing_rows = self.data[self.data.isnull().any(axis=1)]
+        missing_rows = self.data.loc[missing_info['missing_row_index']]
         if len(missing_rows) > 0:
             # Mostrar columnas más relevantes para este dataset de fútbol
             key_columns = ['date', 'home_team', 'away_team', 'home_score', 'away_score', 'tournament', 'city', 'country']
@@ -76,6 +122,7 @@ class futbolClean:
                 print(f"Limpiando valores nulos en '{col}'...")
                 # Para marcadores, usar 0 como valor por defecto
                 self.data[col] = pd.to_numeric(self.data[col], errors='coerce').fillna(0)
+                self._invalidate_profile([col])
                 print(f"Reemplazados valores nulos en {col} con 0")
         
         # Limpiar columna neutral (boolean)
@@ -83,10 +130,11 @@ class futbolClean:
             print("Limpiando valores nulos en 'neutral'...")
             # Para neutral, usar FALSE como valor por defecto (la mayoría de partidos no son en campo neutral)
             self.data['neutral'] = self.data['neutral'].fillna('FALSE')
+            self._invalidate_profile(['neutral'])
             print("Reemplazados valores nulos en 'neutral' con 'FALSE'")
         
         # Limpiar columnas específicas con moda
-        self._fill_with_mode(['away_team', 'home_team', 'tournament', 'country', 'city'])
+        self._fill_with_mode(self.MODE_COLUMNS)
         
         # Verificar si hay otros tipos de valores que podrían considerarse como faltantes
         self._clean_string_nulls()
@@ -102,25 +150,32 @@ class futbolClean:
         """
         for col in columns:
             if col in self.data.columns:
+                # Si el perfil de la columna está al día se reutilizan sus conteos
+                profiled = self.profile is not None and col in self._profiled_columns
+                if profiled and self.profile.null_counts[col] + self.profile.null_token_count(col) == 0:
+                    print(f"  - No hay valores nulos en '{col}'")
+                    continue
+                
                 # Contar valores nulos incluyendo diferentes representaciones
-                null_mask = (self.data[col].isnull() | 
-                           self.data[col].isna() | 
-                           self.data[col].isin(['', 'null', 'NULL', 'Null', 'nan', 'NaN', 'NAN', 'n/a', 'N/A', 'None', 'NONE']))
+                null_mask = self.data[col].isnull() | self.data[col].isin(self.NULL_TOKENS)
                 
                 if null_mask.any():
                     print(f"Procesando columna '{col}'...")
                     
                     # Obtener valores válidos (no nulos)
-                    valid_values = self.data[col][~null_mask]
+                    valid_count = len(self.data) - null_mask.sum()
                     
-                    if len(valid_values) > 0:
+                    if valid_count > 0:
                         # Calcular la moda (valor más frecuente)
-                        mode_series = valid_values.mode()
-                        if len(mode_series) > 0:
-                            mode_value = mode_series[0]
+                        if profiled:
+                            mode_value = self.profile.mode(col)
+                        else:
+                            mode_value = self.backend.mode(self.data[col][~null_mask])
+                        if mode_value is not None:
                             
                             # Reemplazar valores nulos con la moda
                             self.data.loc[null_mask, col] = mode_value
+                            self._invalidate_profile([col])
                             null_count = null_mask.sum()
                             print(f"  - Reemplazados {null_count} valores nulos en '{col}' con moda: '{mode_value}'")
                         else:
@@ -130,46 +185,52 @@ class futbolClean:
                 else:
                     print(f"  - No hay valores nulos en '{col}'")
     
+    @staticmethod
+    def _is_text_column(series):
+        """
+        Indica si la columna es de texto: dtype object o dtype de cadenas (el dtype
+        por defecto de las columnas de texto desde pandas 3)
+        """
+        return pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)
+
     def _clean_string_nulls(self):
         """
         Limpia valores que pueden estar representados como strings pero son efectivamente nulos
         Usa la moda (valor más frecuente) para reemplazar valores nulos en columnas de texto
         """
-        null_representations = ['null', 'NULL', 'Null', 'nan', 'NaN', 'NAN', 'n/a', 'N/A', '', 'None', 'NONE']
-        
         for col in self.data.columns:
-            if self.data[col].dtype == 'object':  # Solo para columnas de texto
+            if self._is_text_column(self.data[col]):  # Solo para columnas de texto
+                # Si el perfil de la columna está al día se reutilizan sus conteos
+                profiled = self.profile is not None and col in self._profiled_columns
+                if profiled and self.profile.null_token_count(col) == 0:
+                    continue
+                
                 # Reemplazar representaciones de null con valores apropiados
-                mask = self.data[col].isin(null_representations)
+                mask = self.data[col].isin(self.NULL_TOKENS)
                 if mask.any():
                     # Calcular la moda (valor más frecuente) excluyendo los valores nulos
-                    valid_values = self.data[col][~mask]
-                    if len(valid_values) > 0:
-                        mode_value = valid_values.mode()[0] if len(valid_values.mode()) > 0 else None
+                    if profiled:
+                        mode_value = self.profile.mode(col)
+                    elif not mask.all():
+                        mode_value = self.backend.mode(self.data[col][~mask])
                     else:
                         mode_value = None
                     
                     # Si no hay moda válida, usar valores por defecto específicos por columna
                     if mode_value is None:
-                        if col in ['home_team', 'away_team']:
-                            mode_value = 'Unknown Team'
-                        elif col == 'tournament':
-                            mode_value = 'Friendly'
-                        elif col in ['city', 'country']:
-                            mode_value = 'Unknown'
-                        elif col == 'neutral':
-                            mode_value = 'FALSE'
-                        else:
-                            mode_value = 'Unknown'
+                        mode_value = self.DEFAULT_FILL_VALUES.get(col, 'Unknown')
                     
                     # Reemplazar valores nulos con la moda
                     self.data.loc[mask, col] = mode_value
+                    self._invalidate_profile([col])
                     print(f"Reemplazados {mask.sum()} valores nulos en {col} con moda: '{mode_value}'")
     
     def convert_data_types(self):
         """
         Convierte los tipos de datos a formatos más apropiados para el dataset de partidos de fútbol
         """
+        self._invalidate_profile()
+        
         # Convertir columnas numéricas (marcadores)
         numeric_columns = {
             'home_score': int,
@@ -203,17 +264,11 @@ class futbolClean:
                 print(f"No se pudo convertir 'neutral' a boolean: {e}")
         
         # Limpiar y estandarizar columnas de texto
-        text_columns = ['home_team', 'away_team', 'tournament', 'city', 'country']
-        
-        for col in text_columns:
+        for col in self.TEXT_COLUMNS:
             if col in self.data.columns:
                 try:
-                    # Limpiar caracteres especiales y estandarizar
-                    self.data[col] = self.data[col].astype(str).str.strip()
-                    # Reemplazar caracteres especiales comunes
-                    self.data[col] = self.data[col].str.replace('Ã©', 'é', regex=False)
-                    self.data[col] = self.data[col].str.replace('Ã¤', 'ä', regex=False)
-                    self.data[col] = self.data[col].str.replace('Ã¶', 'ö', regex=False)
+                    # Limpiar caracteres especiales y estandarizar (nombres canónicos)
+                    self.data[col] = self.backend.normalize_text(self.data[col], self.TEXT_REPLACEMENTS)
                     print(f"Columna {col} limpiada y estandarizada")
                 except Exception as e:
                     print(f"Error al limpiar columna {col}: {e}")
@@ -234,8 +289,14 @@ class futbolClean:
         Returns:
             dict: Resumen de la limpieza
         """
-        original_missing = self.original_data.isnull().sum().sum()
-        current_missing = self.data.isnull().sum().sum()
+        # Reutilizar los perfiles ya calculados en lugar de volver a recorrer los datos
+        if self.original_profile is not None:
+            original_missing = self.original_profile.total_missing()
+        else:
+            original_missing = int(self.original_data.isnull().sum().sum())
+        if not self._profile_is_current():
+            self.check_missing_values()
+        current_missing = self.profile.total_missing()
         
         summary = {
             'original_missing_values': original_missing,
@@ -264,8 +325,8 @@ class futbolClean:
         print("INICIANDO PROCESO COMPLETO DE LIMPIEZA")
         print("=" * 50)
         
-        # 1. Mostrar reporte inicial
-        self.display_missing_data_report()
+        # 1. Mostrar reporte inicial (el perfil se reutiliza en la limpieza y el resumen)
+        self.display_missing_data_report(self.check_missing_values())
         
         # 2. Limpiar valores faltantes
         print("\n" + "=" * 50)
@@ -280,6 +341,7 @@ class futbolClean:
         print("\n" + "=" * 50)
         print("RESUMEN FINAL DE LIMPIEZA")
         print("=" * 50)
+        final_missing = self.check_missing_values()
         summary = self.get_cleaning_summary()
         print(f"Valores faltantes originales: {summary['original_missing_values']}")
         print(f"Valores faltantes actuales: {summary['current_missing_values']}")
@@ -289,7 +351,6 @@ class futbolClean:
         print(f"Shape actual: {summary['current_shape']}")
         
         # Verificación final
-        final_missing = self.check_missing_values()
         print(f"\nVerificación final - Total valores nulos: {sum(final_missing['null_values'].values())}")
         
         return self.data
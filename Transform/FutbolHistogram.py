@@ -0,0 +1,159 @@
+"""
+Histogramas de goles y reparto de resultados con np.bincount.
+
+Los marcadores son enteros pequeños, así que np.bincount cuenta las distribuciones
+de goles locales, visitantes y totales sin ordenar ni hashear como value_counts.
+Cada conteo es 1-D y su tamaño crece con el máximo de goles, no con su producto: un
+marcador erróneo (p. ej. 5000-4000) cuesta unos pocos miles de celdas. El reparto
+victoria local / empate / victoria visitante sale de un único array de signos.
+Las gráficas, los promedios y los totales se derivan de estos conteos.
+
+Uso desde la línea de comandos:
+    python -m Transform.FutbolHistogram --rows 10000000   # value_counts/filtros vs bincount
+"""
+import argparse
+import time
+import numpy as np
+import pandas as pd
+
+
+class GoalHistograms:
+    """
+    Distribuciones de goles (partidos por número de goles) y reparto de resultados.
+    """
+    RESULTS = ['away_wins', 'draws', 'home_wins']  # índice = signo(local - visitante) + 1
+
+    def __init__(self, home, away, total, results):
+        """
+        Args:
+            home, away, total (np.ndarray): counts[g] = partidos con g goles locales/visitantes/totales
+            results (np.ndarray): Partidos por resultado, en el orden de RESULTS
+        """
+        self.home = home
+        self.away = away
+        self.total = total
+        self.results = results
+
+    @classmethod
+    def from_scores(cls, home_scores, away_scores):
+        """
+        Calcula los histogramas a partir de las columnas de marcadores (se ignoran
+        los partidos sin marcador válido)
+        """
+        home = np.asarray(home_scores)
+        away = np.asarray(away_scores)
+        if not (np.issubdtype(home.dtype, np.integer) and np.issubdtype(away.dtype, np.integer)):
+            home = pd.to_numeric(pd.Series(home), errors='coerce').to_numpy(dtype=float)
+            away = pd.to_numeric(pd.Series(away), errors='coerce').to_numpy(dtype=float)
+            valid = ~(np.isnan(home) | np.isnan(away))
+            home, away = home[valid].astype(np.int64), away[valid].astype(np.int64)
+        if len(home) == 0:
+            empty = np.zeros(1, dtype=np.int64)
+            return cls(empty, empty, empty, np.zeros(3, dtype=np.int64))
+        if home.min() < 0 or away.min() < 0:
+            raise ValueError("Los marcadores no pueden ser negativos")
+
+        return cls(np.bincount(home), np.bincount(away), np.bincount(home + away),
+                   np.bincount(np.sign(home - away) + 1, minlength=3))
+
+    @property
+    def matches(self):
+        return int(self.home.sum())
+
+    @staticmethod
+    def _goals(counts):
+        return int(np.dot(np.arange(len(counts)), counts))
+
+    def series(self, kind, below=None):
+        """
+        Distribución como Series (goles -> partidos), solo con los valores observados
+
+        Args:
+            kind (str): 'home', 'away' o 'total'
+            below (int): Limitar a valores menores que este
+        """
+        counts = getattr(self, kind)[:below]
+        goals = np.flatnonzero(counts)
+        return pd.Series(counts[goals], index=goals)
+
+    def averages(self):
+        matches = self.matches
+        return {
+            'home': self._goals(self.home) / matches if matches else np.nan,
+            'away': self._goals(self.away) / matches if matches else np.nan,
+        }
+
+    def total_goals(self):
+        return self._goals(self.total)
+
+    def result_counts(self):
+        return dict(zip(self.RESULTS, (int(count) for count in self.results)))
+
+    def to_dict(self):
+        """
+        Conteos listos para exportar (JSON)
+        """
+        return {
+            'matches': self.matches,
+            'home_goals': self.home.tolist(),
+            'away_goals': self.away.tolist(),
+            'total_goals': self.total.tolist(),
+            'results': self.result_counts(),
+        }
+
+
+def _pandas_reference(data):
+    """
+    Cálculo anterior: value_counts por columna y tres filtros para los resultados
+    """
+    total = data['home_score'] + data['away_score']
+    return {
+        'home_goals': data['home_score'].value_counts().sort_index(),
+        'away_goals': data['away_score'].value_counts().sort_index(),
+        'total_goals': total.value_counts().sort_index(),
+        'results': {
+            'home_wins': len(data[data['home_score'] > data['away_score']]),
+            'draws': len(data[data['home_score'] == data['away_score']]),
+            'away_wins': len(data[data['home_score'] < data['away_score']]),
+        },
+    }
+
+
+def benchmark_goal_histograms(rows, repeats=3):
+    """
+    Compara value_counts + filtros con GoalHistograms (np.bincount) y verifica que coinciden
+
+    Returns:
+        pd.DataFrame: Mejor tiempo (segundos) de cada método
+    """
+    from Transform.FutbolBackend import make_synthetic_matches
+
+    data = make_synthetic_matches(rows)[['home_score', 'away_score']]
+    methods = {
+        'value_counts + filtros': lambda: _pandas_reference(data),
+        'bincount': lambda: GoalHistograms.from_scores(data['home_score'], data['away_score']),
+    }
+
+    results = []
+    for name, run in methods.items():
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        results.append({'method': name, 'rows': rows, 'seconds': round(min(timings), 3)})
+
+    reference, histograms = _pandas_reference(data), GoalHistograms.from_scores(data['home_score'], data['away_score'])
+    for kind in ['home', 'away', 'total']:
+        pd.testing.assert_series_equal(histograms.series(kind), reference[f'{kind}_goals'],
+                                       check_names=False, check_index_type=False)
+    assert histograms.result_counts() == reference['results']
+    return pd.DataFrame(results).set_index('method')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark de histogramas de goles')
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    args = parser.parse_args()
+    print(f"Benchmark con {args.rows:,} filas sintéticas")
+    print(benchmark_goal_histograms(args.rows))
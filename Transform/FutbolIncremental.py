@@ -0,0 +1,265 @@
+import json
+import os
+import pandas as pd
+from Config.Config import Config
+from Transform.FutbolBackend import mode_from_counts
+from Transform.FutbolClean import futbolClean
+
+class futbolIncrementalClean(futbolClean):
+    """
+    Limpieza incremental: limpia solo las filas nuevas reutilizando las estadísticas
+    de imputación guardadas (conteos por valor, tokens nulos y nombres canónicos).
+
+    Los conteos se actualizan sumando los de cada lote, por lo que una ejecución diaria
+    cuesta O(filas nuevas). Si la moda de una columna cambia con el lote nuevo, las filas
+    imputadas en ejecuciones anteriores quedan pendientes en la entrada 'stale' de las
+    estadísticas (se guarda en disco); aplicándolas con `refresh_imputations`, desde este
+    u otro proceso, el histórico acumulado coincide con una limpieza completa.
+    """
+    # Columnas de texto (además de MODE_COLUMNS) cuyos tokens nulos se imputan con la moda
+    STRING_NULL_COLUMNS = ['date']
+
+    def __init__(self, dataframe, stats_path=None, backend=None):
+        """
+        Args:
+            dataframe (pd.DataFrame): Filas nuevas (aún no limpiadas) a añadir al histórico
+            stats_path (str): Ruta del JSON de estadísticas. Por defecto Config.FILL_STATS_PATH
+            backend (str): Backend de DataFrame. Por defecto Config.DATAFRAME_BACKEND
+        """
+        super().__init__(dataframe, backend)
+        self.stats_path = stats_path or Config.FILL_STATS_PATH
+        self.stats = self.load_fill_statistics(self.stats_path)
+
+        # Tokens nulos y nombres canónicos guardados junto con los conteos
+        self.NULL_TOKENS = self.stats['null_tokens']
+        self.TEXT_REPLACEMENTS = self.stats['canonical_names']
+
+        # Índice global: posición de cada fila dentro del histórico acumulado
+        offset = self.stats['rows']
+        self.data.index = pd.RangeIndex(offset, offset + len(self.data))
+        self.original_data.index = self.data.index
+
+    @classmethod
+    def empty_fill_statistics(cls):
+        """
+        Returns:
+            dict: Estadísticas vacías (ninguna fila procesada todavía)
+        """
+        return {
+            'rows': 0,
+            'null_tokens': list(cls.NULL_TOKENS),
+            'canonical_names': dict(cls.TEXT_REPLACEMENTS),
+            'value_counts': {},
+            'modes': {},
+            'imputed_rows': {},
+            # Columna -> {'rows': filas con una moda obsoleta, 'mode': moda actual}
+            'stale': {},
+        }
+
+    @classmethod
+    def load_fill_statistics(cls, stats_path):
+        """
+        Carga las estadísticas guardadas o devuelve unas vacías si no existen
+        """
+        if not os.path.exists(stats_path):
+            return cls.empty_fill_statistics()
+        with open(stats_path, 'r', encoding='utf-8') as f:
+            stats = json.load(f)
+        stats.setdefault('stale', {})
+        return stats
+
+    @property
+    def stale_imputations(self):
+        """
+        Imputaciones pendientes de `refresh_imputations`: columna -> {'rows', 'mode'}
+        """
+        return self.stats['stale']
+
+    def save_fill_statistics(self):
+        """
+        Guarda las estadísticas de imputación en formato JSON
+        """
+        directory = os.path.dirname(self.stats_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.stats_path, 'w', encoding='utf-8') as f:
+            json.dump(self.stats, f, ensure_ascii=False)
+        print(f"Estadísticas de imputación guardadas en {self.stats_path}")
+
+    def _merge_counts(self, col, mask):
+        """
+        Suma a los conteos guardados los valores válidos del lote
+        """
+        counts = self.stats['value_counts'].setdefault(col, {})
+        for value, count in self.data[col][~mask].value_counts().items():
+            key = str(value)
+            counts[key] = counts.get(key, 0) + int(count)
+
+    def clean_missing_values(self):
+        """
+        Limpia los valores faltantes del lote usando las estadísticas acumuladas
+        """
+        print("Iniciando limpieza incremental de datos para partidos de fútbol...")
+
+        # Pasos que solo dependen de cada fila
+        for col in ['home_score', 'away_score']:
+            if col in self.data.columns and self.data[col].isnull().any():
+                self.data[col] = pd.to_numeric(self.data[col], errors='coerce').fillna(0)
+        if 'neutral' in self.data.columns and self.data['neutral'].isnull().any():
+            self.data['neutral'] = self.data['neutral'].fillna('FALSE')
+
+        # Máscaras de nulos: en MODE_COLUMNS cuentan NaN y tokens; en el resto solo tokens
+        masks = {}
+        for col in self.MODE_COLUMNS:
+            if col in self.data.columns:
+                masks[col] = self.data[col].isnull() | self.data[col].isin(self.NULL_TOKENS)
+        for col in self.STRING_NULL_COLUMNS:
+            if col in self.data.columns and self._is_text_column(self.data[col]):
+                masks[col] = self.data[col].isin(self.NULL_TOKENS)
+
+        # Actualizar conteos con el lote (merge, sin recalcular el histórico)
+        for col, mask in masks.items():
+            self._merge_counts(col, mask)
+
+        for col, mask in masks.items():
+            previous_mode = self.stats['modes'].get(col)
+            mode_value = mode_from_counts(self.stats['value_counts'].get(col, {}))
+            if mode_value is None:
+                # Sin valores válidos: igual que _clean_string_nulls, solo los tokens
+                # reciben el valor por defecto y los NaN se mantienen
+                fill_mask = self.data[col].isin(self.NULL_TOKENS)
+                fill_value = self.DEFAULT_FILL_VALUES.get(col, 'Unknown')
+            else:
+                fill_mask = mask
+                fill_value = mode_value
+
+            if fill_mask.any():
+                self.data.loc[fill_mask, col] = fill_value
+                print(f"  - Reemplazados {fill_mask.sum()} valores nulos en '{col}' con: '{fill_value}'")
+
+            # Filas imputadas en ejecuciones anteriores con una moda que ya no lo es
+            # (incluidas las que recibieron el valor por defecto por no haber moda).
+            # Todas las filas imputadas anteriores pasan a la moda nueva, así que una
+            # entrada pendiente de otra ejecución se sustituye por completo
+            old_rows = self.stats['imputed_rows'].get(col, [])
+            if mode_value is not None and mode_value != previous_mode and old_rows:
+                self.stale_imputations[col] = {'rows': list(old_rows), 'mode': mode_value}
+                print(f"  - La moda de '{col}' cambió de '{previous_mode}' a '{mode_value}': "
+                      f"{len(old_rows)} filas anteriores deben actualizarse")
+
+            if mode_value is not None:
+                self.stats['modes'][col] = mode_value
+            # Se registran todas las filas nulas: con moda o con el valor por defecto
+            new_rows = [int(i) for i in self.data.index[mask]]
+            if new_rows:
+                self.stats['imputed_rows'].setdefault(col, []).extend(new_rows)
+
+        print("Limpieza incremental completada!")
+
+    def _normalize_value(self, col, value):
+        """
+        Aplica a un valor imputado la misma conversión que convert_data_types
+        """
+        if col == 'date':
+            return pd.to_datetime(value, errors='coerce')
+        value = str(value).strip()
+        for wrong, right in self.TEXT_REPLACEMENTS.items():
+            value = value.replace(wrong, right)
+        return value
+
+    def refresh_imputations(self, history):
+        """
+        Actualiza en el histórico limpio las filas imputadas con una moda obsoleta y las
+        quita de las pendientes en las estadísticas guardadas
+
+        Args:
+            history (pd.DataFrame): Histórico limpio acumulado, en el mismo orden de
+                llegada (fila i del histórico = posición global i)
+
+        Returns:
+            pd.DataFrame: Histórico con las imputaciones actualizadas
+        """
+        if not self.stale_imputations:
+            return history
+        history = history.copy()
+        for col in list(self.stale_imputations):
+            stale = self.stale_imputations[col]
+            rows = [row for row in stale['rows'] if row < len(history)]
+            history.iloc[rows, history.columns.get_loc(col)] = self._normalize_value(col, stale['mode'])
+            # Las filas que aún no están en el histórico siguen pendientes
+            remaining = [row for row in stale['rows'] if row >= len(history)]
+            if remaining:
+                stale['rows'] = remaining
+            else:
+                del self.stale_imputations[col]
+        self.save_fill_statistics()
+        return history
+
+    def full_cleaning_process(self):
+        """
+        Limpia solo las filas nuevas y guarda las estadísticas actualizadas
+
+        Returns:
+            pd.DataFrame: Filas nuevas limpias, indexadas por su posición global
+        """
+        print("INICIANDO PROCESO INCREMENTAL DE LIMPIEZA")
+        print("=" * 50)
+        print(f"Filas ya procesadas: {self.stats['rows']}")
+        print(f"Filas nuevas: {len(self.data)}")
+
+        self.clean_missing_values()
+
+        print("\n" + "=" * 50)
+        print("Convirtiendo tipos de datos...")
+        self.convert_data_types()
+
+        self.stats['rows'] += len(self.data)
+        self.save_fill_statistics()
+
+        return self.data
+
+    @classmethod
+    def clean_history(cls, raw_data, history_path=None, stats_path=None, backend=None):
+        """
+        Limpia solo las filas de `raw_data` que aún no están en el histórico limpio
+        guardado, aplica las imputaciones pendientes y guarda el histórico actualizado.
+        El CSV de origen solo debe crecer por el final.
+
+        Args:
+            raw_data (pd.DataFrame): Datos extraídos completos (histórico + filas nuevas)
+            history_path (str): Ruta del histórico limpio. Por defecto Config.CLEAN_HISTORY_PATH
+            stats_path (str): Ruta del JSON de estadísticas. Por defecto Config.FILL_STATS_PATH
+            backend (str): Backend de DataFrame. Por defecto Config.DATAFRAME_BACKEND
+
+        Returns:
+            pd.DataFrame: Histórico limpio completo
+        """
+        history_path = history_path or Config.CLEAN_HISTORY_PATH
+        stats_path = stats_path or Config.FILL_STATS_PATH
+        history = pd.read_pickle(history_path) if os.path.exists(history_path) else None
+        stats = cls.load_fill_statistics(stats_path)
+
+        # Histórico y estadísticas deben describir las mismas filas; si no (primera
+        # ejecución, una ejecución interrumpida entre ambos guardados o un CSV más
+        # corto que el histórico) se limpia todo de nuevo
+        if history is None or stats['rows'] != len(history) or len(history) > len(raw_data):
+            if history is not None or stats['rows']:
+                print("El histórico limpio no coincide con las estadísticas: se limpia todo de nuevo")
+            history = None
+            if os.path.exists(stats_path):
+                os.remove(stats_path)
+
+        offset = 0 if history is None else len(history)
+        cleaner = cls(raw_data.iloc[offset:], stats_path=stats_path, backend=backend)
+        new_rows = cleaner.full_cleaning_process()
+        history = new_rows if history is None else pd.concat([history, new_rows])
+        history = cleaner.refresh_imputations(history)
+
+        directory = os.path.dirname(history_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = history_path + '.tmp'
+        history.to_pickle(tmp_path)
+        os.replace(tmp_path, history_path)
+        print(f"Histórico limpio guardado en {history_path} ({len(history)} filas)")
+        return history
@@ -0,0 +1,144 @@
+from Transform.FutbolBackend import mode_from_counts
+
+
+class DataProfile:
+    """
+    Perfil de datos faltantes y valores por columna, calculado en una sola pasada.
+
+    Por cada columna se guarda un único value_counts (con nulos); de él se derivan
+    los nulos, los tokens nulos ('null', 'N/A', ...), los valores distintos, el
+    mínimo/máximo, los valores más frecuentes y la moda. Los perfiles de distintos
+    bloques (chunks) se combinan sumando conteos, así que el resultado es exacto.
+    """
+    def __init__(self, null_tokens, top_k=10, sample_size=10):
+        """
+        Args:
+            null_tokens (list): Representaciones de texto que se consideran nulas
+            top_k (int): Número de valores más frecuentes a reportar por columna
+            sample_size (int): Número de filas con datos faltantes a conservar como muestra
+        """
+        self.null_tokens = list(null_tokens)
+        self.top_k = top_k
+        self.sample_size = sample_size
+        self.total_rows = 0
+        self.rows_with_missing = 0
+        self.missing_row_index = []
+        self.value_counts = {}
+        self.null_counts = {}
+
+    @classmethod
+    def from_dataframe(cls, dataframe, null_tokens, **kwargs):
+        return cls(null_tokens, **kwargs).update(dataframe)
+
+    @classmethod
+    def from_chunks(cls, chunks, null_tokens, **kwargs):
+        """
+        Perfil de un dataset leído por bloques (p. ej. pd.read_csv(..., chunksize=N))
+        """
+        profile = cls(null_tokens, **kwargs)
+        for chunk in chunks:
+            profile.update(chunk)
+        return profile
+
+    def update(self, chunk):
+        """
+        Añade un bloque de filas al perfil
+
+        Returns:
+            DataProfile: El propio perfil (para encadenar)
+        """
+        self.total_rows += len(chunk)
+
+        row_has_missing = chunk.isnull().any(axis=1)
+        self.rows_with_missing += int(row_has_missing.sum())
+        missing_needed = self.sample_size - len(self.missing_row_index)
+        if missing_needed > 0:
+            self.missing_row_index.extend(chunk.index[row_has_missing][:missing_needed])
+
+        for col in chunk.columns:
+            counts = chunk[col].value_counts(dropna=False)
+            null_mask = counts.index.isna()
+            self._merge_column(col, counts[~null_mask], int(counts[null_mask].sum()))
+        return self
+
+    def _merge_column(self, col, counts, nulls):
+        self.null_counts[col] = self.null_counts.get(col, 0) + nulls
+        if col in self.value_counts:
+            counts = self.value_counts[col].add(counts, fill_value=0).astype('int64')
+        self.value_counts[col] = counts
+
+    def merge(self, other):
+        """
+        Combina otro perfil (de otro bloque o de otro proceso) con este
+
+        Returns:
+            DataProfile: El propio perfil
+        """
+        self.total_rows += other.total_rows
+        self.rows_with_missing += other.rows_with_missing
+        missing_needed = self.sample_size - len(self.missing_row_index)
+        if missing_needed > 0:
+            self.missing_row_index.extend(other.missing_row_index[:missing_needed])
+        for col, counts in other.value_counts.items():
+            self._merge_column(col, counts, other.null_counts[col])
+        return self
+
+    def null_token_count(self, col):
+        counts = self.value_counts[col]
+        return int(counts[counts.index.isin(self.null_tokens)].sum())
+
+    def mode(self, col, exclude_null_tokens=True):
+        """
+        Moda de la columna sin nulos (ni tokens nulos); en empate el menor valor,
+        igual que Series.mode()[0]
+
+        Returns:
+            object: Moda o None si no hay valores válidos
+        """
+        counts = self.value_counts[col]
+        if exclude_null_tokens:
+            counts = counts[~counts.index.isin(self.null_tokens)]
+        return mode_from_counts(counts)
+
+    def _column_report(self, col):
+        counts = self.value_counts[col]
+        try:
+            min_value, max_value = (counts.index.min(), counts.index.max()) if not counts.empty else (None, None)
+        except TypeError:
+            min_value, max_value = None, None
+        top = counts.sort_values(ascending=False, kind='stable').head(self.top_k)
+        return {
+            'nulls': self.null_counts[col],
+            'null_tokens': self.null_token_count(col),
+            'distinct': len(counts),
+            'min': min_value,
+            'max': max_value,
+            'top_values': top.to_dict(),
+        }
+
+    def total_missing(self):
+        """
+        Total de valores nulos en todas las columnas
+        """
+        return sum(self.null_counts.values())
+
+    def to_report(self):
+        """
+        Reporte estructurado del perfil (compatible con futbolClean.check_missing_values)
+
+        Returns:
+            dict: Totales, nulos por columna y detalle por columna
+        """
+        null_values = dict(self.null_counts)
+        return {
+            'total_rows': self.total_rows,
+            'null_values': null_values,
+            'na_values': null_values,
+            'rows_with_missing': self.rows_with_missing,
+            'missing_data_percentage': {
+                col: (count / self.total_rows * 100) if self.total_rows else 0.0
+                for col, count in null_values.items()
+            },
+            'missing_row_index': list(self.missing_row_index),
+            'columns': {col: self._column_report(col) for col in self.value_counts},
+        }
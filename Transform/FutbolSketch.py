@@ -0,0 +1,751 @@
+"""
+Agregados aproximados en memoria fija para entradas muy grandes.
+
+Se alimentan bloque a bloque (p. ej. futbolExtract.iter_chunks) y se combinan
+entre procesos o entre ejecuciones, porque cada sketch es fusionable:
+    CountMinSketch: frecuencias por clave (equipos, torneos, países, torneo y año).
+        estimación ≥ real y, con probabilidad 1 - e^-depth, estimación ≤ real + (e / width) · N
+    HyperLogLog: número de valores distintos (equipos, ciudades).
+        error relativo típico 1.04 / sqrt(2^p)
+    TDigest: cuantiles y distribución de goles por partido.
+        error de rango ≲ π / compression en la mediana, menor en las colas
+    BinCounter: conteos exactos sobre rangos pequeños de enteros (partidos y goles
+        por año, resultados, partidos neutrales)
+
+Uso desde la línea de comandos:
+    python -m Transform.FutbolSketch                       # sketches de Config.INPUT_PATH
+    python -m Transform.FutbolSketch --input nuevo.csv --append --workers 4
+"""
+import argparse
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from Config.Config import Config
+from Transform.FutbolBackend import team_perspective
+from Transform.FutbolClean import futbolClean
+
+
+def _hash_keys(keys):
+    """
+    Hash de 64 bits estable entre procesos y ejecuciones (pd.util.hash_array con la clave por defecto)
+    """
+    return pd.util.hash_array(np.asarray(keys, dtype=object))
+
+
+class CountMinSketch:
+    """
+    Count-min sketch (depth × width contadores) con una lista acotada de candidatos
+    frecuentes para poder enumerar el top-N.
+    """
+    def __init__(self, width=2048, depth=5, top_k=256):
+        self.width = width
+        self.depth = depth
+        self.top_k = top_k
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+        self.candidates = np.array([], dtype=object)
+
+    def _indexes(self, keys):
+        # Doble hashing (Kirsch-Mitzenmacher): fila i -> h1 + i·h2
+        hashes = _hash_keys(keys)
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        rows = np.arange(self.depth, dtype=np.uint64)[:, None]
+        return ((h1[None, :] + rows * h2[None, :]) % np.uint64(self.width)).astype(np.int64)
+
+    def update(self, keys, weights=None):
+        """
+        Suma los pesos (1 por defecto, deben ser ≥ 0) de cada clave
+        """
+        weights = np.ones(len(keys), dtype=np.int64) if weights is None else np.asarray(weights, dtype=np.int64)
+        counts = pd.Series(weights).groupby(np.asarray(keys, dtype=object)).sum()
+        if counts.empty:
+            return
+        flat = self._indexes(counts.index) + (np.arange(self.depth) * self.width)[:, None]
+        self.table += np.bincount(flat.ravel(), np.tile(counts.to_numpy(dtype=float), self.depth),
+                                  minlength=self.depth * self.width).reshape(self.depth, self.width).astype(np.int64)
+        self.total += int(counts.sum())
+        self._keep_top(counts.index.to_numpy(dtype=object))
+
+    def _keep_top(self, new_keys):
+        keys = pd.unique(np.concatenate([self.candidates, new_keys]))
+        estimates = self.estimate(keys)
+        order = np.argsort(-estimates, kind='stable')[:self.top_k]
+        self.candidates = keys[order]
+
+    def estimate(self, keys):
+        """
+        Frecuencia estimada de cada clave (nunca menor que la real)
+        """
+        keys = np.asarray(keys, dtype=object)
+        if len(keys) == 0:
+            return np.array([], dtype=np.int64)
+        return self.table[np.arange(self.depth)[:, None], self._indexes(keys)].min(axis=0)
+
+    def error_bound(self):
+        """
+        Returns:
+            dict: Sobreestimación máxima (ε·N) y su probabilidad de fallo (δ)
+        """
+        epsilon = np.e / self.width
+        return {'max_overestimate': epsilon * self.total, 'epsilon': epsilon, 'delta': float(np.exp(-self.depth))}
+
+    def top(self, n):
+        """
+        Returns:
+            pd.Series: Las n claves candidatas con mayor frecuencia estimada
+        """
+        return pd.Series(self.estimate(self.candidates), index=self.candidates).nlargest(n)
+
+    def merge(self, other):
+        if self.table.shape != other.table.shape:
+            raise ValueError("Solo se pueden combinar count-min sketches con el mismo width y depth")
+        self.table += other.table
+        self.total += other.total
+        self._keep_top(other.candidates)
+        return self
+
+    def state(self):
+        return {'table': self.table, 'candidates': self.candidates.astype(str),
+                'meta': [self.total, self.top_k]}
+
+    @classmethod
+    def from_state(cls, state):
+        total, top_k = (int(v) for v in state['meta'])
+        sketch = cls(state['table'].shape[1], state['table'].shape[0], top_k)
+        sketch.table = state['table'].astype(np.int64)
+        sketch.total = total
+        sketch.candidates = state['candidates'].astype(object)
+        return sketch
+
+
+class HyperLogLog:
+    """
+    HyperLogLog con 2^p registros de 8 bits.
+    """
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values):
+        hashes = _hash_keys(pd.unique(np.asarray(values, dtype=object)))
+        if len(hashes) == 0:
+            return
+        rest_bits = 64 - self.precision
+        index = (hashes >> np.uint64(rest_bits)).astype(np.int64)
+        rest = hashes & np.uint64((1 << rest_bits) - 1)
+        # Posición del primer 1 en los bits restantes; frexp es exacto (rest < 2^53)
+        _, exponent = np.frexp(rest.astype(np.float64))
+        rank = np.where(rest == 0, rest_bits + 1, rest_bits - exponent + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def count(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(float)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)  # corrección para cardinalidades pequeñas
+        return int(round(estimate))
+
+    def relative_error(self):
+        return float(1.04 / np.sqrt(len(self.registers)))
+
+    def merge(self, other):
+        if self.precision != other.precision:
+            raise ValueError("Solo se pueden combinar HyperLogLog con la misma precisión")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def state(self):
+        return {'registers': self.registers}
+
+    @classmethod
+    def from_state(cls, state):
+        sketch = cls(int(np.log2(len(state['registers']))))
+        sketch.registers = state['registers'].astype(np.uint8)
+        return sketch
+
+
+class TDigest:
+    """
+    t-digest con función de escala k1: los centroides se agrupan de forma vectorizada
+    por el valor de k en su cuantil izquierdo, así que hay como mucho compression/2 + 1.
+    """
+    def __init__(self, compression=200):
+        self.compression = compression
+        self.means = np.array([], dtype=float)
+        self.weights = np.array([], dtype=float)
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        unique, counts = np.unique(values, return_counts=True)
+        self._compress(np.concatenate([self.means, unique]), np.concatenate([self.weights, counts]))
+
+    def _compress(self, means, weights):
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+        q_left = (np.cumsum(weights) - weights) / weights.sum()
+        k = np.floor(self.compression / (2 * np.pi) * np.arcsin(2 * q_left - 1)).astype(np.int64)
+        cluster = k - k.min()
+        self.weights = np.bincount(cluster, weights)
+        keep = self.weights > 0
+        self.means = np.bincount(cluster, means * weights)[keep] / self.weights[keep]
+        self.weights = self.weights[keep]
+
+    @property
+    def total(self):
+        return float(self.weights.sum())
+
+    def mean(self):
+        return float(np.dot(self.means, self.weights) / self.total) if self.total else np.nan
+
+    def _curve(self):
+        centers = np.cumsum(self.weights) - self.weights / 2
+        return (np.concatenate([[0.0], centers, [self.total]]),
+                np.concatenate([[self.min], self.means, [self.max]]))
+
+    def quantile(self, q):
+        ranks, values = self._curve()
+        return np.interp(np.asarray(q, dtype=float) * self.total, ranks, values)
+
+    def cdf(self, x):
+        ranks, values = self._curve()
+        return np.interp(x, values, ranks) / self.total
+
+    def integer_histogram(self):
+        """
+        Frecuencia estimada de cada valor entero entre min y max (para datos discretos como goles)
+        """
+        support = np.arange(int(self.min), int(self.max) + 1)
+        edges = self.cdf(np.concatenate([support - 0.5, [support[-1] + 0.5]]))
+        counts = np.round(np.diff(edges) * self.total).astype(np.int64)
+        return pd.Series(counts, index=support)
+
+    def rank_error(self):
+        """
+        Fracción máxima de los datos contenida en un centroide (cota del error de rango)
+        """
+        return float(self.weights.max() / self.total) if self.total else 0.0
+
+    def merge(self, other):
+        if other.total:
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            self._compress(np.concatenate([self.means, other.means]), np.concatenate([self.weights, other.weights]))
+        return self
+
+    def state(self):
+        return {'means': self.means, 'weights': self.weights,
+                'meta': [self.compression, self.min, self.max]}
+
+    @classmethod
+    def from_state(cls, state):
+        compression, minimum, maximum = state['meta']
+        sketch = cls(int(compression))
+        sketch.means, sketch.weights = state['means'], state['weights']
+        sketch.min, sketch.max = float(minimum), float(maximum)
+        return sketch
+
+
+class BinCounter:
+    """
+    Contadores exactos sobre un rango pequeño de enteros [start, start + size)
+    (años, resultados): memoria fija y combinación por suma. Lo que cae fuera del
+    rango se acumula en `dropped`.
+    """
+    def __init__(self, start=0, size=1):
+        self.start = start
+        self.counts = np.zeros(size, dtype=np.int64)
+        self.dropped = 0
+
+    def update(self, keys, weights=None):
+        """
+        Suma los pesos (1 por defecto) de cada clave entera; las claves nulas se ignoran
+        """
+        keys = np.asarray(keys, dtype=float)
+        weights = np.ones(len(keys), dtype=np.int64) if weights is None else np.asarray(weights, dtype=np.int64)
+        valid = ~np.isnan(keys)
+        keys, weights = keys[valid].astype(np.int64) - self.start, weights[valid]
+        inside = (keys >= 0) & (keys < len(self.counts))
+        self.dropped += int(weights[~inside].sum())
+        self.counts += np.bincount(keys[inside], weights[inside],
+                                   minlength=len(self.counts)).astype(np.int64)
+
+    def series(self):
+        """
+        Returns:
+            pd.Series: Clave -> conteo, solo las claves con conteo distinto de cero
+        """
+        keys = np.flatnonzero(self.counts)
+        return pd.Series(self.counts[keys], index=keys + self.start)
+
+    def merge(self, other):
+        if self.start != other.start or len(self.counts) != len(other.counts):
+            raise ValueError("Solo se pueden combinar contadores con el mismo rango")
+        self.counts += other.counts
+        self.dropped += other.dropped
+        return self
+
+    def state(self):
+        return {'counts': self.counts, 'meta': [self.start, self.dropped]}
+
+    @classmethod
+    def from_state(cls, state):
+        start, dropped = (int(v) for v in state['meta'])
+        counter = cls(start, len(state['counts']))
+        counter.counts = state['counts'].astype(np.int64)
+        counter.dropped = dropped
+        return counter
+
+
+def _sketch_chunk(chunk, settings):
+    """
+    Sketches de un bloque (se ejecuta en un proceso aparte)
+    """
+    return FutbolSketches(**settings).update(chunk)
+
+
+class FutbolSketches:
+    """
+    Conjunto de sketches del dataset de partidos, en memoria fija.
+    """
+    FREQUENCY_FIELDS = ['team_games', 'team_goals_scored', 'team_goals_conceded', 'team_wins',
+                        'tournament', 'tournament_goals', 'tournament_year',
+                        'country', 'country_goals', 'country_neutral']
+    DISTINCT_FIELDS = ['teams', 'cities']
+    QUANTILE_FIELDS = ['home_goals', 'away_goals', 'total_goals']
+    # Contadores exactos de rango pequeño: (inicio, tamaño). Años 1800-2199
+    COUNTER_FIELDS = {
+        'year_matches': (1800, 400),
+        'year_scored': (1800, 400),
+        'year_home_goals': (1800, 400),
+        'year_away_goals': (1800, 400),
+        'results': (0, 3),  # signo(local - visitante) + 1
+        'neutral': (0, 2),
+    }
+    KINDS = ['frequencies', 'distinct', 'quantiles', 'counters']
+
+    def __init__(self, width=None, depth=None, top_k=None, precision=None, compression=None):
+        """
+        Args:
+            width, depth (int): Dimensiones de cada count-min sketch. Por defecto Config.SKETCH_WIDTH/SKETCH_DEPTH
+            top_k (int): Candidatos frecuentes conservados por sketch. Por defecto Config.SKETCH_TOP_K
+            precision (int): Bits de índice de HyperLogLog. Por defecto Config.SKETCH_HLL_PRECISION
+            compression (int): Compresión de los t-digest. Por defecto Config.SKETCH_COMPRESSION
+        """
+        self.settings = {
+            'width': width or Config.SKETCH_WIDTH,
+            'depth': depth or Config.SKETCH_DEPTH,
+            'top_k': top_k or Config.SKETCH_TOP_K,
+            'precision': precision or Config.SKETCH_HLL_PRECISION,
+            'compression': compression or Config.SKETCH_COMPRESSION,
+        }
+        s = self.settings
+        self.frequencies = {field: CountMinSketch(s['width'], s['depth'], s['top_k'])
+                            for field in self.FREQUENCY_FIELDS}
+        self.distinct = {field: HyperLogLog(s['precision']) for field in self.DISTINCT_FIELDS}
+        self.quantiles = {field: TDigest(s['compression']) for field in self.QUANTILE_FIELDS}
+        self.counters = {field: BinCounter(start, size) for field, (start, size) in self.COUNTER_FIELDS.items()}
+        self.rows = 0
+
+    @staticmethod
+    def _prepare(chunk):
+        """
+        Normalización ligera de un bloque sin limpiar: textos recortados con nombres
+        canónicos, tokens nulos como NaN, marcadores numéricos, año del partido y
+        neutral como 0/1 (nulo = no neutral, como en la limpieza)
+        """
+        chunk = chunk.copy()
+        for col in futbolClean.TEXT_COLUMNS:
+            text = chunk[col].astype('string').str.strip()
+            for wrong, right in futbolClean.TEXT_REPLACEMENTS.items():
+                text = text.str.replace(wrong, right, regex=False)
+            chunk[col] = text.mask(text.isin(futbolClean.NULL_TOKENS)).astype(object)
+        for col in ['home_score', 'away_score']:
+            chunk[col] = pd.to_numeric(chunk[col], errors='coerce')
+        chunk['year'] = pd.to_datetime(chunk['date'], errors='coerce').dt.year
+        chunk['neutral'] = chunk['neutral'].astype('string').str.strip().str.upper().eq('TRUE').fillna(False).astype(np.int64)
+        return chunk
+
+    def update(self, chunk):
+        """
+        Añade un bloque de partidos (limpio o tal como sale de extract)
+
+        Returns:
+            FutbolSketches: El propio conjunto (para encadenar)
+        """
+        chunk = self._prepare(chunk)
+        self.rows += len(chunk)
+
+        # Vista larga: una fila por equipo y partido con marcador válido
+        scored = chunk.dropna(subset=['home_score', 'away_score'])
+        perspective = team_perspective(scored)
+        perspective = perspective[perspective['team'].notna()]
+        teams = perspective['team']
+
+        self.frequencies['team_games'].update(teams)
+        self.frequencies['team_goals_scored'].update(teams, perspective['goals_for'])
+        self.frequencies['team_goals_conceded'].update(teams, perspective['goals_against'])
+        self.frequencies['team_wins'].update(teams, perspective['wins'])
+        for field in ['tournament', 'country']:
+            self.frequencies[field].update(chunk[field].dropna())
+            with_goals = scored.dropna(subset=[field])
+            self.frequencies[f'{field}_goals'].update(
+                with_goals[field], with_goals['home_score'] + with_goals['away_score'])
+        with_country = chunk.dropna(subset=['country'])
+        self.frequencies['country_neutral'].update(with_country['country'], with_country['neutral'])
+        dated = chunk.dropna(subset=['tournament', 'year'])
+        self.frequencies['tournament_year'].update(self._tournament_year_keys(dated['tournament'], dated['year']))
+
+        self.distinct['teams'].update(pd.concat([chunk['home_team'], chunk['away_team']]).dropna())
+        self.distinct['cities'].update(chunk['city'].dropna())
+
+        self.quantiles['home_goals'].update(scored['home_score'])
+        self.quantiles['away_goals'].update(scored['away_score'])
+        self.quantiles['total_goals'].update(scored['home_score'] + scored['away_score'])
+
+        self.counters['year_matches'].update(chunk['year'])
+        self.counters['year_scored'].update(scored['year'])
+        self.counters['year_home_goals'].update(scored['year'], scored['home_score'])
+        self.counters['year_away_goals'].update(scored['year'], scored['away_score'])
+        self.counters['results'].update(np.sign(scored['home_score'] - scored['away_score']) + 1)
+        self.counters['neutral'].update(chunk['neutral'])
+        return self
+
+    @staticmethod
+    def _tournament_year_keys(tournaments, years):
+        return (pd.Series(tournaments, dtype=object).astype(str).to_numpy(dtype=object) + '|'
+                + pd.Series(years).astype(int).astype(str).to_numpy(dtype=object))
+
+    def merge(self, other):
+        """
+        Combina otro conjunto de sketches (de otro proceso o de una ejecución anterior)
+        """
+        for kind in self.KINDS:
+            for field, sketch in getattr(self, kind).items():
+                sketch.merge(getattr(other, kind)[field])
+        self.rows += other.rows
+        return self
+
+    @classmethod
+    def from_chunks(cls, chunks, workers=None, **settings):
+        """
+        Sketches de una secuencia de bloques; con workers > 1 cada bloque se procesa en
+        un proceso aparte y los resultados se combinan
+
+        Como mucho hay 2 · workers bloques en vuelo: el siguiente bloque se lee solo
+        cuando se combina el más antiguo, así la memoria no depende del tamaño de la entrada
+        """
+        sketches = cls(**settings)
+        workers = workers or Config.SKETCH_WORKERS or 1
+        if workers <= 1:
+            for chunk in chunks:
+                sketches.update(chunk)
+            return sketches
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk in chunks:
+                if len(pending) >= 2 * workers:
+                    sketches.merge(pending.popleft().result())
+                pending.append(executor.submit(_sketch_chunk, chunk, sketches.settings))
+            while pending:
+                sketches.merge(pending.popleft().result())
+        return sketches
+
+    @classmethod
+    def refresh(cls, input_path=None, path=None, chunksize=None, workers=None):
+        """
+        Actualiza los sketches guardados con las filas nuevas de la entrada
+
+        Carga el estado de `path` (si existe) y procesa solo las filas del CSV posteriores
+        a las ya contadas (la entrada crece por el final). Si el CSV tiene menos filas que
+        las contadas, se reconstruye desde cero. El estado combinado se guarda en `path`.
+
+        Returns:
+            FutbolSketches: Sketches de toda la entrada
+        """
+        from Extract.FutbolExtract import futbolExtract
+
+        input_path = input_path or Config.INPUT_PATH
+        path = path or Config.SKETCH_PATH
+        chunksize = chunksize or Config.SKETCH_CHUNKSIZE
+        sketches = cls()
+        if os.path.exists(path):
+            try:
+                sketches = cls.load(path)
+            except ValueError as e:
+                print(f"{e}; se reconstruyen los sketches")
+        with open(input_path, 'rb') as f:
+            input_rows = max(sum(1 for _ in f) - 1, 0)
+        if input_rows < sketches.rows:
+            print(f"La entrada tiene {input_rows:,} filas y los sketches {sketches.rows:,}; se reconstruyen")
+            sketches = cls(**sketches.settings)
+        new_rows = input_rows - sketches.rows
+        if new_rows:
+            chunks = futbolExtract(input_path).iter_chunks(chunksize, skip_rows=sketches.rows)
+            sketches.merge(cls.from_chunks(chunks, workers, **sketches.settings))
+            sketches.save(path)
+        print(f"Sketches actualizados: {new_rows:,} filas nuevas, {sketches.rows:,} en total")
+        return sketches
+
+    def memory_bytes(self):
+        sketches = [sketch for kind in self.KINDS for sketch in getattr(self, kind).values()]
+        return sum(array.nbytes for sketch in sketches for array in sketch.state().values()
+                   if isinstance(array, np.ndarray))
+
+    # --------------------------------------------------------- persistencia
+
+    def save(self, path=None):
+        path = path or Config.SKETCH_PATH
+        arrays = {'settings': np.array(json.dumps(self.settings)), 'rows': np.array(self.rows)}
+        for kind in self.KINDS:
+            for field, sketch in getattr(self, kind).items():
+                for key, value in sketch.state().items():
+                    arrays[f'{kind}/{field}/{key}'] = np.asarray(value)
+        np.savez(path, **arrays)
+        print(f"Sketches guardados en {path} ({self.rows:,} filas, {self.memory_bytes() / 1024:.0f} KB)")
+
+    @classmethod
+    def load(cls, path=None):
+        path = path or Config.SKETCH_PATH
+        classes = {'frequencies': CountMinSketch, 'distinct': HyperLogLog, 'quantiles': TDigest,
+                   'counters': BinCounter}
+        with np.load(path) as arrays:
+            sketches = cls(**json.loads(str(arrays['settings'])))
+            sketches.rows = int(arrays['rows'])
+            for kind, sketch_class in classes.items():
+                for field in getattr(sketches, kind):
+                    prefix = f'{kind}/{field}/'
+                    state = {key[len(prefix):]: arrays[key] for key in arrays.files if key.startswith(prefix)}
+                    if not state:
+                        raise ValueError(f"{path} no contiene '{prefix[:-1]}' (formato anterior); hay que reconstruirlo")
+                    getattr(sketches, kind)[field] = sketch_class.from_state(state)
+        return sketches
+
+    # ------------------------------------------------------- datos de gráficas
+
+    def goals_distribution_data(self):
+        """
+        Mismo formato que FutbolGraphics.get_goals_distribution_data, con cotas de error
+        """
+        digests = self.quantiles
+        return {
+            'home_goals': digests['home_goals'].integer_histogram(),
+            'away_goals': digests['away_goals'].integer_histogram(),
+            'total_goals': digests['total_goals'].integer_histogram(),
+            'averages': {
+                'home': digests['home_goals'].mean(),
+                'away': digests['away_goals'].mean(),
+            },
+            'quantiles': {field: dict(zip([0.5, 0.9, 0.99], digest.quantile([0.5, 0.9, 0.99])))
+                          for field, digest in digests.items()},
+            'error_bounds': {f'{field}_rank_error': digest.rank_error() for field, digest in digests.items()},
+        }
+
+    def top_teams_data(self, n=15):
+        """
+        Mismo formato que FutbolGraphics.get_top_teams_data a partir de los count-min sketches
+        """
+        frequencies = self.frequencies
+        candidates = pd.unique(np.concatenate([frequencies[field].candidates for field in
+                                               ['team_games', 'team_goals_scored', 'team_wins']]))
+        candidates = candidates[candidates != 'Unknown Team']
+        teams_df = pd.DataFrame({
+            'games': frequencies['team_games'].estimate(candidates),
+            'goals_scored': frequencies['team_goals_scored'].estimate(candidates),
+            'goals_conceded': frequencies['team_goals_conceded'].estimate(candidates),
+            'wins': frequencies['team_wins'].estimate(candidates),
+        }, index=candidates)
+        teams_df['win_rate'] = (teams_df['wins'] / teams_df['games']).clip(upper=1.0)
+        teams_df['goal_difference'] = teams_df['goals_scored'] - teams_df['goals_conceded']
+        teams_df = teams_df[teams_df['games'] >= 10]
+
+        teams_min_games = teams_df[teams_df['games'] >= 20]
+        return {
+            'teams': teams_df,
+            'top_games': teams_df.nlargest(n, 'games')['games'],
+            'top_goal_difference': teams_df.nlargest(n, 'goal_difference')['goal_difference'],
+            'top_win_rate': teams_min_games.nlargest(n, 'win_rate')['win_rate'],
+            'top_goals_scored': teams_df.nlargest(n, 'goals_scored')['goals_scored'],
+            'distinct_teams': self.distinct['teams'].count(),
+            'error_bounds': {
+                **{f'{field}_max_overestimate': frequencies[field].error_bound()['max_overestimate']
+                   for field in ['team_games', 'team_goals_scored', 'team_goals_conceded', 'team_wins']},
+                'count_min_delta': frequencies['team_games'].error_bound()['delta'],
+                'distinct_teams_relative_error': self.distinct['teams'].relative_error(),
+            },
+        }
+
+    def _estimates(self, field):
+        """
+        Frecuencia estimada de los candidatos de un count-min, de mayor a menor
+        """
+        sketch = self.frequencies[field]
+        return pd.Series(sketch.estimate(sketch.candidates), index=sketch.candidates).sort_values(
+            ascending=False, kind='stable')
+
+    def _count_min_bounds(self, *fields):
+        return {f'{field}_max_overestimate': self.frequencies[field].error_bound()['max_overestimate']
+                for field in fields}
+
+    def _decades(self, field):
+        counts = self.counters[field].series()
+        return counts.groupby((counts.index // 10) * 10).sum()
+
+    def temporal_data(self, recent_years=50):
+        """
+        Mismo formato que FutbolGraphics.get_temporal_analysis_data (conteos exactos por año)
+        """
+        matches = self._decades('year_matches')
+        scored = self._decades('year_scored')
+        goals_by_decade = pd.DataFrame({
+            'matches': matches,
+            'home_score': self._decades('year_home_goals').reindex(scored.index, fill_value=0) / scored,
+            'away_score': self._decades('year_away_goals').reindex(scored.index, fill_value=0) / scored,
+        })
+        goals_by_decade['total_avg'] = goals_by_decade['home_score'] + goals_by_decade['away_score']
+        goals_by_decade.index.name = 'decade'
+        by_year = self.counters['year_matches'].series()
+        return {
+            'matches_by_decade': matches,
+            'goals_by_decade': goals_by_decade,
+            'recent_matches_by_year': by_year[by_year.index >= datetime.now().year - recent_years],
+        }
+
+    def tournaments_data(self):
+        """
+        Mismo formato que FutbolGraphics.get_tournaments_data a partir de los count-min sketches
+        """
+        tournament_stats = self._estimates('tournament')
+        goals = self.frequencies['tournament_goals'].estimate(tournament_stats.index)
+        avg_goals = pd.Series(goals / tournament_stats.to_numpy(), index=tournament_stats.index)
+
+        pie_share = tournament_stats.head(10).copy()
+        pie_share['Otros'] = max(self.frequencies['tournament'].total - int(pie_share.sum()), 0)
+
+        years = self.counters['year_matches'].series().index
+        yearly_by_tournament = {}
+        for tournament in tournament_stats.head(5).index:
+            counts = pd.Series(self.frequencies['tournament_year'].estimate(
+                self._tournament_year_keys([tournament] * len(years), years)), index=years)
+            yearly_by_tournament[tournament] = counts[counts > 0]
+
+        return {
+            'top_matches': tournament_stats.head(15),
+            'match_share': pie_share,
+            'top_avg_goals': avg_goals.sort_values(ascending=False).head(15),
+            'yearly_matches': yearly_by_tournament,
+            'error_bounds': {
+                **self._count_min_bounds('tournament', 'tournament_goals', 'tournament_year'),
+                'count_min_delta': self.frequencies['tournament'].error_bound()['delta'],
+            },
+        }
+
+    def countries_data(self):
+        """
+        Mismo formato que FutbolGraphics.get_countries_data a partir de los count-min sketches
+        """
+        country_stats = self._estimates('country')
+        matches = country_stats.to_numpy()
+        avg_goals = pd.Series(self.frequencies['country_goals'].estimate(country_stats.index) / matches,
+                              index=country_stats.index)
+        neutral_percentage = pd.Series(
+            np.minimum(self.frequencies['country_neutral'].estimate(country_stats.index) / matches, 1.0) * 100,
+            index=country_stats.index)
+
+        pie_share = country_stats.head(12).copy()
+        pie_share['Otros'] = max(self.frequencies['country'].total - int(pie_share.sum()), 0)
+
+        return {
+            'top_matches': country_stats.head(20),
+            'match_share': pie_share,
+            'top_avg_goals': avg_goals[country_stats >= 50].sort_values(ascending=False).head(15),
+            'top_neutral_percentage': neutral_percentage[country_stats >= 20].sort_values(ascending=False).head(15),
+            'error_bounds': {
+                **self._count_min_bounds('country', 'country_goals', 'country_neutral'),
+                'count_min_delta': self.frequencies['country'].error_bound()['delta'],
+            },
+        }
+
+    def dashboard_data(self):
+        """
+        Mismo formato que FutbolGraphics.get_summary_dashboard_data a partir de los sketches
+        """
+        digests = self.quantiles
+        total_goals = int(round(np.dot(digests['total_goals'].means, digests['total_goals'].weights)))
+        total_goals_hist = digests['total_goals'].integer_histogram()
+        total_goals_hist = total_goals_hist[(total_goals_hist.index < 16) & (total_goals_hist > 0)]
+        years = self.counters['year_matches'].series().index
+        away_wins, draws, home_wins = (int(count) for count in self.counters['results'].counts)
+        neutral = self.counters['neutral'].counts
+
+        return {
+            'general': {
+                'total_matches': self.rows,
+                'total_goals': total_goals,
+                'avg_goals_per_match': total_goals / self.rows if self.rows else np.nan,
+                'first_year': str(years.min()) if len(years) else '',
+                'last_year': str(years.max()) if len(years) else '',
+            },
+            'total_goals_hist': total_goals_hist,
+            'averages': {'home': digests['home_goals'].mean(), 'away': digests['away_goals'].mean()},
+            'top_teams': self._estimates('team_games').head(10),
+            'top_tournaments': self._estimates('tournament').head(10),
+            'top_countries': self._estimates('country').head(10),
+            'matches_by_decade': self._decades('year_matches'),
+            'results': {'home_wins': home_wins, 'draws': draws, 'away_wins': away_wins},
+            'neutral': pd.Series({False: int(neutral[0]), True: int(neutral[1])}).sort_values(ascending=False),
+            'error_bounds': {
+                **self._count_min_bounds('team_games', 'tournament', 'country'),
+                'count_min_delta': self.frequencies['tournament'].error_bound()['delta'],
+                'total_goals_rank_error': digests['total_goals'].rank_error(),
+            },
+        }
+
+    def summary(self):
+        """
+        Resumen de los agregados aproximados con sus cotas de error
+        """
+        return {
+            'rows': self.rows,
+            'distinct': {field: {'estimate': hll.count(), 'relative_error': hll.relative_error()}
+                         for field, hll in self.distinct.items()},
+            'top_tournaments': self.frequencies['tournament'].top(10).to_dict(),
+            'top_countries': self.frequencies['country'].top(10).to_dict(),
+            'count_min_error': self.frequencies['tournament'].error_bound(),
+            'total_goals_quantiles': dict(zip([0.5, 0.9, 0.99],
+                                              self.quantiles['total_goals'].quantile([0.5, 0.9, 0.99]))),
+            'memory_kb': self.memory_bytes() / 1024,
+        }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Agregados aproximados (sketches) por bloques')
+    parser.add_argument('--input', default=Config.INPUT_PATH)
+    parser.add_argument('--chunksize', type=int, default=Config.SKETCH_CHUNKSIZE)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--append', action='store_true',
+                        help='Combinar con los sketches guardados en Config.SKETCH_PATH')
+    args = parser.parse_args()
+
+    from Extract.FutbolExtract import futbolExtract
+    start = time.perf_counter()
+    sketches = FutbolSketches.from_chunks(futbolExtract(args.input).iter_chunks(args.chunksize), args.workers)
+    if args.append and os.path.exists(Config.SKETCH_PATH):
+        sketches = FutbolSketches.load().merge(sketches)
+    print(f"Procesado en {time.perf_counter() - start:.2f} s")
+    sketches.save()
+    print(json.dumps(sketches.summary(), ensure_ascii=False, indent=2, default=float))
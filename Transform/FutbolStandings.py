@@ -0,0 +1,154 @@
+"""
+Tablas de posiciones por torneo y año.
+
+Todas las temporadas se calculan en una sola agregación agrupada sobre la vista
+larga (una fila por equipo y partido), sin bucles por torneo. Los puntos por
+victoria son configurables para reproducir las épocas de 2 puntos.
+
+Uso desde la línea de comandos (lee y escribe Config.SQLITE_DB_PATH):
+    python -m Transform.FutbolStandings --build
+    python -m Transform.FutbolStandings "FIFA World Cup" 1970
+"""
+import argparse
+import sqlite3
+import time
+import numpy as np
+import pandas as pd
+from Config.Config import Config
+from Transform.FutbolBackend import team_perspective
+
+
+class FutbolStandings:
+    """
+    Motor de tablas de posiciones (P, W, D, L, GF, GA, GD, Pts) sobre los datos limpios.
+    """
+    COLUMNS = ['tournament', 'year', 'position', 'team', 'played', 'wins', 'draws', 'losses',
+               'goals_for', 'goals_against', 'goal_difference', 'points']
+
+    def __init__(self, dataframe, points_per_win=None, points_per_draw=None):
+        """
+        Args:
+            dataframe (pd.DataFrame): Datos limpios (tournament, date, equipos y marcadores)
+            points_per_win (int | dict): Puntos por victoria, o {año_inicio: puntos} por épocas
+                (p. ej. {1872: 2, 1995: 3}). Por defecto Config.STANDINGS_POINTS_PER_WIN
+            points_per_draw (int): Puntos por empate. Por defecto Config.STANDINGS_POINTS_PER_DRAW
+        """
+        self.data = dataframe
+        self.points_per_win = Config.STANDINGS_POINTS_PER_WIN if points_per_win is None else points_per_win
+        self.points_per_draw = Config.STANDINGS_POINTS_PER_DRAW if points_per_draw is None else points_per_draw
+
+    def _win_points(self, year):
+        """
+        Puntos por victoria de cada fila según su año
+        """
+        if not isinstance(self.points_per_win, dict):
+            return np.full(len(year), self.points_per_win)
+        eras = sorted(self.points_per_win.items())
+        starts = np.array([start for start, _ in eras])
+        points = np.array([value for _, value in eras])
+        era = np.searchsorted(starts, year, side='right') - 1
+        return points[np.clip(era, 0, len(points) - 1)]
+
+    def compute(self, tournament=None, year=None):
+        """
+        Calcula las tablas de posiciones de todas las temporadas (o de una sola)
+
+        Args:
+            tournament (str): Limitar a un torneo
+            year (int): Limitar a un año
+
+        Returns:
+            pd.DataFrame: Una fila por (torneo, año, equipo), ordenada por posición
+        """
+        data = self.data
+        years = pd.to_datetime(data['date'], errors='coerce').dt.year
+        mask = years.notna()
+        if tournament is not None:
+            mask &= data['tournament'] == tournament
+        if year is not None:
+            mask &= years == year
+        data, years = data[mask], years[mask].astype(int)
+
+        data = data.astype({'home_score': int, 'away_score': int})
+
+        # Vista larga: una fila por equipo y partido
+        perspective = team_perspective(data, {
+            'tournament': data['tournament'],
+            'year': years,
+            'win_points': self._win_points(years.to_numpy()),
+        })
+        perspective['points'] = perspective['wins'] * perspective['win_points'] + perspective['draws'] * self.points_per_draw
+        perspective['played'] = 1
+
+        table = perspective.groupby(['tournament', 'year', 'team'], as_index=False, sort=False)[
+            ['played', 'wins', 'draws', 'losses', 'goals_for', 'goals_against', 'points']].sum()
+        table['goal_difference'] = table['goals_for'] - table['goals_against']
+
+        # Desempate: puntos, diferencia de goles, goles a favor y nombre del equipo
+        table = table.sort_values(
+            ['tournament', 'year', 'points', 'goal_difference', 'goals_for', 'team'],
+            ascending=[True, True, False, False, False, True], kind='stable', ignore_index=True)
+        table['position'] = table.groupby(['tournament', 'year'], sort=False).cumcount() + 1
+        return table[self.COLUMNS]
+
+    def to_sqlite(self, db_path=None, table_name=None):
+        """
+        Reemplaza la tabla de posiciones en SQLite (todas las temporadas) e indexa
+        (tournament, year, position) para consultar una temporada sin recorrer la tabla
+        """
+        db_path = db_path or Config.SQLITE_DB_PATH
+        table_name = table_name or Config.STANDINGS_TABLE
+        try:
+            standings = self.compute()
+            conn = sqlite3.connect(db_path)
+            with conn:
+                standings.to_sql(table_name, conn, if_exists='replace', index=False)
+                conn.execute(f'CREATE INDEX IF NOT EXISTS "idx_{table_name}_season" '
+                             f'ON "{table_name}" (tournament, year, position)')
+            conn.close()
+            print(f"Tabla de posiciones guardada en la base de datos SQLite: {db_path}, tabla: {table_name} "
+                  f"({standings.groupby(['tournament', 'year']).ngroups} temporadas)")
+        except Exception as e:
+            print(f"Error al guardar la tabla de posiciones en SQLite: {e}")
+            raise
+
+    @staticmethod
+    def read_season(tournament, year, db_path=None, table_name=None):
+        """
+        Tabla de posiciones de una temporada leída desde SQLite (usa el índice de temporada)
+
+        Returns:
+            pd.DataFrame: Filas de la temporada ordenadas por posición
+        """
+        db_path = db_path or Config.SQLITE_DB_PATH
+        table_name = table_name or Config.STANDINGS_TABLE
+        conn = sqlite3.connect(db_path)
+        try:
+            return pd.read_sql_query(
+                f'SELECT * FROM "{table_name}" WHERE tournament = ? AND year = ? ORDER BY position',
+                conn, params=(tournament, int(year)))
+        finally:
+            conn.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Tablas de posiciones por torneo y año')
+    parser.add_argument('tournament', nargs='?')
+    parser.add_argument('year', nargs='?', type=int)
+    parser.add_argument('--build', action='store_true',
+                        help='Recalcular la tabla de posiciones desde la tabla base de SQLite')
+    args = parser.parse_args()
+
+    if args.build:
+        conn = sqlite3.connect(Config.SQLITE_DB_PATH)
+        base = pd.read_sql_query(f'SELECT * FROM "{Config.SQLITE_TABLE}"', conn)
+        conn.close()
+        start = time.perf_counter()
+        FutbolStandings(base).to_sqlite()
+        print(f"Calculada en {time.perf_counter() - start:.2f} s")
+    if args.tournament and args.year:
+        start = time.perf_counter()
+        season = FutbolStandings.read_season(args.tournament, args.year)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(season.drop(columns=['tournament', 'year']).to_string(index=False))
+        print(f"\nConsulta en {elapsed_ms:.1f} ms")
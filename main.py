@@ -1,57 +1,120 @@
+import argparse
+import sys
 from Extract.FutbolExtract import futbolExtract
 from Extract.FutolGraphics import FutbolGraphics
 from Transform.FutbolClean import futbolClean
+from Transform.FutbolIncremental import futbolIncrementalClean
+from Transform.FutbolStandings import FutbolStandings
+from Transform.FutbolSketch import FutbolSketches
 from Load.FutbolLoad import Loader
+from Load.FutbolCheckpoint import PipelineCheckpoint
 from Config.Config import Config
 
-# Extracción de datos
-print("EXTRAYENDO DATOS...")
-print("=" * 50)
-response1 = futbolExtract(Config.INPUT_PATH)
-response1.queries()
-
-print("Primeras 5 filas de los datos extraídos:")
-print(response1.response())
-
-# Limpieza de datos
-print("\n" + "=" * 50)
-print("PROCESO DE LIMPIEZA DE DATOS")
-print("=" * 50)
-
-# Crear instancia de limpieza con los datos extraídos
-cleaner = futbolClean(response1.data)
-
-# Ejecutar proceso completo de limpieza
-cleaned_data = cleaner.full_cleaning_process()
-
-print("\n" + "=" * 50)
-print("DATOS LIMPIOS - PRIMERAS 15 FILAS:")
-print("=" * 50)
-print(cleaned_data.head(15))
-
-print("\n" + "=" * 50)
-print("INFORMACIÓN FINAL DEL DATASET LIMPIO:")
-print("=" * 50)
-print(f"Shape: {cleaned_data.shape}")
-print(f"Tipos de datos:")
-print(cleaned_data.dtypes)
-print(f"\nValores nulos finales:")
-print(cleaned_data.isnull().sum())
-
-# Generación de gráficas
-print("\n" + "=" * 50)
-print("GENERANDO GRÁFICAS DE ANÁLISIS")
-print("=" * 50)
-
-# Crear instancia de gráficas con los datos limpios
-graphics = FutbolGraphics(cleaned_data)
-
-# Generar todas las gráficas
-graphics.generate_all_graphics()
-
-# Carga de datos
-print("\n" + "=" * 50)
-print("CARGANDO DATOS A BASE DE DATOS")
-print("=" * 50)
-loader = Loader(cleaned_data)
-loader.to_sqlite()
\ No newline at end of file
+parser = argparse.ArgumentParser(description='Pipeline ETL de datos de fútbol')
+parser.add_argument('--resume', action='store_true',
+                    help='Reanudar desde el último checkpoint válido en lugar de empezar desde el CSV')
+args = parser.parse_args()
+
+checkpoints = PipelineCheckpoint()
+if not args.resume:
+    checkpoints.reset()
+# La carga por bloques solo retoma su offset en SQLite si la etapa 'load' sigue en el
+# manifiesto (si el CSV cambió, el manifiesto se descartó y la carga empieza de cero)
+resume_load = args.resume and bool(checkpoints.stage_info('load'))
+
+
+def extract():
+    # Extracción de datos
+    print("EXTRAYENDO DATOS...")
+    print("=" * 50)
+    response1 = futbolExtract(Config.INPUT_PATH)
+    response1.queries()
+
+    print("Primeras 5 filas de los datos extraídos:")
+    print(response1.response())
+    return response1.data
+
+
+def clean(raw_data):
+    # Limpieza de datos
+    print("\n" + "=" * 50)
+    print("PROCESO DE LIMPIEZA DE DATOS")
+    print("=" * 50)
+
+    if Config.CLEANING_MODE == 'incremental':
+        # Solo se limpian las filas nuevas; el histórico y las estadísticas se guardan
+        cleaned_data = futbolIncrementalClean.clean_history(raw_data)
+    else:
+        # Crear instancia de limpieza con los datos extraídos
+        cleaner = futbolClean(raw_data)
+
+        # Ejecutar proceso completo de limpieza
+        cleaned_data = cleaner.full_cleaning_process()
+
+    print("\n" + "=" * 50)
+    print("DATOS LIMPIOS - PRIMERAS 15 FILAS:")
+    print("=" * 50)
+    print(cleaned_data.head(15))
+
+    print("\n" + "=" * 50)
+    print("INFORMACIÓN FINAL DEL DATASET LIMPIO:")
+    print("=" * 50)
+    print(f"Shape: {cleaned_data.shape}")
+    print(f"Tipos de datos:")
+    print(cleaned_data.dtypes)
+    print(f"\nValores nulos finales:")
+    print(cleaned_data.isnull().sum())
+    return cleaned_data
+
+
+def graphics():
+    # Generación de gráficas
+    print("\n" + "=" * 50)
+    print("GENERANDO GRÁFICAS DE ANÁLISIS")
+    print("=" * 50)
+
+    if Config.AGGREGATION_MODE == 'sketch':
+        # Memoria fija: se parte de los sketches guardados, solo se leen por bloques las
+        # filas nuevas del CSV y las gráficas no usan el DataFrame limpio
+        graphics = FutbolGraphics(sketches=FutbolSketches.refresh())
+    else:
+        # Crear instancia de gráficas con los datos limpios
+        graphics = FutbolGraphics(checkpoints.output('clean'))
+
+    # Generar todas las gráficas
+    graphics.generate_all_graphics()
+
+
+def load(cleaned_data):
+    # Carga de datos
+    print("\n" + "=" * 50)
+    print("CARGANDO DATOS A BASE DE DATOS")
+    print("=" * 50)
+    loader = Loader(cleaned_data)
+    if Config.SQLITE_LOAD_MODE == 'summary':
+        loader.to_sqlite_with_summaries()
+    elif Config.SQLITE_LOAD_MODE == 'backfill':
+        loader.backfill_sqlite()
+    elif Config.SQLITE_LOAD_MODE == 'chunked':
+        # El progreso confirmado vive en SQLite; el manifiesto lo refleja tras cada bloque
+        loader.to_sqlite_chunked(
+            resume=resume_load,
+            on_chunk=lambda rows: checkpoints.record_progress('load', committed_rows=rows,
+                                                              total_rows=len(cleaned_data)))
+    else:
+        loader.to_sqlite()
+
+    # Tablas de posiciones por torneo y año
+    FutbolStandings(cleaned_data).to_sqlite()
+
+
+try:
+    # Al reanudar, la salida de una etapa completada solo se lee si una etapa pendiente la necesita
+    checkpoints.run_stage('extract', extract, resume=args.resume)
+    checkpoints.run_stage('clean', lambda: clean(checkpoints.output('extract')), resume=args.resume)
+    checkpoints.run_stage('graphics', graphics, resume=args.resume)
+    checkpoints.run_stage('load', lambda: load(checkpoints.output('clean')), resume=args.resume)
+except Exception as e:
+    print(f"\n❌ El pipeline falló: {type(e).__name__}: {e}")
+    print(f"   Estado guardado en {checkpoints.manifest_path}; ejecuta `python main.py --resume` para continuar")
+    sys.exit(1)
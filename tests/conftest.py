@@ -0,0 +1,29 @@
+import os
+import sys
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Config.Config import Config  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def raw_matches():
+    """
+    Dataset original (Config.INPUT_PATH); las pruebas que lo usan se omiten si no está
+    """
+    path = os.path.join(ROOT, Config.INPUT_PATH)
+    if not os.path.exists(path):
+        pytest.skip(f"No se encuentra el dataset {Config.INPUT_PATH}")
+    return pd.read_csv(path)
+
+
+@pytest.fixture(scope='session')
+def cleaned_matches(raw_matches):
+    """
+    Dataset original limpiado con futbolClean (backend pandas)
+    """
+    from Transform.FutbolClean import futbolClean
+    return futbolClean(raw_matches, backend='pandas').full_cleaning_process()
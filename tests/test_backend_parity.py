@@ -0,0 +1,41 @@
+import pandas as pd
+import pytest
+from Transform.FutbolBackend import get_backend, make_synthetic_matches, _operations
+from Transform.FutbolClean import futbolClean
+
+pytest.importorskip('polars')
+
+OPERATIONS = [name for name, _ in _operations(make_synthetic_matches(10))]
+
+
+def assert_same_result(result, expected):
+    """
+    Compara el resultado tal como lo devuelve cada backend (incluido el orden de filas)
+    """
+    if isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(result, expected)
+    elif isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(result, expected)
+    else:
+        assert result == expected
+
+
+def run_operation(data, operation, backend):
+    return dict(_operations(data))[operation](get_backend(backend))
+
+
+@pytest.mark.parametrize('operation', OPERATIONS)
+def test_polars_matches_pandas_on_synthetic_data(operation):
+    data = make_synthetic_matches(50_000, seed=1)
+    assert_same_result(run_operation(data, operation, 'polars'), run_operation(data, operation, 'pandas'))
+
+
+@pytest.mark.parametrize('operation', OPERATIONS)
+def test_polars_matches_pandas_on_cleaned_dataset(cleaned_matches, operation):
+    data = cleaned_matches
+    assert_same_result(run_operation(data, operation, 'polars'), run_operation(data, operation, 'pandas'))
+
+
+def test_full_cleaning_process_is_identical_with_polars(raw_matches, cleaned_matches):
+    result = futbolClean(raw_matches, backend='polars').full_cleaning_process()
+    pd.testing.assert_frame_equal(result, cleaned_matches)
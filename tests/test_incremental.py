@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+from Transform.FutbolClean import futbolClean
+from Transform.FutbolIncremental import futbolIncrementalClean
+
+
+def clean_in_batches(data, batches, stats_path):
+    """
+    Limpia los datos por lotes acumulando el histórico y aplicando las imputaciones obsoletas
+    """
+    history = None
+    for batch in np.array_split(np.arange(len(data)), batches):
+        cleaner = futbolIncrementalClean(data.iloc[batch], stats_path=str(stats_path))
+        new_rows = cleaner.full_cleaning_process()
+        history = new_rows if history is None else pd.concat([history, new_rows])
+        history = cleaner.refresh_imputations(history)
+    return history.reset_index(drop=True)
+
+
+def full_clean(data):
+    return futbolClean(data).full_cleaning_process().reset_index(drop=True)
+
+
+@pytest.mark.parametrize('batches', [2, 7])
+def test_incremental_matches_full_cleaning_on_real_csv(raw_matches, batches, tmp_path):
+    result = clean_in_batches(raw_matches, batches, tmp_path / 'fill_stats.json')
+    pd.testing.assert_frame_equal(result, full_clean(raw_matches))
+
+
+def mode_change_data():
+    return pd.DataFrame({
+        'date': ['2020-01-0%d' % i for i in range(1, 7)],
+        'home_team': ['A', 'B', 'C', 'D', 'E', 'F'],
+        'away_team': ['F', 'E', 'D', 'C', 'B', 'A'],
+        'home_score': [1, 0, 2, 1, 0, 3],
+        'away_score': [0, 0, 1, 1, 2, 0],
+        'tournament': ['', '', 'T', 'T', 'U', 'U'],
+        'city': ['X'] * 6,
+        'country': ['Y'] * 6,
+        'neutral': ['FALSE'] * 6,
+    })
+
+
+def test_default_filled_rows_are_refreshed_when_a_mode_appears(tmp_path):
+    data = mode_change_data()
+    result = clean_in_batches(data, 3, tmp_path / 'fill_stats.json')
+    expected = full_clean(data)
+
+    assert list(expected['tournament'][:2]) == ['T', 'T']
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_column_of_null_tokens_gets_the_same_default_in_both_paths(tmp_path):
+    data = pd.DataFrame({
+        'date': ['2020-01-0%d' % i for i in range(1, 5)],
+        'home_team': ['A', 'B', 'C', 'D'],
+        'away_team': ['D', 'C', 'B', 'A'],
+        'home_score': [1, 0, 2, 1],
+        'away_score': [0, 0, 1, 1],
+        'tournament': ['T'] * 4,
+        'city': ['', 'null', 'N/A', 'NaN'],
+        'country': ['Y'] * 4,
+        'neutral': ['FALSE'] * 4,
+    })
+    result = clean_in_batches(data, 2, tmp_path / 'fill_stats.json')
+    expected = full_clean(data)
+
+    assert list(expected['city']) == ['Unknown'] * 4
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_pending_refresh_survives_in_the_saved_statistics(tmp_path):
+    data = mode_change_data()
+    stats_path = str(tmp_path / 'fill_stats.json')
+    history = futbolIncrementalClean(data.iloc[:2], stats_path=stats_path).full_cleaning_process()
+    new_rows = futbolIncrementalClean(data.iloc[2:], stats_path=stats_path).full_cleaning_process()
+    history = pd.concat([history, new_rows])
+
+    # Otra ejecución (sin filas nuevas) aplica las imputaciones pendientes del JSON
+    refresher = futbolIncrementalClean(data.iloc[:0], stats_path=stats_path)
+    assert refresher.stale_imputations['tournament']['rows'] == [0, 1]
+    result = refresher.refresh_imputations(history).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(result, full_clean(data))
+    assert futbolIncrementalClean.load_fill_statistics(stats_path)['stale'] == {}
+
+
+def test_clean_history_only_cleans_new_rows(raw_matches, tmp_path):
+    paths = {'history_path': str(tmp_path / 'history.pkl'),
+             'stats_path': str(tmp_path / 'fill_stats.json')}
+    futbolIncrementalClean.clean_history(raw_matches.iloc[:20000], **paths)
+    result = futbolIncrementalClean.clean_history(raw_matches, **paths)
+
+    assert futbolIncrementalClean.load_fill_statistics(paths['stats_path'])['rows'] == len(raw_matches)
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), full_clean(raw_matches))
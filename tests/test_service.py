@@ -0,0 +1,59 @@
+import math
+import pytest
+from Extract.FutolGraphics import FutbolGraphics
+from Load.FutbolLoad import Loader
+from Service.FutbolService import FutbolStatsService
+
+TEAMS = ['Brazil', 'England', 'Scotland', 'Andorra']
+TOURNAMENTS = ['FIFA World Cup', 'Friendly', 'Copa América']
+
+
+def assert_same_payload(result, expected, path='respuesta'):
+    """
+    Compara dos respuestas JSON; los flotantes se comparan con tolerancia porque el
+    servicio divide sumas y FutbolGraphics calcula medias
+    """
+    if isinstance(expected, dict):
+        assert isinstance(result, dict), path
+        assert set(result) == set(expected), path
+        for key in expected:
+            assert_same_payload(result[key], expected[key], f'{path}.{key}')
+    elif isinstance(expected, float):
+        assert math.isclose(result, expected, rel_tol=1e-12), path
+    else:
+        assert result == expected, path
+
+
+@pytest.fixture(scope='module')
+def service(cleaned_matches, tmp_path_factory):
+    db_path = str(tmp_path_factory.mktemp('service') / 'futbol.db')
+    Loader(cleaned_matches).to_sqlite(db_path, 'futbol_data_clean')
+    service = FutbolStatsService(db_path, 'futbol_data_clean', pool_size=1)
+    yield service
+    service.pool.close_all()
+
+
+@pytest.fixture(scope='module')
+def matches(cleaned_matches):
+    return cleaned_matches.assign(year=cleaned_matches['date'].dt.year)
+
+
+def test_goals_by_year_matches_graphics(service, matches):
+    expected = FutbolGraphics.compute_goals_by_period(matches, 'year')
+    assert_same_payload(service.goals_by_year(), FutbolGraphics.to_serializable(expected))
+
+
+@pytest.mark.parametrize('team', TEAMS)
+def test_team_summary_matches_graphics(service, matches, team):
+    expected = FutbolGraphics.compute_team_stats(matches, [team]).loc[team].to_dict()
+    played = matches[(matches['home_team'] == team) | (matches['away_team'] == team)]
+    expected.update(team=team, first_match=played['date'].min(), last_match=played['date'].max())
+    assert_same_payload(service.team_summary(team), FutbolGraphics.to_serializable(expected))
+
+
+@pytest.mark.parametrize('tournament', TOURNAMENTS)
+def test_tournament_stats_matches_graphics(service, matches, tournament):
+    summary = FutbolGraphics.compute_goals_by_group(matches, 'tournament').loc[tournament]
+    by_year = FutbolGraphics.compute_goals_by_period(matches[matches['tournament'] == tournament], 'year')
+    expected = {'tournament': tournament, 'summary': summary, 'by_year': by_year}
+    assert_same_payload(service.tournament_stats(tournament), FutbolGraphics.to_serializable(expected))